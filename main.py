@@ -1,49 +1,72 @@
+import os
+import time
 import pygame
 import sys
-import random
 import math
 import json
+import numpy as np
 from src.config import *
 from src.assets import *
-from src.entities import Wizard, Enemy, Projectile, EnemyProjectile, DragonBoss
-
-# Initialize Pygame
-pygame.init()
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Wizard vs Ogres: Ultimate Edition")
-clock = pygame.time.Clock()
-
-# Fonts
-font = pygame.font.SysFont("Arial", 36, bold=True)
-small_font = pygame.font.SysFont("Arial", 24)
-card_font = pygame.font.SysFont("Arial", 20, bold=True)
-shop_font = pygame.font.SysFont("Arial", 28, bold=True)
+from src.entities import Wizard, DragonBoss, EntityGroup, enemy_pool, enemy_projectile_pool, snapshot_positions, render_offset
+from src.particles import particles, CAT_DEATH
+from src.enemy_table import enemy_table, MELEE_RANGE
+from src.pool import recycle_pools, pool_stats
+from src.spatial import SpatialHash, grid_groupcollide, swept_entry
+from src.controls import read_controls, bot_controls
+from src.rng import gameplay_rng, scenery_rng, new_run_seed, seed_streams
+from src.replay import ReplayRecorder, ReplayPlayer
 
 # Game State
 # MENU, PLAYING, SHOP, CARD_SELECT, GAME_OVER, VICTORY
 game_state = "MENU"
 # GAME_MODE: "STORY" or "INFINITE"
 GAME_MODE = "STORY" 
-current_biome = "FOREST"
-current_wave = 1
-enemies_killed_in_wave = 0
-total_enemies_spawned_in_wave = 0
-score = 0
-
-# Entity Groups
-all_sprites = pygame.sprite.Group()
-projectiles = pygame.sprite.Group()
-enemies = pygame.sprite.Group()
-enemy_projectiles = pygame.sprite.Group()
+
+# Run State: everything one PLAYING run changes tick to tick (reset_run
+# restores WORLD_START). The systems below read and write it.
+WORLD_START = {
+    "current_biome": "FOREST",
+    "current_wave": 1,
+    "enemies_killed_in_wave": 0,
+    "total_enemies_spawned_in_wave": 0,
+    "score": 0,
+    "spawn_timer": 0,
+    "lightning_timer": 0, # For auto lightning
+    "tornado_cooldown": 0,
+    "dragon_cooldown": 0,
+    "boss_intro_timer": 0,
+    "boss_active": None, # Boss shown in the HUD bar (set by the AI system)
+}
+
+class World:
+    """The run state as slotted attributes; systems get it as their first argument."""
+    __slots__ = tuple(WORLD_START)
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        for name, value in WORLD_START.items():
+            setattr(self, name, value)
+
+world = World()
+
+# Entity Groups (enemies and projectiles are rect-only entities, see src.entities)
+projectiles = EntityGroup()
+enemies = EntityGroup()
+enemy_projectiles = EntityGroup()
 
 # Player
 wizard = Wizard(100, SCREEN_HEIGHT - 50)
-all_sprites.add(wizard)
 
 # Particles & Effects
-particles = []
 active_effects = [] # For Tornado, Dragon visuals
 
+# Collision broadphase grids (rebuilt every tick after movement)
+enemy_grid = SpatialHash()
+projectile_grid = SpatialHash()
+screen_flashes = [] # Tints queued by hits, drawn over the scene for their life in sim ticks
+
 # Global Store for resetting logic
 # We persist coins across runs? No, usually roguelike resets. 
 # But user said "Menu inicial... tienda... monedas".
@@ -71,9 +94,11 @@ shop_return_target = "MENU" # Tracks where to go after closing shop
 gray = (100, 100, 100) # Defined gray here used in draw_shop
 
 SAVE_FILE = "save_game.json"
+SAVE_ENABLED = True # Headless runs play without touching the player's save
 
 def save_data():
     global TOTAL_COINS, UNLOCKED_ABILITIES, SHOP_UPGRADES_STATE
+    if not SAVE_ENABLED: return
     data = {
         "coins": TOTAL_COINS,
         "xp": CURRENT_XP,
@@ -117,6 +142,23 @@ def load_data():
 # Load immediately on import/run
 load_data()
 
+def profile_snapshot():
+    """Everything outside a run that changes how it plays (recorded in replays)."""
+    return {
+        "coins": TOTAL_COINS, "xp": CURRENT_XP, "level": CURRENT_LEVEL, "xp_next": XP_TO_NEXT_LEVEL,
+        "abilities": dict(UNLOCKED_ABILITIES), "upgrades": dict(SHOP_UPGRADES_STATE),
+        "missions": [dict(m) for m in MISSIONS],
+    }
+
+def apply_profile(profile):
+    """Restores a profile_snapshot() (in memory only; nothing is saved)."""
+    global TOTAL_COINS, CURRENT_XP, CURRENT_LEVEL, XP_TO_NEXT_LEVEL, SHOP_UPGRADES_STATE
+    TOTAL_COINS, CURRENT_XP = profile["coins"], profile["xp"]
+    CURRENT_LEVEL, XP_TO_NEXT_LEVEL = profile["level"], profile["xp_next"]
+    UNLOCKED_ABILITIES.update(profile["abilities"])
+    SHOP_UPGRADES_STATE = dict(profile["upgrades"])
+    MISSIONS[:] = [dict(m) for m in profile["missions"]]
+
 def gain_xp(amount):
     global CURRENT_XP, CURRENT_LEVEL, XP_TO_NEXT_LEVEL, UNLOCKED_ABILITIES, wizard
     CURRENT_XP += amount
@@ -152,26 +194,14 @@ def cast_lightning():
     # Find up to 3 targets
     targets = []
     
-    # 1. Closest to Wizard
-    sorted_enemies = sorted(enemies, key=lambda e: math.hypot(e.rect.centerx - wizard.rect.centerx, e.rect.centery - wizard.rect.centery))
-    if sorted_enemies:
-        t1 = sorted_enemies[0]
-        if math.hypot(t1.rect.centerx - wizard.rect.centerx, t1.rect.centery - wizard.rect.centery) < 700:
-            targets.append(t1)
-            
-            # 2. Closest to T1 (excluding T1)
-            others = [e for e in enemies if e != t1]
-            if others:
-                t2 = min(others, key=lambda e: math.hypot(e.rect.centerx - t1.rect.centerx, e.rect.centery - t1.rect.centery))
-                if math.hypot(t2.rect.centerx - t1.rect.centerx, t2.rect.centery - t1.rect.centery) < 400:
-                    targets.append(t2)
-                    
-                    # 3. Closest to T2
-                    others2 = [e for e in others if e != t2]
-                    if others2:
-                        t3 = min(others2, key=lambda e: math.hypot(e.rect.centerx - t2.rect.centerx, t2.rect.centery - t2.rect.centery))
-                        if math.hypot(t3.rect.centerx - t2.rect.centerx, t3.rect.centery - t2.rect.centery) < 400:
-                            targets.append(t3)
+    # 1. Closest to Wizard, then each hop to the enemy closest to the last one
+    hop_from, max_dist = wizard.rect.center, 700
+    while len(targets) < 3:
+        nearest = enemy_grid.nearest(hop_from, max_dist=max_dist, exclude=targets)
+        if not nearest:
+            break
+        targets.append(nearest[0])
+        hop_from, max_dist = nearest[0].rect.center, 400
 
     # Apply Damage & Visuals
     prev_pos = wizard.rect.center
@@ -183,7 +213,8 @@ def cast_lightning():
             "type": "LIGHTNING", 
             "start": prev_pos, 
             "end": t.rect.center, 
-            "life": 15
+            "life": 15,
+            "arc": None # Baked on first draw (headless runs never build it)
         })
         prev_pos = t.rect.center
         
@@ -200,7 +231,7 @@ def cast_tornado():
         "type": "TORNADO_MOVING", 
         "x": wizard.rect.centerx - 50, 
         "y": wizard.rect.centery, 
-        "life": 100, 
+        "life": TORNADO_LIFE, 
         "dir": -1
     })
     # Right Tornado
@@ -208,7 +239,7 @@ def cast_tornado():
         "type": "TORNADO_MOVING", 
         "x": wizard.rect.centerx + 50, 
         "y": wizard.rect.centery, 
-        "life": 100, 
+        "life": TORNADO_LIFE, 
         "dir": 1
     })
 
@@ -227,6 +258,7 @@ MISSIONS = [
     {"id": "KILL_ARCHERS", "desc": "Slay 3 Archers", "target": 3, "current": 0, "type": "KILL_ENEMY", "etype": "SKELETON_ARCHER", "reward_xp": 150},
     {"id": "SURVIVE_WAVE", "desc": "Reach Wave 5", "target": 5, "current": 0, "type": "REACH_WAVE", "reward_xp": 300}
 ]
+_MISSIONS_START = [dict(m) for m in MISSIONS] # Fresh-profile copy (headless runs)
 
 def check_mission_progress(event_type, **kwargs):
     global MISSIONS
@@ -246,7 +278,7 @@ def check_mission_progress(event_type, **kwargs):
 
 
 def kill_enemy(enemy):
-    global score, enemies_killed_in_wave, TOTAL_COINS, game_state
+    global TOTAL_COINS, game_state
     if not enemy.alive(): return # Already dead
     
     # Victory Check (Dragon Boss)
@@ -258,8 +290,8 @@ def kill_enemy(enemy):
         save_data()
     
     enemy.kill()
-    enemies_killed_in_wave += 1
-    score += 10 * current_wave
+    world.enemies_killed_in_wave += 1
+    world.score += 10 * world.current_wave
     
     # Coins
     is_boss = enemy.rect.width > 100
@@ -282,12 +314,10 @@ def kill_enemy(enemy):
                  save_data()
     
     # Particles
-    for _ in range(15):
-        particles.append({
-            'x': enemy.rect.centerx + random.randint(-15, 15),
-            'y': enemy.rect.centery + random.randint(-15, 15),
-            'life': 30, 'max_life': 30, 'size': random.randint(3, 8), 'color': (0, 255, 0)
-        })
+    particles.emit(
+        enemy.rect.centerx + particles.rng.integers(-15, 16, 15),
+        enemy.rect.centery + particles.rng.integers(-15, 16, 15),
+        life=30, size=particles.rng.integers(3, 9, 15), color=(0, 255, 0), category=CAT_DEATH)
 
 # --- UI STATES ---
 
@@ -300,9 +330,7 @@ def draw_menu(surface):
     ground_y = SCREEN_HEIGHT - 80
     
     # Subtle Overlay (just to unify colors, not hide them)
-    s_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    s_overlay.fill((10, 20, 30, 80)) # Blue-ish tint, low alpha
-    surface.blit(s_overlay, (0,0))
+    draw_overlay(surface, (10, 20, 30), 80) # Blue-ish tint, low alpha
 
     cx = SCREEN_WIDTH // 2
     cy = SCREEN_HEIGHT // 2
@@ -315,13 +343,13 @@ def draw_menu(surface):
     
     # Magical Particles around Wizard
     t = pygame.time.get_ticks()
-    random.seed(t // 50) 
+    scenery_rng.seed(t // 50) 
     for _ in range(8):
-        sx = wiz_x + random.randint(-100, 100)
-        sy = wiz_y - 200 - random.randint(0, 300)
-        alpha = random.randint(150, 255)
-        radius = random.randint(2, 4)
-        if random.random() < 0.2: radius += 2 # Occasional big spark
+        sx = wiz_x + scenery_rng.randint(-100, 100)
+        sy = wiz_y - 200 - scenery_rng.randint(0, 300)
+        alpha = scenery_rng.randint(150, 255)
+        radius = scenery_rng.randint(2, 4)
+        if scenery_rng.random() < 0.2: radius += 2 # Occasional big spark
         
         s_part = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
         pygame.draw.circle(s_part, (255, 230, 150, alpha), (radius, radius), radius)
@@ -332,21 +360,17 @@ def draw_menu(surface):
     
     # Epic Title
     title_text = "WIZARD vs OGRES"
-    # Use a nice bold font
-    title_font = pygame.font.SysFont("Verdana", 60, bold=True)
-    
     # Shadow
-    shad = title_font.render(title_text, True, (0, 0, 0))
+    shad = render_text("menu_title", title_text, (0, 0, 0))
     shad_rect = shad.get_rect(center=(ui_center_x + 4, 104))
     surface.blit(shad, shad_rect)
     
     # Main Title
-    tit = title_font.render(title_text, True, (255, 200, 50)) 
+    tit = render_text("menu_title", title_text, (255, 200, 50)) 
     tit_rect = tit.get_rect(center=(ui_center_x, 100))
     surface.blit(tit, tit_rect)
     
-    sub_font = pygame.font.SysFont("Arial", 24, italic=True)
-    sub = sub_font.render("- ENCHANTED FOREST EDITION -", True, (150, 220, 255))
+    sub = render_text("menu_subtitle", "- ENCHANTED FOREST EDITION -", (150, 220, 255))
     surface.blit(sub, sub.get_rect(center=(ui_center_x, 150)))
 
     # 4. Menu Options (Right Side)
@@ -381,34 +405,34 @@ def draw_menu(surface):
         
         # Text
         txt_col = (220, 220, 220) if not is_hover else (255, 255, 255)
-        mtxt = shop_font.render(opt["text"], True, txt_col)
+        mtxt = render_text("shop", opt["text"], txt_col)
         surface.blit(mtxt, mtxt.get_rect(center=rect.center))
         
-        hint = small_font.render(f"[{opt['key']}]", True, (120, 120, 120))
+        hint = render_text("small", f"[{opt['key']}]", (120, 120, 120))
         surface.blit(hint, (rect.right + 10, rect.centery - 10))
 
     # 5. Bottom Stats Bar
     bar_y = SCREEN_HEIGHT - 40
     pygame.draw.rect(surface, (0,0,0,150), (0, bar_y, SCREEN_WIDTH, 40))
     
-    c_txt = small_font.render(f"GOLD: {TOTAL_COINS}", True, GOLD)
+    c_txt = render_text("small", f"GOLD: {TOTAL_COINS}", GOLD)
     surface.blit(c_txt, (20, bar_y + 8))
     
-    ver = small_font.render("v2.3 (Story Update)", True, GRAY)
+    ver = render_text("small", "v2.3 (Story Update)", GRAY)
     surface.blit(ver, (SCREEN_WIDTH - 180, bar_y + 8))
 
 def draw_shop(surface):
     global TOTAL_COINS
     surface.fill((20, 20, 30))
     
-    title = font.render(f"MAGIC SHOP", True, MAGENTA)
-    coins_txt = font.render(f"Your Coins: {TOTAL_COINS}", True, GOLD)
+    title = render_text("large", f"MAGIC SHOP", MAGENTA)
+    coins_txt = render_text("large", f"Your Coins: {TOTAL_COINS}", GOLD)
     
     exit_label = "Press [ESC] to Return"
     if shop_return_target == "PLAYING":
         exit_label = "Press [ENTER] to Start Next Wave"
     
-    exit_txt = small_font.render(exit_label, True, WHITE)
+    exit_txt = render_text("small", exit_label, WHITE)
     
     # Header Overlay (to cover scrolled items)
     pygame.draw.rect(surface, (20, 20, 30), (0, 0, SCREEN_WIDTH, 130))
@@ -452,9 +476,9 @@ def draw_shop(surface):
         pygame.draw.rect(surface, color, rect, border_radius=10)
         pygame.draw.rect(surface, WHITE, rect, 2, border_radius=10)
         
-        name_s = shop_font.render(f"{item['name']}", True, CYAN if is_owned else WHITE)
-        cost_s = shop_font.render("OWNED" if is_owned else f"{item['cost']} G", True, GOLD)
-        desc_s = small_font.render(item['desc'], True, GRAY)
+        name_s = render_text("shop", f"{item['name']}", CYAN if is_owned else WHITE)
+        cost_s = render_text("shop", "OWNED" if is_owned else f"{item['cost']} G", GOLD)
+        desc_s = render_text("small", item['desc'], GRAY)
         
         surface.blit(name_s, (70, y + 20))
         surface.blit(cost_s, (700, y + 35))
@@ -462,7 +486,7 @@ def draw_shop(surface):
         
     # --- Permanent Upgrades Section ---
     section_y_base = start_y + len(items) * 120 + 20
-    sect_title = shop_font.render("PERMANENT UPGRADES", True, ORANGE)
+    sect_title = render_text("shop", "PERMANENT UPGRADES", ORANGE)
     surface.blit(sect_title, (50, section_y_base + shop_scroll_y))
     
     start_y_upg = section_y_base + 50
@@ -486,9 +510,9 @@ def draw_shop(surface):
         pygame.draw.rect(surface, color, rect, border_radius=10)
         pygame.draw.rect(surface, (100, 100, 255), rect, 2, border_radius=10)
         
-        name_s = shop_font.render(f"{item['name']} (Lvl {lvl})", True, WHITE)
-        cost_s = shop_font.render(f"{cost} G", True, GOLD)
-        desc_s = small_font.render(item['desc'], True, GRAY)
+        name_s = render_text("shop", f"{item['name']} (Lvl {lvl})", WHITE)
+        cost_s = render_text("shop", f"{cost} G", GOLD)
+        desc_s = render_text("small", item['desc'], GRAY)
         
         surface.blit(name_s, (70, y + 20))
         surface.blit(cost_s, (700, y + 35))
@@ -513,28 +537,40 @@ def draw_shop(surface):
 
 # --- GAME LOGIC HELPERS ---
 
-def reset_run(mode=None):
-    global score, current_wave, enemies_killed_in_wave, total_enemies_spawned_in_wave
-    global current_biome, game_state, particles, GAME_MODE
-    global enemies, projectiles, enemy_projectiles, active_effects, spawn_timer
+def sync_unlocked_weapons():
+    """Rebuilds the wizard's weapon list from UNLOCKED_ABILITIES."""
+    wizard.unlocked_weapons = ["DEFAULT"]
+    if UNLOCKED_ABILITIES["ARCANE_VOLLEY"]: wizard.unlocked_weapons.append("ARCANE_VOLLEY")
+    if UNLOCKED_ABILITIES["VOID_LANCE"]: wizard.unlocked_weapons.append("VOID_LANCE")
+    if UNLOCKED_ABILITIES["FIRE_RING"]: wizard.unlocked_weapons.append("FIRE_RING")
+
+def reset_run(mode=None, seed=None):
+    global game_state, GAME_MODE, run_seed
     
     if mode: GAME_MODE = mode
     
-    score = 0
-    current_wave = 1
-    enemies_killed_in_wave = 0
-    total_enemies_spawned_in_wave = 0
-    current_biome = "FOREST"
+    # One seed per run drives gameplay and VFX randomness (replays, benchmarks)
+    run_seed = new_run_seed() if seed is None else seed
+    seed_streams(run_seed)
+    particles.seed(run_seed)
+    
+    # Input recording (--record): one replay file per run, started with its profile
+    global recorder, recorded_runs
+    finish_recording()
+    if record_path:
+        recorded_runs += 1
+        recorder = ReplayRecorder(GAME_MODE, run_seed, profile_snapshot())
+    
+    world.reset()
     
     enemies.empty()
+    enemy_table.clear()
     projectiles.empty()
     enemy_projectiles.empty()
-    all_sprites.empty()
+    recycle_pools()
     particles.clear()
     active_effects.clear()
-    spawn_timer = 0
-    global boss_intro_timer
-    boss_intro_timer = 0
+    screen_flashes.clear()
     
     wizard.__init__(100, SCREEN_HEIGHT - 50) # Reset hp/stats
     # Reset upgrade levels
@@ -550,10 +586,7 @@ def reset_run(mode=None):
     wizard.abilities = UNLOCKED_ABILITIES.copy()
     
     # Populate unlocked weapons
-    wizard.unlocked_weapons = ["DEFAULT"]
-    if UNLOCKED_ABILITIES["ARCANE_VOLLEY"]: wizard.unlocked_weapons.append("ARCANE_VOLLEY")
-    if UNLOCKED_ABILITIES["VOID_LANCE"]: wizard.unlocked_weapons.append("VOID_LANCE")
-    if UNLOCKED_ABILITIES["FIRE_RING"]: wizard.unlocked_weapons.append("FIRE_RING")
+    sync_unlocked_weapons()
     
     # Apply Permanent Stats from Shop
     # {"id": "PERMA_DMG", "val": 0.1, "stat": "damage_multiplier"}
@@ -568,44 +601,41 @@ def reset_run(mode=None):
             elif upg["stat"] == "attack_speed_boost":
                 wizard.attack_speed_boost += (upg["val"] * lvl)
     
-    all_sprites.add(wizard)
     game_state = "PLAYING"
 
 def spawn_enemy_logic():
-    global enemies, particles, projectiles, enemy_projectiles, active_effects, score, current_wave, spawn_timer, wizard, enemies_killed_in_wave
-    
     # --- STORY MODE LOGIC ---
     if GAME_MODE == "STORY":
         # Wave 10: FINAL BOSS
-        if current_wave == 10:
+        if world.current_wave == 10:
              boss_exists = False
              for e in enemies:
                  if e.enemy_type == "DRAGON_BOSS": 
                      boss_exists = True
                      break
              
-             if not boss_exists and enemies_killed_in_wave == 0:
+             if not boss_exists and world.enemies_killed_in_wave == 0:
                  # Trigger Cinematic Entrance instead of direct spawn
-                 global game_state, boss_intro_timer
+                 global game_state
                  game_state = "BOSS_INTRO"
-                 boss_intro_timer = 0
+                 world.boss_intro_timer = 0
                  return
              return # Only Boss in Wave 10
              
         # Regular Waves (1-9)
         # Cap enemies
-        cap = 4 + current_wave
+        cap = 4 + world.current_wave
         if len(enemies) < cap:
-            side = random.choice([-50, SCREEN_WIDTH + 50])
-            roll = random.random()
+            side = gameplay_rng.choice([-50, SCREEN_WIDTH + 50])
+            roll = gameplay_rng.random()
             etype = "OGRE"
             
             # Biome-specific spawns
-            if current_biome == "ICE": # Waves 4-6
+            if world.current_biome == "ICE": # Waves 4-6
                 if roll < 0.3: etype = "TROLL"
                 elif roll < 0.6: etype = "GOBLIN"
                 else: etype = "OGRE"
-            elif current_biome == "VOLCANO": # Waves 7-9
+            elif world.current_biome == "VOLCANO": # Waves 7-9
                 if roll < 0.2: etype = "TROLL"
                 elif roll < 0.5: etype = "SKELETON_ARCHER"
                 elif roll < 0.8: etype = "GOBLIN"
@@ -614,59 +644,56 @@ def spawn_enemy_logic():
                 if roll < 0.3: etype = "GOBLIN"
                 else: etype = "OGRE"
             
-            e = Enemy(side, SCREEN_HEIGHT - 50, etype)
+            e = enemy_pool.acquire(side, SCREEN_HEIGHT - 50, etype)
             
             # Story Mode Harder Scaling
             if GAME_MODE == "STORY":
                  e.health *= 1.5 # 50% more HP
                  e.damage *= 1.2 # 20% more damage
-                 if current_wave >= 7: # Volcano Hard
+                 if world.current_wave >= 7: # Volcano Hard
                      e.speed += 0.5 
             
             enemies.add(e)
-            all_sprites.add(e)
 
     # --- INFINITE MODE LOGIC ---
     else:
         # Endless waves, scaling difficulty
         # Boss every 10 waves (Ogre King or Dragon?)
         # Let's keep Ogre King for infinite mode bosses for now, or Dragon at 50?
-        if current_wave % 10 == 0:
+        if world.current_wave % 10 == 0:
             boss_exists = False
             for e in enemies:
                 if e.enemy_type == "OGRE_KING": 
                     boss_exists = True
                     break
             
-            if not boss_exists and enemies_killed_in_wave == 0:
-                side = random.choice([-100, SCREEN_WIDTH + 100])
-                e = Enemy(side, SCREEN_HEIGHT - 50, "OGRE_KING")
+            if not boss_exists and world.enemies_killed_in_wave == 0:
+                side = gameplay_rng.choice([-100, SCREEN_WIDTH + 100])
+                e = enemy_pool.acquire(side, SCREEN_HEIGHT - 50, "OGRE_KING")
                 enemies.add(e)
-                all_sprites.add(e)
                 return
         
         # Regular Spawn
-        cap = 5 + int(current_wave * 1.5) # Scale faster
+        cap = 5 + int(world.current_wave * 1.5) # Scale faster
         if len(enemies) < cap:
-            side = random.choice([-50, SCREEN_WIDTH + 50])
-            roll = random.random()
+            side = gameplay_rng.choice([-50, SCREEN_WIDTH + 50])
+            roll = gameplay_rng.random()
             etype = "OGRE"
             
             # Progressive difficulty
-            troll_chance = min(0.4, current_wave * 0.02)
-            archer_chance = min(0.4, current_wave * 0.02)
+            troll_chance = min(0.4, world.current_wave * 0.02)
+            archer_chance = min(0.4, world.current_wave * 0.02)
             goblin_chance = 0.3
             
-            if current_wave > 5 and roll < troll_chance: 
+            if world.current_wave > 5 and roll < troll_chance: 
                  etype = "TROLL"
-            elif current_wave > 2 and roll < (troll_chance + archer_chance):
+            elif world.current_wave > 2 and roll < (troll_chance + archer_chance):
                  etype = "SKELETON_ARCHER"
             elif roll < (troll_chance + archer_chance + goblin_chance): # Remaining pool
                  etype = "GOBLIN"
             
-            e = Enemy(side, SCREEN_HEIGHT - 50, etype)
+            e = enemy_pool.acquire(side, SCREEN_HEIGHT - 50, etype)
             enemies.add(e)
-            all_sprites.add(e)
 
 # Cards Logic (Same as before)
 cards = []
@@ -708,11 +735,10 @@ def generate_upgrades():
         while len(valid_options) < 3:
             valid_options.append({"type": "COINS", "name": "Bonus Coins", "desc": "+200 Coins", "color": GOLD})
             
-    selection = random.sample(valid_options, 3)
+    selection = gameplay_rng.sample(valid_options, 3)
     return selection
 
 def apply_card(card):
-    global score
     t = card["type"]
     
     if t == "HEALTH":
@@ -735,15 +761,37 @@ def apply_card(card):
             elif t == "PIERCING":
                 wizard.piercing += 1
                 
+def pick_card(index):
+    """Applies cards[index] and starts the next wave."""
+    global game_state, cards
+    if recorder: recorder.card(index)
+    apply_card(cards[index])
+    cards = []
+    enemy_projectiles.empty() # Enemy shots do not carry over into the next wave
+    
+    # Next wave
+    world.current_wave += 1
+    world.enemies_killed_in_wave = 0
+    world.total_enemies_spawned_in_wave = 0
+    
+    # BIOME TRANSITION LOGIC
+    if GAME_MODE == "STORY":
+        if world.current_wave <= 3: world.current_biome = "FOREST"
+        elif world.current_wave <= 6: world.current_biome = "ICE"
+        elif world.current_wave <= 10: world.current_biome = "VOLCANO"
+    else:
+        if world.current_wave > 2: world.current_biome = "ICE"
+        if world.current_wave > 4: world.current_biome = "VOLCANO"
+    
+    game_state = "PLAYING"
+
 def draw_cards_ui(surface, events):
-    global current_wave, enemies_killed_in_wave, total_enemies_spawned_in_wave, current_biome, game_state, cards, GAME_MODE
+    global game_state, cards, GAME_MODE
     
     # Overlay
-    s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    s.fill((0, 0, 0, 200))
-    surface.blit(s, (0,0))
+    draw_overlay(surface, (0, 0, 0), 200)
     
-    title = font.render(f"WAVE {current_wave} CLEARED!", True, WHITE)
+    title = render_text("large", f"WAVE {world.current_wave} CLEARED!", WHITE)
     surface.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, 80)))
     
     global cards
@@ -764,634 +812,906 @@ def draw_cards_ui(surface, events):
         if rect.collidepoint(mouse_pos):
             col = (60, 60, 60)
             if clicked:
-                apply_card(c)
-                cards = []
-                global shop_return_target, spawn_timer
-                
-                # Next wave
-                current_wave += 1
-                enemies_killed_in_wave = 0
-                total_enemies_spawned_in_wave = 0
-                
-                # BIOME TRANSITION LOGIC
-                if GAME_MODE == "STORY":
-                    if current_wave <= 3: current_biome = "FOREST"
-                    elif current_wave <= 6: current_biome = "ICE"
-                    elif current_wave <= 10: current_biome = "VOLCANO"
-                else:
-                    if current_wave > 2: current_biome = "ICE"
-                    if current_wave > 4: current_biome = "VOLCANO"
-                
-                game_state = "PLAYING"
-                scale = 1.0 # Reset scale? No, wizard scale is static?
-                
+                pick_card(i)
                 pygame.time.wait(200)
                 return
         
         pygame.draw.rect(surface, col, rect, border_radius=10)
         pygame.draw.rect(surface, c["color"], rect, 4, border_radius=10)
         
-        name = card_font.render(c["name"], True, c["color"])
-        desc = small_font.render(c["desc"], True, WHITE)
+        name = render_text("card", c["name"], c["color"])
+        desc = render_text("small", c["desc"], WHITE)
         
         surface.blit(name, name.get_rect(center=rect.center))
         surface.blit(desc, desc.get_rect(midtop=(rect.centerx, rect.centery + 30)))
 
     # Draw Shop Hint
-    shop_hint = shop_font.render("Press [S] to Open Shop", True, GOLD)
+    shop_hint = render_text("shop", "Press [S] to Open Shop", GOLD)
     surface.blit(shop_hint, shop_hint.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50)))
 
-# --- MAIN LOOPS ---
-spawn_timer = 0
-lightning_timer = 0 # For auto lightning
-tornado_cooldown = 0
-dragon_cooldown = 0
-boss_intro_timer = 0
-
-running = True
-while running:
-    # Global Input
-    events = pygame.event.get()
-    for e in events:
-        if e.type == pygame.QUIT: running = False
+# --- SYSTEMS ---
+# A PLAYING tick runs these systems in SYSTEMS order (profiled per system
+# in replays). Only the enemy AI (enemy_table's columns) and the particles
+# are array passes; the rest still walk the entity groups. Each system is
+# called as system(world, tick): the run state as a local, and this tick's
+# events passed forward in a dict:
+#   controls  - input for the tick (see src.controls)
+#   attackers - enemies whose melee swing lands (AI)
+#   touching  - enemies overlapping the wizard (AI)
+#   swept, enemy_swept - {fast player / enemy shot: its centre at the
+#               start of the tick} (physics)
+#   wizard_hits, contacts, sweeps - hits found by the collision system
+# Shots make one pass per tick: integrate, age and cull (physics), then
+# hit-test (collision). Shots faster than SWEPT_COLLISION_SPEED are tested
+# along the path they covered this tick, slower ones where they end up.
+
+def input_system(world, tick):
+    """Wizard movement, shooting, weapon hotkeys and abilities (cast + cooldowns)."""
+    controls = tick["controls"]
+    keys = controls["keys"]
+    wizard.update(keys, [])
     
-    # State Machine
-    if game_state == "MENU":
-        draw_menu(screen)
-        
-        # Logic for buttons (must match draw_menu rects)
-        ui_center_x = int(SCREEN_WIDTH * 0.7)
-        start_y = 250
-        btn_w, btn_h = 280, 55
-        spacing = 15
-        
-        # Check clicks
-        mouse_pos = pygame.mouse.get_pos()
-        click = False
-        for e in events:
-            if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
-                click = True
-        
-        # Reconstruct rects to check collisions
-        # 0: STORY
-        rect_story = pygame.Rect(ui_center_x - btn_w//2, start_y, btn_w, btn_h)
-        if rect_story.collidepoint(mouse_pos) and click:
-            reset_run(mode="STORY")
-            
-        # 1: INFINITE
-        rect_inf = pygame.Rect(ui_center_x - btn_w//2, start_y + (btn_h + spacing), btn_w, btn_h)
-        if rect_inf.collidepoint(mouse_pos) and click:
-            reset_run(mode="INFINITE")
-            
-        # 2: SHOP
-        rect_shop = pygame.Rect(ui_center_x - btn_w//2, start_y + 2*(btn_h + spacing), btn_w, btn_h)
-        if rect_shop.collidepoint(mouse_pos) and click:
-            shop_return_target = "MENU"
-            game_state = "SHOP"
-            
-        # 3: EXIT
-        rect_exit = pygame.Rect(ui_center_x - btn_w//2, start_y + 3*(btn_h + spacing), btn_w, btn_h)
-        if rect_exit.collidepoint(mouse_pos) and click:
-            running = False
-
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_1]:
-            reset_run(mode="STORY")
-        if keys[pygame.K_2]:
-            reset_run(mode="INFINITE")
-        if keys[pygame.K_s]:
-            shop_return_target = "MENU"
-            game_state = "SHOP"
-        if keys[pygame.K_q]:
-            running = False
-    elif game_state == "SHOP":
-        # Handle Scroll
-        for e in events:
-            if e.type == pygame.MOUSEWHEEL:
-                shop_scroll_y += e.y * 30
-                # Clamp scroll_y
-                # Calculate max scroll down (total height of content - screen height)
-                total_content_height = 200 + len(UNLOCKED_ABILITIES) * 120 + 20 + 50 + len(SHOP_UPGRADES_LIST) * 120
-                max_scroll_down = -(total_content_height - SCREEN_HEIGHT + 130 + 60) # Header + Footer height
-                if max_scroll_down > 0: max_scroll_down = 0 # If content is smaller than screen, no scroll
-                
-                if shop_scroll_y > 0: shop_scroll_y = 0
-                if shop_scroll_y < max_scroll_down: shop_scroll_y = max_scroll_down
-                
-        draw_shop(screen)
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_ESCAPE] or (keys[pygame.K_RETURN] and shop_return_target == "PLAYING"):
-            game_state = shop_return_target
-            shop_scroll_y = 0 # Reset scroll
-         
-         # Arrow key scroll
-        if keys[pygame.K_UP]: shop_scroll_y += 10
-        if keys[pygame.K_DOWN]: shop_scroll_y -= 10
-        
-        # Clamp scroll_y for arrow keys too
-        total_content_height = 200 + len(UNLOCKED_ABILITIES) * 120 + 20 + 50 + len(SHOP_UPGRADES_LIST) * 120
-        max_scroll_down = -(total_content_height - SCREEN_HEIGHT + 130 + 60)
-        if max_scroll_down > 0: max_scroll_down = 0
+    # Targeting index for lightning and seekers (enemies as of the start of the tick)
+    enemy_grid.rebuild(enemies)
+    
+    # Shooting
+    if keys[pygame.K_SPACE] or controls["fire"]:
+        projs = wizard.shoot(target_pos=controls["aim"]) # Mouse aim
+        if projs: 
+            projectiles.add(projs)
+
+    # Ability Inputs
+    if UNLOCKED_ABILITIES["TORNADO"] and keys[pygame.K_t] and world.tornado_cooldown == 0:
+        cast_tornado()
+        world.tornado_cooldown = 300 # 5 sec
         
-        if shop_scroll_y > 0: shop_scroll_y = 0
-        if shop_scroll_y < max_scroll_down: shop_scroll_y = max_scroll_down
-            
-    elif game_state == "PLAYING":
-        # 1. Update Logic
-        keys = pygame.key.get_pressed()
-        wizard.update(keys, [])
+    if UNLOCKED_ABILITIES["DRAGON"] and keys[pygame.K_r] and world.dragon_cooldown == 0:
+        cast_dragon()
+        world.dragon_cooldown = 1800 # 30 sec
+    
+    if world.tornado_cooldown > 0: world.tornado_cooldown -= 1
+    if world.dragon_cooldown > 0: world.dragon_cooldown -= 1
+    
+    # Auto Lightning
+    if UNLOCKED_ABILITIES["LIGHTNING"]:
+        if world.lightning_timer <= 0:
+            cast_lightning()
+            world.lightning_timer = 120 # 2 sec
+        world.lightning_timer -= 1
         
-        # Shooting
-        if keys[pygame.K_SPACE] or pygame.mouse.get_pressed()[0]:
-            projs = wizard.shoot(target_pos=pygame.mouse.get_pos()) # Mouse aim
-            if projs: 
-                projectiles.add(projs)
-                all_sprites.add(projs)
-
-        # Ability Inputs
-        if UNLOCKED_ABILITIES["TORNADO"] and keys[pygame.K_t] and tornado_cooldown == 0:
-            cast_tornado()
-            tornado_cooldown = 300 # 5 sec
-            
-        if UNLOCKED_ABILITIES["DRAGON"] and keys[pygame.K_r] and dragon_cooldown == 0:
-            cast_dragon()
-            dragon_cooldown = 1800 # 30 sec
+    # Weapon Switching
+    for slot in controls["weapons"]:
+        wizard.select_weapon(slot)
+
+def spawn_system(world, tick):
+    """Spawns enemies on the wave's timer and ends the wave once enough have died."""
+    global game_state
+    if world.spawn_timer <= 0:
+        spawn_enemy_logic()
+        # Slower waves:
+        # Base 120 (2 sec) minus wave scaling (but not too fast)
+        world.spawn_timer = 120 - (world.current_wave * 2) 
+        if world.spawn_timer < 40: world.spawn_timer = 40
         
-        if tornado_cooldown > 0: tornado_cooldown -= 1
-        if dragon_cooldown > 0: dragon_cooldown -= 1
+        # If Boss alive, slow down spawn a lot
+        is_boss_alive = False
+        for e in enemies:
+            if e.enemy_type == "OGRE_KING":
+                is_boss_alive = True
+                break
         
-        # Auto Lightning
-        if UNLOCKED_ABILITIES["LIGHTNING"]:
-            if lightning_timer <= 0:
-                cast_lightning()
-                lightning_timer = 120 # 2 sec
-            lightning_timer -= 1
+        if is_boss_alive:
+            world.spawn_timer = 300 # 5 sec
             
-        # Weapon Switching
-        for e in events:
-            if e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_1: wizard.select_weapon(1)
-                if e.key == pygame.K_2: wizard.select_weapon(2)
-                if e.key == pygame.K_3: wizard.select_weapon(3)
-                if e.key == pygame.K_4: wizard.select_weapon(4)
-                    
-
-
-        # Projectiles
-        # Spawning
-        if spawn_timer <= 0:
-            spawn_enemy_logic()
-            # Slower waves:
-            # Base 120 (2 sec) minus wave scaling (but not too fast)
-            spawn_timer = 120 - (current_wave * 2) 
-            if spawn_timer < 40: spawn_timer = 40
-            
-            # If Boss alive, slow down spawn a lot
-            is_boss_alive = False
-            for e in enemies:
-                if e.enemy_type == "OGRE_KING":
-                    is_boss_alive = True
-                    break
-            
-            if is_boss_alive:
-                spawn_timer = 300 # 5 sec
-                
-        spawn_timer -= 1
+    world.spawn_timer -= 1
 
-        # Projectiles
-        projectiles.update(enemies) 
-        enemy_projectiles.update() # Ranged enemy shots
-        
-        for p in projectiles:
-            if p.rect.left > SCREEN_WIDTH + 200 or p.rect.right < -200 or p.rect.bottom < -200 or p.rect.top > SCREEN_HEIGHT + 200:
-                 p.kill()
-
-        # Enemy Projectile Collisions
-        hits = pygame.sprite.spritecollide(wizard, enemy_projectiles, True)
-        for hit in hits:
-             wizard.health -= hit.damage
-             # Feedback
-             for _ in range(5):
-                    particles.append({'x': wizard.rect.centerx, 'y': wizard.rect.centery, 'life': 10, 'max_life': 10, 'size': 4, 'color': (200, 50, 255)})
-             if wizard.health <= 0:
-                 game_state = "GAME_OVER"
-
-        # Enemies Logic (+ Shooting)
-        # Player Collisions & Enemy Attacks
-        boss_active = None
+    # Wave Check
+    enemies_this_wave = ENEMIES_PER_WAVE_BASE + (world.current_wave - 1) // 2
+    # If Boss wave, we need to kill boss?
+    if world.current_wave % 10 == 0:
+        # Check if boss dead
+        # If enemies_killed_in_wave >= 1 (assuming boss is the 1)
+        # But minions might be killed.
+        # Only win wave if Boss is NOT in enemies group AND we killed at least 1 big guy?
+        # Better: If Boss spawned and is now dead.
+        # We can just check `not any(e.enemy_type == "OGRE_KING" for e in enemies)` BUT we need to ensure he spawned.
+        # Simplified: Boss wave ends when enemies_killed > enemies_this_wave AND no boss.
+        pass # Use standard count for now, but Boss is worth more points/kills?
         
-        for e in enemies:
-            # 1. Update Enemy (Pass Player Rect for aiming)
+    if world.enemies_killed_in_wave >= enemies_this_wave:
+         game_state = "CARD_SELECT"
+
+def ai_system(world, tick):
+    """Enemy decisions: chase, attack timers and shots; records melee hits and body contact."""
+    # Regular enemies: one vectorized AI step over enemy_table
+    shooters, attackers, touching = enemy_table.step(wizard.rect)
+    for e, muzzle_x, muzzle_y in shooters:
+        if e.enemy_type == "SKELETON_ARCHER":
+            shot = enemy_projectile_pool.acquire(muzzle_x, muzzle_y, wizard.rect.centerx, wizard.rect.centery, is_boss=False, p_type="ARROW")
+        else: # Ogre King throws a rock as he smashes
+            shot = enemy_projectile_pool.acquire(muzzle_x, muzzle_y, wizard.rect.centerx, wizard.rect.centery, is_boss=True)
+        enemy_projectiles.add(shot)
+    
+    # Special cases (Dragon Boss) run their own state machines
+    world.boss_active = None
+    for e in enemies:
+        if e.slot is None:
             new_proj = e.update(wizard.rect)
             if new_proj:
                 enemy_projectiles.add(new_proj)
-                all_sprites.add(new_proj)
-            
-            # Track Boss for UI
-            if e.enemy_type in ["OGRE_KING", "DRAGON_BOSS"]:
-                boss_active = e
-            
-            # 2. Attack Damage (Direct Hit / Melee)
-            # EXPLICITLY IGNORE ARCHERS here. They damage via projectiles only.
-            if e.enemy_type != "SKELETON_ARCHER":
-                if e.did_attack and e.damage > 0:
-                    # Melee Hit Logic
-                    # Check distance to be fair (don't hit from across screen if player dash away)
-                    dist_to_p = math.hypot(e.rect.centerx - wizard.rect.centerx, e.rect.centery - wizard.rect.centery)
-                    if dist_to_p < 150: # Melee Range allowance (was 150)
-                        wizard.health -= e.damage
-                        if wizard.health < 0: wizard.health = 0
-                        
-                        # Hit feedback
-                        for _ in range(10):
-                            particles.append({'x': wizard.rect.centerx, 'y': wizard.rect.centery, 'life': 15, 'max_life': 15, 'size': 5, 'color': RED})
-                        
-                        s_flash = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                        s_flash.fill((255, 0, 0, 50))
-                        screen.blit(s_flash, (0,0))
-                        
-                        if wizard.health <= 0:
-                            game_state = "GAME_OVER"
-
-            # 2. Contact Damage (If they get too close despite range)
+            if e.did_attack and e.damage > 0 and math.hypot(e.rect.centerx - wizard.rect.centerx, e.rect.centery - wizard.rect.centery) < MELEE_RANGE:
+                attackers.append(e)
             if e.rect.colliderect(wizard.rect):
-                wizard.health -= 1 # Contact is just chip damage now
-                if wizard.health < 0: wizard.health = 0 # Clamp
-                
-                # Push player away
-                if e.rect.centerx < wizard.rect.centerx:
-                    wizard.rect.x += 5
-                else:
-                    wizard.rect.x -= 5
-                    
-                if wizard.health <= 0:
-                    game_state = "GAME_OVER"
+                touching.append(e)
         
-        # 3. Enemy Projectiles
-        # 3. Enemy Projectiles Collisions
-        # We need to update them somewhere? They are updated with projectiles.update(enemies)? 
-        # No, projectiles group is Player projectiles.
-        # enemy_projectiles is separate.
+        # Track Boss for UI
+        if e.enemy_type in ["OGRE_KING", "DRAGON_BOSS"]:
+            world.boss_active = e
+    tick["attackers"] = attackers
+    tick["touching"] = touching
+
+def physics_system(world, tick):
+    """Pushes the wizard off enemy bodies, then moves, ages and culls every shot once."""
+    # Push player away (If they get too close despite range)
+    for e in tick["touching"]:
+        if e.rect.centerx < wizard.rect.centerx:
+            wizard.rect.x += 5
+        else:
+            wizard.rect.x -= 5
+
+    # Enemy shots (including the ones fired this tick)
+    enemy_swept = tick["enemy_swept"]
+    for p in enemy_projectiles:
+        start = p.rect.center
+        p.update()
+        if p.alive() and p.speed >= SWEPT_COLLISION_SPEED:
+            enemy_swept[p] = start
+    # Player shots (seekers steer by the start-of-tick enemy grid)
+    swept = tick["swept"]
+    for p in projectiles:
+        start = p.rect.center
+        if p.update(enemy_grid) and math.hypot(p.vel_x, p.vel_y) >= SWEPT_COLLISION_SPEED:
+            swept[p] = start
+
+def collision_system(world, tick):
+    """Finds which shots hit the wizard and which enemies each player shot hits."""
+    enemy_swept = tick["enemy_swept"]
+    wizard_hits = tick["wizard_hits"]
+    for p in enemy_projectiles:
+        if p in enemy_swept:
+            hit = swept_entry(enemy_swept[p], p.rect.center, wizard.rect, p.rect.width / 2, p.rect.height / 2) is not None
+        else:
+            hit = p.rect.colliderect(wizard.rect)
+        if hit:
+            wizard_hits.append(p)
+
+    # Slow shots: each enemy only tests the projectiles in the grid cells it touches
+    swept = tick["swept"]
+    projectile_grid.rebuild(p for p in projectiles if p not in swept)
+    tick["contacts"] = grid_groupcollide(enemies, projectile_grid)
+
+    # Fast shots: everything along the path, nearest first
+    enemy_grid.rebuild(enemies) # Where enemies stand after this tick's AI step
+    tick["sweeps"] = [(p, enemy_grid.sweep(start, p.rect.center, p.rect.width / 2, p.rect.height / 2))
+                      for p, start in swept.items()]
+
+def _projectile_hit(p, enemy):
+    """Applies p's hit on enemy (once per enemy for piercing shots); True if p is spent."""
+    if enemy.serial in p.hit_list:
+        return False
+    enemy.health -= p.damage
+    p.hit_list.add(enemy.serial)
+    
+    # Particle Feedback
+    particles.emit(np.full(3, enemy.rect.centerx), enemy.rect.centery, life=8, size=3, color=p.color)
+    
+    # Piercing Logic
+    if p.piercing <= 0:
+        p.kill()
+        return True
+    p.piercing -= 1
+    return False
+
+def damage_system(world, tick):
+    """Applies this tick's hits: melee, contact and shots on the wizard, then player shots on enemies."""
+    global game_state
+    # Attack Damage (Direct Hit / Melee). Archers damage via projectiles only.
+    for e in tick["attackers"]:
+        wizard.health -= e.damage
+        if wizard.health < 0: wizard.health = 0
         
-        for p in enemy_projectiles:
-            p.update() # Update position
-            if p.rect.colliderect(wizard.rect):
-                wizard.health -= p.damage
-                p.kill()
-                # Feedback
-                for _ in range(5):
-                     particles.append({'x': wizard.rect.centerx, 'y': wizard.rect.centery, 'life': 15, 'max_life': 15, 'size': 5, 'color': RED})
-                
-                # Flash screen
-                s_flash = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                s_flash.fill((255, 0, 0, 30))
-                screen.blit(s_flash, (0,0))
+        # Hit feedback
+        particles.emit(np.full(10, wizard.rect.centerx), wizard.rect.centery, life=15, size=5, color=RED)
+        
+        screen_flashes.append({"color": (255, 0, 0), "alpha": 50, "life": 1})
+        
+        if wizard.health <= 0:
+            game_state = "GAME_OVER"
+    
+    # Contact Damage
+    for e in tick["touching"]:
+        wizard.health -= 1 # Contact is just chip damage now
+        if wizard.health < 0: wizard.health = 0 # Clamp
+        if wizard.health <= 0:
+            game_state = "GAME_OVER"
 
-                if wizard.health <= 0: game_state = "GAME_OVER"
-            
-            # Remove if off screen (Expanded)
-            if p.rect.right < -200 or p.rect.left > SCREEN_WIDTH + 200 or p.rect.bottom < -200 or p.rect.top > SCREEN_HEIGHT + 200:
-                 p.kill()
+    # Enemy shots that reached the wizard are spent
+    for p in tick["wizard_hits"]:
+        wizard.health -= p.damage
+        p.kill()
+        # Feedback
+        particles.emit(np.full(5, wizard.rect.centerx), wizard.rect.centery, life=15, size=5, color=RED)
         
-        # Wave Check
-        enemies_this_wave = ENEMIES_PER_WAVE_BASE + (current_wave - 1) // 2
-        # If Boss wave, we need to kill boss?
-        if current_wave % 10 == 0:
-            # Check if boss dead
-            # If enemies_killed_in_wave >= 1 (assuming boss is the 1)
-            # But minions might be killed.
-            # Only win wave if Boss is NOT in enemies group AND we killed at least 1 big guy?
-            # Better: If Boss spawned and is now dead.
-            # We can just check `not any(e.enemy_type == "OGRE_KING" for e in enemies)` BUT we need to ensure he spawned.
-            # Simplified: Boss wave ends when enemies_killed > enemies_this_wave AND no boss.
-            pass # Use standard count for now, but Boss is worth more points/kills?
-            
-        if enemies_killed_in_wave >= enemies_this_wave:
-             game_state = "CARD_SELECT"
-             # Clear projectiles
-        # 4. Player Projectile Collisions (Damage Enemies)
-        # Using groupcollide to check all projectiles against all enemies
-        hits = pygame.sprite.groupcollide(enemies, projectiles, False, False)
-        for enemy, projs in hits.items():
-            for p in projs:
-                if not hasattr(p, 'hit_list'): p.hit_list = [] # Safety
-                
-                # Check if this projectile already hit this enemy (for piercing)
-                if enemy not in p.hit_list:
-                    enemy.health -= p.damage
-                    p.hit_list.append(enemy)
-                    
-                    # Particle Feedback
-                    col = p.color
-                    for _ in range(3):
-                        particles.append({'x': enemy.rect.centerx, 'y': enemy.rect.centery, 'life': 8, 'max_life': 8, 'size': 3, 'color': col})
-                    
-                    # Piercing Logic
-                    if p.piercing <= 0:
-                        p.kill()
-                    else:
-                        p.piercing -= 1
-                        
+        # Flash screen
+        screen_flashes.append({"color": (255, 0, 0), "alpha": 30, "life": 1})
+
+        if wizard.health <= 0: game_state = "GAME_OVER"
+
+    # Player shots on enemies (slow shots hit everything they overlap)
+    for enemy, projs in tick["contacts"].items():
+        for p in projs:
+            _projectile_hit(p, enemy)
+        if enemy.health <= 0:
+            kill_enemy(enemy)
+
+    # Fast shots hit in path order until spent
+    for p, hits in tick["sweeps"]:
+        for _, enemy in hits:
+            if not enemy.alive():
+                continue
+            spent = _projectile_hit(p, enemy)
             if enemy.health <= 0:
                 kill_enemy(enemy)
+            if spent:
+                break
 
-        enemy_projectiles.empty()
-
-        # 2. Drawing
-        draw_background_scenery(screen, current_biome, SCREEN_WIDTH, SCREEN_HEIGHT)
+def lifetime_system(world, tick):
+    """Ages active effects (tornadoes push and hurt), particles, and recycles dead entities."""
+    # (enemy_grid was rebuilt after the AI step by the collision system)
+    for eff in active_effects[:]:
+        eff["life"] -= 1
+        if eff["life"] <= 0: active_effects.remove(eff); continue
         
-        # Draw Entities
-        # Draw Entities
-        for e in enemies:
-            scale = 1.0
-            # Boss scale handled in draw()
-            # if e.rect.width > 90: scale = 1.5 
-            
-            # Use internal draw method which delegates
-            e.draw(screen)
-            
-        for ep in enemy_projectiles:
-            screen.blit(ep.image, ep.rect)
+        if eff["type"] == "TORNADO_MOVING":
+            eff["x"] += 5 * eff["dir"] # Move 5px/tick
             
-        wizard.draw(screen)
-        for p in projectiles:
-            p.draw(screen)
-            
-        for p in enemy_projectiles:
-            ep_s = pygame.Surface((p.rect.width*3, p.rect.height*3), pygame.SRCALPHA)
-            ep_cx, ep_cy = ep_s.get_width()//2, ep_s.get_height()//2
-            ep_r = p.rect.width//2
-            # Outer glow
-            pygame.draw.circle(ep_s, (255, 50, 50, 40), (ep_cx, ep_cy), ep_r + 6)
-            pygame.draw.circle(ep_s, (255, 80, 80, 80), (ep_cx, ep_cy), ep_r + 3)
-            # Main body
-            pygame.draw.circle(ep_s, (200, 0, 0), (ep_cx, ep_cy), ep_r)
-            # Inner bright core
-            pygame.draw.circle(ep_s, (255, 150, 100), (ep_cx, ep_cy), max(1, ep_r - 2))
-            # Hot center
-            pygame.draw.circle(ep_s, (255, 255, 200), (ep_cx, ep_cy), max(1, ep_r // 2))
-            screen.blit(ep_s, (p.rect.centerx - ep_cx, p.rect.centery - ep_cy))
-            
-        # Draw Particles
-        for p in particles[:]:
-            p['life'] -= 1
-            p['x'] += random.uniform(-1, 1)
-            p['y'] += random.uniform(-1, 1)
-            if p['life'] <= 0: particles.remove(p); continue
-            
-            s = pygame.Surface((p['size']*2, p['size']*2), pygame.SRCALPHA)
-            col = p['color']
-            alpha = int((p['life']/p['max_life'])*255)
-            if len(col)==3: col = (*col, alpha)
-            else: col = (col[0], col[1], col[2], alpha)
-            pygame.draw.circle(s, col, (p['size'], p['size']), p['size'])
-            screen.blit(s, (p['x']-p['size'], p['y']-p['size']))
-
-        # Draw Active Effects (Lightning, Dragon)
-        for eff in active_effects[:]:
-            eff["life"] -= 1
-            if eff["life"] <= 0: active_effects.remove(eff); continue
-            
-            if eff["type"] == "LIGHTNING":
-                draw_lightning_bolt(screen, eff["start"], eff["end"])
-            elif eff["type"] == "TORNADO_MOVING":
-                # Moving Logic for Tornado inside Draw Loop (simplest way without defining new class)
-                eff["x"] += 5 * eff["dir"] # Move 5px/frame
-                
-                # Draw
-                draw_tornado_effect(screen, eff["x"], eff["y"], eff["life"])
-                
-                # Collision with enemies
-                t_rect = pygame.Rect(eff["x"] - 40, eff["y"] - 150, 80, 150)
-                for e in enemies:
-                    if t_rect.colliderect(e.rect):
-                        # Push Back
-                        e.rect.x += 10 * eff["dir"]
-                        # Damage (only every f few frames? No, tornados hurt fast)
-                        if eff["life"] % 5 == 0:
-                            e.health -= 1
-                            if e.health <= 0: kill_enemy(e)
-                            
-            elif eff["type"] == "DRAGON":
-                draw_dragon_effect(screen, eff["x"], eff["y"], eff["life"])
-
-        # UI
-        
+            # Collision with enemies
+            t_rect = pygame.Rect(eff["x"] - 40, eff["y"] - 150, 80, 150)
+            for e in enemy_grid.query(t_rect):
+                if e.alive():
+                    # Push Back
+                    e.nudge(10 * eff["dir"])
+                    # Damage (only every f few frames? No, tornados hurt fast)
+                    if eff["life"] % 5 == 0:
+                        e.health -= 1
+                        if e.health <= 0: kill_enemy(e)
 
-        draw_health_bar(screen, 20, 20, wizard.health, wizard.max_health)
-        
+    # Hit flashes last one sim tick however many frames draw it: each expires
+    # on the tick after the one that queued it
+    for flash in screen_flashes[:]:
+        if flash["life"] <= 0: screen_flashes.remove(flash); continue
+        flash["life"] -= 1
+
+    # Integrate and cull every particle (trails + hit feedback) once per tick
+    particles.update()
+
+    # Entities dropped this tick become reusable from the next one
+    recycle_pools()
+
+SYSTEMS = (
+    ("input", input_system),
+    ("spawn", spawn_system),
+    ("ai", ai_system),
+    ("physics", physics_system),
+    ("collision", collision_system),
+    ("damage", damage_system),
+    ("lifetime", lifetime_system),
+)
+system_ms = None # {system name: total ms} while profiling (run_replay), else None
+
+# --- MAIN LOOPS ---
+run_seed = None # Seed of the current run (set by reset_run)
+record_path = None # Base path of the input recordings (--record)
+recorder = None # ReplayRecorder of the current run, if recording
+recorded_runs = 0 # Runs recorded so far (numbers the replay files)
+sim_accumulator = 0.0 # Wall-clock ms not yet simulated
+pending_events = [] # Input events waiting for the next sim tick
 
+def run_record_path(run):
+    """Replay file of the n-th recorded run: record_path, then name-2.ext, name-3.ext, ..."""
+    if run == 1:
+        return record_path
+    root, ext = os.path.splitext(record_path)
+    return f"{root}-{run}{ext}"
 
-        # --- NEW HUD ---
-        # 1. Main Stats Logic
-        # (Already have wizard.health)
+def finish_recording():
+    """Writes the current run's recording (if any) to its own file."""
+    global recorder
+    if recorder:
+        recorder.save(run_record_path(recorded_runs))
+        recorder = None
+
+def update_playing(controls):
+    """One fixed sim tick of the PLAYING state: every system, in SYSTEMS order."""
+    tick = {"controls": controls, "attackers": [], "touching": [], "swept": {}, "enemy_swept": {},
+            "wizard_hits": [], "contacts": {}, "sweeps": []}
+    if system_ms is None:
+        for _, system in SYSTEMS:
+            system(world, tick)
+        return
+    for name, system in SYSTEMS:
+        start = time.perf_counter()
+        system(world, tick)
+        system_ms[name] += (time.perf_counter() - start) * 1000
+
+def draw_playing(surface, alpha):
+    """Renders the PLAYING state, placing sprites alpha of the way through the last tick."""
+    draw_background_scenery(surface, world.current_biome, SCREEN_WIDTH, SCREEN_HEIGHT)
+    
+    # Draw Entities
+    # Draw Entities
+    for e in enemies:
+        scale = 1.0
+        # Boss scale handled in draw()
+        # if e.rect.width > 90: scale = 1.5 
         
-        # 2. XP Bar (Top Left - Under Health)
-        pygame.draw.rect(screen, (30, 30, 30), (20, 50, 250, 15), border_radius=4)
-        if XP_TO_NEXT_LEVEL > 0:
-            xp_ratio = min(1.0, CURRENT_XP / XP_TO_NEXT_LEVEL)
-        else:
-            xp_ratio = 1.0
-        pygame.draw.rect(screen, (0, 150, 255), (20, 50, int(250 * xp_ratio), 15), border_radius=4)
-        pygame.draw.rect(screen, (100, 100, 100), (20, 50, 250, 15), 1, border_radius=4)
+        # Use internal draw method which delegates
+        e.draw(surface, alpha)
         
-        xp_txt = small_font.render(f"LVL {CURRENT_LEVEL}", True, WHITE)
-        screen.blit(xp_txt, (20, 70))
+    for ep in enemy_projectiles:
+        if ep.p_type == "ARROW":
+            dx, dy = render_offset(ep, alpha)
+            frame = get_arrow_frame(ep.angle)
+            surface.blit(frame, frame.get_rect(center=(ep.rect.centerx + dx, ep.rect.centery + dy)))
         
-        # 3. Wave & Coins
-        info = small_font.render(f"Wave: {current_wave}", True, WHITE)
-        coins_ui = small_font.render(f"Coins: {TOTAL_COINS}", True, GOLD)
-        screen.blit(info, (SCREEN_WIDTH - 150, 20))
-        screen.blit(coins_ui, (SCREEN_WIDTH - 150, 50))
+    wizard.draw(surface, alpha)
+    draw_trail_particles(surface, particles)
+    for p in projectiles:
+        p.draw(surface, alpha)
         
-        # 4. Missions
-        mission_y = 100
-        m_title = shop_font.render("MISSIONS", True, (200, 200, 255))
-        screen.blit(m_title, (SCREEN_WIDTH - 220, mission_y))
-        mission_y += 30
+    for p in enemy_projectiles:
+        ep_r = p.rect.width//2
+        dx, dy = render_offset(p, alpha)
+        blit_glow(surface, (p.rect.centerx + dx, p.rect.centery + dy), (
+            ((255, 50, 50, 40), ep_r + 6),         # Outer glow
+            ((255, 80, 80, 80), ep_r + 3),
+            ((200, 0, 0), ep_r),                   # Main body
+            ((255, 150, 100), max(1, ep_r - 2)),   # Inner bright core
+            ((255, 255, 200), max(1, ep_r // 2)),  # Hot center
+        ))
         
-        for m in MISSIONS:
-            if m["current"] >= m["target"]: col = GREEN
-            else: col = WHITE
-            mtxt = small_font.render(f"{m['desc']}: {m['current']}/{m['target']}", True, col)
-            screen.blit(mtxt, (SCREEN_WIDTH - 220, mission_y))
-            mission_y += 25
-            
-        if boss_active:
-             # BOSS BAR at Top Center
-             bw = 500
-             bh = 30
-             bx = SCREEN_WIDTH//2 - bw//2
-             by = 20
-             
-             # Name and Max Health selection
-             if boss_active.enemy_type == "DRAGON_BOSS":
-                 name_txt = "ANCIENT DRAGON"
-                 max_hp = DRAGON_BOSS_HEALTH
-                 bar_col = (255, 100, 0) # Orange
-             else:
-                 name_txt = f"OGRE KING (Wave {current_wave})"
-                 max_hp = OGRE_HEALTH_BASE * 15.0
-                 bar_col = (200, 0, 0) # Red
-                 
-             # Draw Boss Bar
-             pygame.draw.rect(screen, (50, 0, 0), (bx, by, bw, bh))
-             pct = max(0, boss_active.health / max_hp)
-             pygame.draw.rect(screen, bar_col, (bx, by, int(bw*pct), bh))
-             pygame.draw.rect(screen, WHITE, (bx, by, bw, bh), 2)
-             
+    # Draw Particles
+    draw_spark_particles(surface, particles)
+
+    # Draw Active Effects (Lightning, Tornado, Dragon)
+    for eff in active_effects:
+        if eff["type"] == "LIGHTNING":
+            if eff["arc"] is None:
+                eff["arc"] = build_lightning_arc(eff["start"], eff["end"])
+            draw_lightning_bolt(surface, eff["start"], eff["end"], eff["arc"])
+        elif eff["type"] == "TORNADO_MOVING":
+            draw_tornado_effect(surface, eff["x"] - 5 * eff["dir"] * (1.0 - alpha), eff["y"], eff["life"])
+        elif eff["type"] == "DRAGON":
+            draw_dragon_effect(surface, eff["x"], eff["y"], eff["life"])
+
+    # Hit flashes (over the scene, under the UI); every frame until they expire
+    for flash in screen_flashes:
+        draw_overlay(surface, flash["color"], flash["alpha"])
+
+    # UI
+    
+
+    draw_health_bar(surface, 20, 20, wizard.health, wizard.max_health)
+    
+
+
+    # --- NEW HUD ---
+    # 1. Main Stats Logic
+    # (Already have wizard.health)
+    
+    # 2. XP Bar (Top Left - Under Health)
+    pygame.draw.rect(surface, (30, 30, 30), (20, 50, 250, 15), border_radius=4)
+    if XP_TO_NEXT_LEVEL > 0:
+        xp_ratio = min(1.0, CURRENT_XP / XP_TO_NEXT_LEVEL)
+    else:
+        xp_ratio = 1.0
+    pygame.draw.rect(surface, (0, 150, 255), (20, 50, int(250 * xp_ratio), 15), border_radius=4)
+    pygame.draw.rect(surface, (100, 100, 100), (20, 50, 250, 15), 1, border_radius=4)
+    
+    xp_txt = render_text("small", f"LVL {CURRENT_LEVEL}", WHITE)
+    surface.blit(xp_txt, (20, 70))
+    
+    # 3. Wave & Coins
+    info = render_text("small", f"Wave: {world.current_wave}", WHITE)
+    coins_ui = render_text("small", f"Coins: {TOTAL_COINS}", GOLD)
+    surface.blit(info, (SCREEN_WIDTH - 150, 20))
+    surface.blit(coins_ui, (SCREEN_WIDTH - 150, 50))
+    
+    # 4. Missions
+    mission_y = 100
+    m_title = render_text("shop", "MISSIONS", (200, 200, 255))
+    surface.blit(m_title, (SCREEN_WIDTH - 220, mission_y))
+    mission_y += 30
+    
+    for m in MISSIONS:
+        if m["current"] >= m["target"]: col = GREEN
+        else: col = WHITE
+        mtxt = render_text("small", f"{m['desc']}: {m['current']}/{m['target']}", col)
+        surface.blit(mtxt, (SCREEN_WIDTH - 220, mission_y))
+        mission_y += 25
+        
+    boss = world.boss_active
+    if boss and boss.alive(): # Killed this tick: its table row is gone
+         # BOSS BAR at Top Center
+         bw = 500
+         bh = 30
+         bx = SCREEN_WIDTH//2 - bw//2
+         by = 20
+         
+         # Name and Max Health selection
+         if boss.enemy_type == "DRAGON_BOSS":
+             name_txt = "ANCIENT DRAGON"
+             max_hp = DRAGON_BOSS_HEALTH
+             bar_col = (255, 100, 0) # Orange
+         else:
+             name_txt = f"OGRE KING (Wave {world.current_wave})"
+             max_hp = OGRE_HEALTH_BASE * 15.0
+             bar_col = (200, 0, 0) # Red
              
-             bn = font.render(name_txt, True, WHITE)
-             screen.blit(bn, (SCREEN_WIDTH//2 - bn.get_width()//2, by - 25))
+         # Draw Boss Bar
+         pygame.draw.rect(surface, (50, 0, 0), (bx, by, bw, bh))
+         pct = max(0, boss.health / max_hp)
+         pygame.draw.rect(surface, bar_col, (bx, by, int(bw*pct), bh))
+         pygame.draw.rect(surface, WHITE, (bx, by, bw, bh), 2)
+         
+         
+         bn = render_text("large", name_txt, WHITE)
+         surface.blit(bn, (SCREEN_WIDTH//2 - bn.get_width()//2, by - 25))
+    
+    # Cooldowns HUD
+    if UNLOCKED_ABILITIES["TORNADO"]:
+        col = GREEN if world.tornado_cooldown == 0 else RED
+        txt = render_text("small", "Tornado [T]", col)
+        surface.blit(txt, (20, SCREEN_HEIGHT - 60))
+    if UNLOCKED_ABILITIES["DRAGON"]:
+        col = GREEN if world.dragon_cooldown == 0 else RED
+        txt = render_text("small", "Dragon [R]", col)
+        surface.blit(txt, (20, SCREEN_HEIGHT - 30))
+
+    # UI: Draw Weapon Hotbar (Moved here to draw ON TOP)
+    hotbar_x = 20
+    hotbar_y = 120
+    slot_size = 50
+    padding = 10
+    
+    # Weapon Metadata for Display
+    hotbar_slots = [
+        {"key": "1", "id": "DEFAULT", "color": (255, 200, 50)},    # Gold/Yellow
+        {"key": "2", "id": "ARCANE_VOLLEY", "color": (200, 100, 255)}, # Purple
+        {"key": "3", "id": "VOID_LANCE", "color": (50, 0, 100)},   # Dark Purple
+        {"key": "4", "id": "FIRE_RING", "color": (255, 69, 0)}     # Orange Red
+    ]
+    
+    for i, slot in enumerate(hotbar_slots):
+        # Status
+        is_unlocked = slot["id"] == "DEFAULT" or slot["id"] in wizard.unlocked_weapons
+        is_active = wizard.current_weapon == slot["id"]
         
-        # Cooldowns HUD
-        if UNLOCKED_ABILITIES["TORNADO"]:
-            col = GREEN if tornado_cooldown == 0 else RED
-            txt = small_font.render("Tornado [T]", True, col)
-            screen.blit(txt, (20, SCREEN_HEIGHT - 60))
-        if UNLOCKED_ABILITIES["DRAGON"]:
-            col = GREEN if dragon_cooldown == 0 else RED
-            txt = small_font.render("Dragon [R]", True, col)
-            screen.blit(txt, (20, SCREEN_HEIGHT - 30))
-
-        # UI: Draw Weapon Hotbar (Moved here to draw ON TOP)
-        hotbar_x = 20
-        hotbar_y = 120
-        slot_size = 50
-        padding = 10
+        # Position
+        rx = hotbar_x + i * (slot_size + padding)
+        ry = hotbar_y
+        rect = pygame.Rect(rx, ry, slot_size, slot_size)
         
-        # Weapon Metadata for Display
-        hotbar_slots = [
-            {"key": "1", "id": "DEFAULT", "color": (255, 200, 50)},    # Gold/Yellow
-            {"key": "2", "id": "ARCANE_VOLLEY", "color": (200, 100, 255)}, # Purple
-            {"key": "3", "id": "VOID_LANCE", "color": (50, 0, 100)},   # Dark Purple
-            {"key": "4", "id": "FIRE_RING", "color": (255, 69, 0)}     # Orange Red
-        ]
+        # Background Color
+        if is_active:
+            bg_col = (50, 50, 70) # Highlight active bg
+            border_col = (255, 255, 255) # Bright border
+            width = 3
+        elif is_unlocked:
+            bg_col = (30, 30, 30) # Unlocked but inactive
+            border_col = (100, 100, 100)
+            width = 1
+        else:
+            bg_col = (10, 10, 10) # Locked
+            border_col = (50, 50, 50)
+            width = 1
+            
+        pygame.draw.rect(surface, bg_col, rect, border_radius=5)
+        pygame.draw.rect(surface, border_col, rect, width, border_radius=5)
         
-        for i, slot in enumerate(hotbar_slots):
-            # Status
-            is_unlocked = slot["id"] == "DEFAULT" or slot["id"] in wizard.unlocked_weapons
-            is_active = wizard.current_weapon == slot["id"]
+        # Weapon Icon (Detailed Representation)
+        if is_unlocked:
+            center = rect.center
+            cx, cy = center
             
-            # Position
-            rx = hotbar_x + i * (slot_size + padding)
-            ry = hotbar_y
-            rect = pygame.Rect(rx, ry, slot_size, slot_size)
+            # Base Color (Dimmed if inactive)
+            icon_col = slot["color"]
+            if not is_active:
+                icon_col = (icon_col[0]//3, icon_col[1]//3, icon_col[2]//3)
             
-            # Background Color
-            if is_active:
-                bg_col = (50, 50, 70) # Highlight active bg
-                border_col = (255, 255, 255) # Bright border
-                width = 3
-            elif is_unlocked:
-                bg_col = (30, 30, 30) # Unlocked but inactive
-                border_col = (100, 100, 100)
-                width = 1
-            else:
-                bg_col = (10, 10, 10) # Locked
-                border_col = (50, 50, 50)
-                width = 1
-                
-            pygame.draw.rect(screen, bg_col, rect, border_radius=5)
-            pygame.draw.rect(screen, border_col, rect, width, border_radius=5)
+            if slot["id"] == "DEFAULT":
+                # Simple Spark Orb
+                pygame.draw.circle(surface, icon_col, center, 8)
+                if is_active:
+                    pygame.draw.circle(surface, (255, 255, 200), center, 4) # Inner glow
+                    
+            elif slot["id"] == "ARCANE_VOLLEY":
+                # Three small orbs in local spread
+                #  o
+                # o o
+                offsets = [(0, -6), (-6, 4), (6, 4)]
+                for ox, oy in offsets:
+                    pygame.draw.circle(surface, icon_col, (cx + ox, cy + oy), 4)
+                    
+            elif slot["id"] == "VOID_LANCE":
+                # A diagonal beam/line
+                #  /
+                pygame.draw.line(surface, icon_col, (cx - 10, cy + 10), (cx + 10, cy - 10), 4)
+                if is_active:
+                    pygame.draw.line(surface, (200, 100, 255), (cx - 10, cy + 10), (cx + 10, cy - 10), 1)
+                    
+            elif slot["id"] == "FIRE_RING":
+                # A Ring (Hollow Circle)
+                pygame.draw.circle(surface, icon_col, center, 12, 3)
+                if is_active:
+                     # Flames on ring?
+                     pass
+
+            # Key Number
+            key_txt = render_text("small", slot["key"], (200, 200, 200) if is_active else (80, 80, 80))
+            surface.blit(key_txt, (rect.right - 15, rect.bottom - 20))
+        else:
+            # Draw Lock? Or just empty dark slot
+            key_txt = render_text("small", slot["key"], (40, 40, 40))
+            surface.blit(key_txt, (rect.right - 15, rect.bottom - 20))
+
+def update_boss_intro():
+    """One sim tick of the dragon's entrance; the fight starts after 300 ticks."""
+    global game_state
+    world.boss_intro_timer += 1
+    if world.boss_intro_timer >= 300:
+        # Spawn Boss and Start Fight
+        game_state = "PLAYING"
+        e = DragonBoss(SCREEN_WIDTH//2, SCREEN_HEIGHT - 300)
+        enemies.add(e)
+        
+        # Sound effect placeholder
+        # pygame.mixer.Sound("roar.wav").play()
+
+def take_sim_steps():
+    """Whole sim ticks owed by the accumulator (the remainder carries over)."""
+    global sim_accumulator
+    steps = int(sim_accumulator // SIM_DT_MS)
+    sim_accumulator -= steps * SIM_DT_MS
+    return steps
+
+def main():
+    """Windowed game: menus, fixed-step play and rendering until the window closes."""
+    global game_state, shop_scroll_y, shop_return_target, sim_accumulator
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Wizard vs Ogres: Ultimate Edition")
+    clock = pygame.time.Clock()
+
+    # Bake enemy animation frames before the first wave
+    warm_enemy_atlas()
+
+    # Fonts (created once; text goes through render_text's cache)
+    load_fonts()
+
+    running = True
+    while running:
+        # Global Input
+        events = pygame.event.get()
+        for e in events:
+            if e.type == pygame.QUIT: running = False
+    
+        # State Machine
+        if game_state == "MENU":
+            draw_menu(screen)
+        
+            # Logic for buttons (must match draw_menu rects)
+            ui_center_x = int(SCREEN_WIDTH * 0.7)
+            start_y = 250
+            btn_w, btn_h = 280, 55
+            spacing = 15
+        
+            # Check clicks
+            mouse_pos = pygame.mouse.get_pos()
+            click = False
+            for e in events:
+                if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
+                    click = True
+        
+            # Reconstruct rects to check collisions
+            # 0: STORY
+            rect_story = pygame.Rect(ui_center_x - btn_w//2, start_y, btn_w, btn_h)
+            if rect_story.collidepoint(mouse_pos) and click:
+                reset_run(mode="STORY")
+            
+            # 1: INFINITE
+            rect_inf = pygame.Rect(ui_center_x - btn_w//2, start_y + (btn_h + spacing), btn_w, btn_h)
+            if rect_inf.collidepoint(mouse_pos) and click:
+                reset_run(mode="INFINITE")
             
-            # Weapon Icon (Detailed Representation)
-            if is_unlocked:
-                center = rect.center
-                cx, cy = center
+            # 2: SHOP
+            rect_shop = pygame.Rect(ui_center_x - btn_w//2, start_y + 2*(btn_h + spacing), btn_w, btn_h)
+            if rect_shop.collidepoint(mouse_pos) and click:
+                shop_return_target = "MENU"
+                game_state = "SHOP"
+            
+            # 3: EXIT
+            rect_exit = pygame.Rect(ui_center_x - btn_w//2, start_y + 3*(btn_h + spacing), btn_w, btn_h)
+            if rect_exit.collidepoint(mouse_pos) and click:
+                running = False
+
+            keys = pygame.key.get_pressed()
+            if keys[pygame.K_1]:
+                reset_run(mode="STORY")
+            if keys[pygame.K_2]:
+                reset_run(mode="INFINITE")
+            if keys[pygame.K_s]:
+                shop_return_target = "MENU"
+                game_state = "SHOP"
+            if keys[pygame.K_q]:
+                running = False
+        elif game_state == "SHOP":
+            # Handle Scroll
+            for e in events:
+                if e.type == pygame.MOUSEWHEEL:
+                    shop_scroll_y += e.y * 30
+                    # Clamp scroll_y
+                    # Calculate max scroll down (total height of content - screen height)
+                    total_content_height = 200 + len(UNLOCKED_ABILITIES) * 120 + 20 + 50 + len(SHOP_UPGRADES_LIST) * 120
+                    max_scroll_down = -(total_content_height - SCREEN_HEIGHT + 130 + 60) # Header + Footer height
+                    if max_scroll_down > 0: max_scroll_down = 0 # If content is smaller than screen, no scroll
                 
-                # Base Color (Dimmed if inactive)
-                icon_col = slot["color"]
-                if not is_active:
-                    icon_col = (icon_col[0]//3, icon_col[1]//3, icon_col[2]//3)
+                    if shop_scroll_y > 0: shop_scroll_y = 0
+                    if shop_scroll_y < max_scroll_down: shop_scroll_y = max_scroll_down
                 
-                if slot["id"] == "DEFAULT":
-                    # Simple Spark Orb
-                    pygame.draw.circle(screen, icon_col, center, 8)
-                    if is_active:
-                        pygame.draw.circle(screen, (255, 255, 200), center, 4) # Inner glow
-                        
-                elif slot["id"] == "ARCANE_VOLLEY":
-                    # Three small orbs in local spread
-                    #  o
-                    # o o
-                    offsets = [(0, -6), (-6, 4), (6, 4)]
-                    for ox, oy in offsets:
-                        pygame.draw.circle(screen, icon_col, (cx + ox, cy + oy), 4)
-                        
-                elif slot["id"] == "VOID_LANCE":
-                    # A diagonal beam/line
-                    #  /
-                    pygame.draw.line(screen, icon_col, (cx - 10, cy + 10), (cx + 10, cy - 10), 4)
-                    if is_active:
-                        pygame.draw.line(screen, (200, 100, 255), (cx - 10, cy + 10), (cx + 10, cy - 10), 1)
-                        
-                elif slot["id"] == "FIRE_RING":
-                    # A Ring (Hollow Circle)
-                    pygame.draw.circle(screen, icon_col, center, 12, 3)
-                    if is_active:
-                         # Flames on ring?
-                         pass
-
-                # Key Number
-                key_txt = small_font.render(slot["key"], True, (200, 200, 200) if is_active else (80, 80, 80))
-                screen.blit(key_txt, (rect.right - 15, rect.bottom - 20))
-            else:
-                # Draw Lock? Or just empty dark slot
-                key_txt = small_font.render(slot["key"], True, (40, 40, 40))
-                screen.blit(key_txt, (rect.right - 15, rect.bottom - 20))
-
-    elif game_state == "BOSS_INTRO":
-        # Cinematic Sequence
-        boss_intro_timer += 1
-        progress = min(1.0, boss_intro_timer / 300.0) # 5 seconds intro
-        
-        # Draw game world behind (frozen or not?)
-        draw_background_scenery(screen, current_biome, SCREEN_WIDTH, SCREEN_HEIGHT)
-        wizard.draw(screen)
+            draw_shop(screen)
+            keys = pygame.key.get_pressed()
+            if keys[pygame.K_ESCAPE] or (keys[pygame.K_RETURN] and shop_return_target == "PLAYING"):
+                game_state = shop_return_target
+                shop_scroll_y = 0 # Reset scroll
+         
+             # Arrow key scroll
+            if keys[pygame.K_UP]: shop_scroll_y += 10
+            if keys[pygame.K_DOWN]: shop_scroll_y -= 10
         
-        # Draw Cinematic
-        draw_dragon_cinematic_entrance(screen, progress)
+            # Clamp scroll_y for arrow keys too
+            total_content_height = 200 + len(UNLOCKED_ABILITIES) * 120 + 20 + 50 + len(SHOP_UPGRADES_LIST) * 120
+            max_scroll_down = -(total_content_height - SCREEN_HEIGHT + 130 + 60)
+            if max_scroll_down > 0: max_scroll_down = 0
         
-        if boss_intro_timer >= 300:
-            # Spawn Boss and Start Fight
-            game_state = "PLAYING"
-            # Spawn Boss
-            e = DragonBoss(SCREEN_WIDTH//2, SCREEN_HEIGHT - 300)
-            enemies.add(e)
-            all_sprites.add(e)
+            if shop_scroll_y > 0: shop_scroll_y = 0
+            if shop_scroll_y < max_scroll_down: shop_scroll_y = max_scroll_down
             
-            # Sound effect placeholder
-            # pygame.mixer.Sound("roar.wav").play()
+        elif game_state == "PLAYING":
+            # Fixed-rate simulation: run every tick the elapsed time owes (a slow
+            # frame costs render frames, never sim ticks), then draw once
+            pending_events.extend(events)
+            for _ in range(take_sim_steps()):
+                snapshot_positions([wizard], enemies, projectiles, enemy_projectiles)
+                controls = read_controls(pending_events)
+                if recorder: recorder.tick(controls, UNLOCKED_ABILITIES)
+                update_playing(controls)
+                pending_events.clear()
+                if game_state != "PLAYING": break
+            draw_playing(screen, sim_accumulator / SIM_DT_MS)
+
+        elif game_state == "BOSS_INTRO":
+            # Cinematic Sequence
+            for _ in range(take_sim_steps()):
+                update_boss_intro()
+                if game_state != "BOSS_INTRO": break
+            progress = min(1.0, world.boss_intro_timer / 300.0) # 5 seconds intro
+        
+            # Draw game world behind (frozen or not?)
+            draw_background_scenery(screen, world.current_biome, SCREEN_WIDTH, SCREEN_HEIGHT)
+            wizard.draw(screen)
+        
+            # Draw Cinematic
+            draw_dragon_cinematic_entrance(screen, progress)
             
-    elif game_state == "CARD_SELECT":
-        draw_cards_ui(screen, events)
+        elif game_state == "CARD_SELECT":
+            draw_cards_ui(screen, events)
         
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_s]:
-             shop_return_target = "CARD_SELECT"
-             game_state = "SHOP"
+            keys = pygame.key.get_pressed()
+            if keys[pygame.K_s]:
+                 shop_return_target = "CARD_SELECT"
+                 game_state = "SHOP"
         
-    elif game_state in ["GAME_OVER", "VICTORY"]:
-        screen.fill(BLACK)
-        txt = "VICTORY!" if game_state == "VICTORY" else "GAME OVER"
-        col = GREEN if game_state == "VICTORY" else RED
+        elif game_state in ["GAME_OVER", "VICTORY"]:
+            screen.fill(BLACK)
+            txt = "VICTORY!" if game_state == "VICTORY" else "GAME OVER"
+            col = GREEN if game_state == "VICTORY" else RED
         
-        t = font.render(txt, True, col)
-        s = small_font.render(f"Final Score: {score} - Coins Earned: {TOTAL_COINS}", True, WHITE)
-        r = small_font.render("Press [ESC] to Return Menu", True, GRAY)
+            t = render_text("large", txt, col)
+            s = render_text("small", f"Final Score: {world.score} - Coins Earned: {TOTAL_COINS}", WHITE)
+            r = render_text("small", "Press [ESC] to Return Menu", GRAY)
         
-        cx, cy = SCREEN_WIDTH//2, SCREEN_HEIGHT//2
-        screen.blit(t, t.get_rect(center=(cx, cy - 40)))
-        screen.blit(s, s.get_rect(center=(cx, cy)))
-        screen.blit(r, r.get_rect(center=(cx, cy + 50)))
+            cx, cy = SCREEN_WIDTH//2, SCREEN_HEIGHT//2
+            screen.blit(t, t.get_rect(center=(cx, cy - 40)))
+            screen.blit(s, s.get_rect(center=(cx, cy)))
+            screen.blit(r, r.get_rect(center=(cx, cy + 50)))
         
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_ESCAPE]:
-            game_state = "MENU"
+            keys = pygame.key.get_pressed()
+            if keys[pygame.K_ESCAPE]:
+                game_state = "MENU"
+
+        pygame.display.flip()
 
-    pygame.display.flip()
-    clock.tick(FPS)
+        # Wall-clock time since the last frame feeds the fixed-step accumulator.
+        # Only the interpolated states render above FPS: menus and the shop
+        # still step per frame
+        frame_ms = clock.tick(RENDER_FPS_CAP if game_state in ("PLAYING", "BOSS_INTRO") else FPS)
+        if game_state in ("PLAYING", "BOSS_INTRO"):
+            sim_accumulator += min(frame_ms, MAX_FRAME_MS)
+        else:
+            sim_accumulator = 0.0
+            pending_events.clear()
 
-pygame.quit()
-sys.exit()
+    finish_recording()
+    pygame.quit()
+
+# --- HEADLESS ---
+
+def run_headless(mode="INFINITE", max_waves=None, max_ticks=1_000_000, controls_fn=None, card_fn=None, fresh_profile=True, seed=None):
+    """
+    Plays one run with no window and no drawing, as fast as the CPU allows.
+    controls_fn(tick) supplies each sim tick's controls (default: the bot in
+    src.controls); card_fn(cards) returns the index of the card to pick
+    (default: the first). The run stops at game over, victory, after clearing
+    max_waves or after max_ticks. The save file is never written; the input
+    is recorded when the module-level record_path is set (by --record; see
+    run_record_path).
+    The same seed, profile and input always replay the same run.
+    Returns a summary dict.
+    """
+    global SAVE_ENABLED, cards
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    SAVE_ENABLED = False
+
+    if fresh_profile:
+        apply_profile({
+            "coins": 0, "xp": 0, "level": 1, "xp_next": 100,
+            "abilities": {k: False for k in UNLOCKED_ABILITIES}, "upgrades": {},
+            "missions": _MISSIONS_START,
+        })
+    reset_run(mode=mode, seed=seed)
+
+    tick = 0
+    while tick < max_ticks:
+        if game_state == "PLAYING":
+            controls = controls_fn(tick) if controls_fn else bot_controls(wizard, enemy_grid)
+            if recorder: recorder.tick(controls, UNLOCKED_ABILITIES)
+            update_playing(controls)
+        elif game_state == "BOSS_INTRO":
+            update_boss_intro()
+        elif game_state == "CARD_SELECT":
+            if max_waves is not None and world.current_wave >= max_waves: break
+            cards = generate_upgrades()
+            pick_card(card_fn(cards) if card_fn else 0)
+        else:
+            break # GAME_OVER / VICTORY
+        tick += 1
+
+    finish_recording()
+    return {
+        "mode": mode, "seed": run_seed, "outcome": game_state, "wave": world.current_wave, "ticks": tick,
+        "score": world.score, "coins": TOTAL_COINS, "level": CURRENT_LEVEL, "health": wizard.health,
+    }
+
+def run_replay(path, render=True):
+    """
+    Plays a recorded run back tick for tick: same seed, profile and input, so
+    it reaches the same state on every engine version. With render=True each
+    PLAYING tick is drawn and flipped once (lockstep, uncapped) and timed,
+    which makes replays usable as frame-time benchmarks and for reproducing
+    reported lag spikes. Each system's time is profiled too. Returns a
+    summary dict with the timings.
+    """
+    global SAVE_ENABLED, cards, system_ms
+    replay = ReplayPlayer.load(path)
+    if not render:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    SAVE_ENABLED = False
+    if render:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Wizard vs Ogres: Replay")
+        warm_enemy_atlas()
+        load_fonts()
+
+    apply_profile(replay.profile)
+    reset_run(mode=replay.mode, seed=replay.seed)
+
+    tick = 0
+    frame_ms = [] # (ms, tick) per rendered PLAYING tick
+    system_ms = {name: 0.0 for name, _ in SYSTEMS}
+    if render: system_ms["render"] = 0.0
+    playing_ticks = 0
+    particle_drops = [] # Particles merged, dropped or shed per PLAYING tick
+    applied_abilities = None
+    while True:
+        if render:
+            pygame.event.pump()
+        if game_state == "PLAYING":
+            controls = replay.next_controls()
+            if controls is None: break
+            if replay.abilities is not None and replay.abilities != applied_abilities:
+                # Shop purchases mid-run: the mask, plus the weapons they unlock
+                for i, k in enumerate(UNLOCKED_ABILITIES):
+                    UNLOCKED_ABILITIES[k] = bool(replay.abilities >> i & 1)
+                sync_unlocked_weapons()
+                applied_abilities = replay.abilities
+            start = time.perf_counter()
+            snapshot_positions([wizard], enemies, projectiles, enemy_projectiles)
+            update_playing(controls)
+            playing_ticks += 1
+            if particles.budget is not None:
+                particle_drops.append(particles.budget.drops_last_tick())
+            if render:
+                render_start = time.perf_counter()
+                draw_playing(screen, 1.0)
+                pygame.display.flip()
+                end = time.perf_counter()
+                system_ms["render"] += (end - render_start) * 1000
+                frame_ms.append(((end - start) * 1000, tick))
+        elif game_state == "BOSS_INTRO":
+            update_boss_intro()
+        elif game_state == "CARD_SELECT":
+            index = replay.next_card()
+            if index is None: break
+            cards = generate_upgrades()
+            pick_card(index)
+        else:
+            break # GAME_OVER / VICTORY
+        tick += 1
+
+    summary = {
+        "mode": replay.mode, "seed": replay.seed, "outcome": game_state, "wave": world.current_wave,
+        "ticks": tick, "score": world.score,
+        "pool_high_water": {name: s["high_water"] for name, s in pool_stats().items()},
+        # Particle budget losses (replays step one tick per drawn frame)
+        "particle_drops": {"total": sum(particle_drops), "max_per_tick": max(particle_drops, default=0)},
+        # Mean ms per PLAYING tick, per system
+        "system_ms": {name: round(ms / max(1, playing_ticks), 3) for name, ms in system_ms.items()},
+    }
+    system_ms = None
+    if frame_ms:
+        times = sorted(ms for ms, _ in frame_ms)
+        summary.update({
+            "mean_ms": round(sum(times) / len(times), 2), "p50_ms": round(times[len(times) // 2], 2),
+            "p95_ms": round(times[int(len(times) * 0.95)], 2), "max_ms": round(times[-1], 2),
+            "worst_ticks": [(t, round(ms, 2)) for ms, t in sorted(frame_ms, reverse=True)[:5]],
+        })
+    return summary
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Wizard vs Ogres")
+    parser.add_argument("--headless", action="store_true", help="simulate without a window (bot input)")
+    parser.add_argument("--mode", default="INFINITE", choices=["STORY", "INFINITE"])
+    parser.add_argument("--waves", type=int, default=None, help="stop after clearing this wave")
+    parser.add_argument("--ticks", type=int, default=1_000_000, help="stop after this many sim ticks")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None, help="seed of the first run (later runs use seed+1, ...)")
+    parser.add_argument("--record", metavar="PATH", help="record the input of each run played to PATH (later runs to PATH-2, PATH-3, ...)")
+    parser.add_argument("--replay", metavar="PATH", help="play a recording back (timed; --headless skips drawing)")
+    args = parser.parse_args()
+
+    record_path = args.record
+    if args.replay:
+        print(run_replay(args.replay, render=not args.headless))
+    elif args.headless:
+        for i in range(args.runs):
+            seed = None if args.seed is None else args.seed + i
+            print(run_headless(mode=args.mode, max_waves=args.waves, max_ticks=args.ticks, seed=seed))
+    else:
+        main()
+    sys.exit()
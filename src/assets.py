@@ -2,10 +2,151 @@
 import pygame
 import math
 import random
+from collections import OrderedDict
+import numpy as np
 from src.config import *
+from src.particles import KIND_SPARK, KIND_TRAIL
+from src.rng import vfx_rng, scenery_rng
+
+def _to_display_format(surf, alpha=False):
+    """Converts a baked surface to the screen pixel format (once a window exists)."""
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha() if alpha else surf.convert()
+
+# --- FONTS & TEXT CACHE ---
+# Every font is created once through the registry (SysFont lookups hit the
+# filesystem), and rendered text surfaces are kept in an LRU cache keyed by
+# (font, text, colour, antialias). Cached surfaces are shared: blit, don't modify.
+FONT_SPECS = {
+    "large": ("Arial", 36, True, False),
+    "small": ("Arial", 24, False, False),
+    "card": ("Arial", 20, True, False),
+    "shop": ("Arial", 28, True, False),
+    "health": ("Arial", 18, True, False),
+    "menu_title": ("Verdana", 60, True, False),
+    "menu_subtitle": ("Arial", 24, False, True),
+    "cinematic": ("Verdana", 80, True, False),
+}
+TEXT_CACHE_MAX = 512
+TEXT_CACHE_STATS = {"hits": 0, "misses": 0}
+_FONTS = {}
+_TEXT_CACHE = OrderedDict()
+
+def load_fonts():
+    """Creates every registered font (call once after pygame.init())."""
+    for name in FONT_SPECS:
+        get_font(name)
+
+def get_font(name):
+    font = _FONTS.get(name)
+    if font is None:
+        family, size, bold, italic = FONT_SPECS[name]
+        font = pygame.font.SysFont(family, size, bold=bold, italic=italic)
+        _FONTS[name] = font
+    return font
+
+def render_text(font_name, text, color, antialias=True):
+    """Returns a cached rendered text surface."""
+    key = (font_name, text, tuple(color), antialias)
+    surf = _TEXT_CACHE.get(key)
+    if surf is not None:
+        TEXT_CACHE_STATS["hits"] += 1
+        _TEXT_CACHE.move_to_end(key)
+        return surf
+
+    TEXT_CACHE_STATS["misses"] += 1
+    surf = get_font(font_name).render(text, antialias, color)
+    _TEXT_CACHE[key] = surf
+    if len(_TEXT_CACHE) > TEXT_CACHE_MAX:
+        _TEXT_CACHE.popitem(last=False)
+    return surf
+
+# --- WIZARD POSE CACHE ---
+# The wizard body is baked into a few frames keyed by
+# (facing, wand colour, breathing bucket, scale); the pulsing aura
+# is a separate cached stamp. Only the crystal and casting sparks stay live.
+WIZARD_BREATH_FRAMES = 24
+_BREATH_CYCLE_MS = 2 * math.pi * 500 # breath = sin(t / 500)
+_WIZARD_FRAMES = {}
+_WIZARD_AURA_STAMPS = {}
+
+def _get_wizard_frame(facing_right, is_casting, wand_color, t, scale=1.0):
+    """Returns (frame, (ox, oy), (tip_x, tip_y)) relative to the wizard's feet."""
+    bucket = int((t % _BREATH_CYCLE_MS) / _BREATH_CYCLE_MS * WIZARD_BREATH_FRAMES) % WIZARD_BREATH_FRAMES
+    key = (facing_right, tuple(wand_color[:3]), bucket, scale)
+    entry = _WIZARD_FRAMES.get(key)
+    if entry is None:
+        if scale != 1.0:
+            frame, (ox, oy), (tip_x, tip_y) = _get_wizard_frame(facing_right, is_casting, wand_color, t)
+            size = (max(1, int(frame.get_width() * scale)), max(1, int(frame.get_height() * scale)))
+            frame = _to_display_format(pygame.transform.scale(frame, size), alpha=True)
+            entry = (frame, (int(ox * scale), int(oy * scale)), (tip_x * scale, tip_y * scale))
+        else:
+            # Paint around an anchor with room for hat, cape and staff, then crop
+            w, h = 120, 160
+            ax, ay = 60, 145
+            canvas = pygame.Surface((w, h), pygame.SRCALPHA)
+            frame_t = bucket * _BREATH_CYCLE_MS / WIZARD_BREATH_FRAMES
+            tip_x, tip_y = _render_wizard_pose(canvas, ax, ay, facing_right, wand_color, frame_t)
+            bounds = canvas.get_bounding_rect()
+            frame = _to_display_format(canvas.subsurface(bounds).copy(), alpha=True)
+            entry = (frame, (bounds.x - ax, bounds.y - ay), (tip_x - ax, tip_y - ay))
+        _WIZARD_FRAMES[key] = entry
+    return entry
+
+def _get_wizard_aura(wand_color, radius, scale=1.0):
+    key = (tuple(wand_color[:3]), radius, scale)
+    stamp = _WIZARD_AURA_STAMPS.get(key)
+    if stamp is None:
+        stamp = pygame.Surface((100, 100), pygame.SRCALPHA)
+        r, g, b = wand_color[:3]
+        pygame.draw.circle(stamp, (r, g, b, 50), (50, 50), radius)
+        if scale != 1.0:
+            stamp = pygame.transform.scale(stamp, (int(100 * scale), int(100 * scale)))
+        stamp = _to_display_format(stamp, alpha=True)
+        _WIZARD_AURA_STAMPS[key] = stamp
+    return stamp
+
+def _draw_wizard_composite(surface, x, y, facing_right, is_casting, wand_color, scale=1.0):
+    """Aura stamp + cached body frame + live crystal/sparks. (x, y) are the feet."""
+    t = pygame.time.get_ticks()
+
+    # --- Aura (Epic Effect) ---
+    if is_casting or wand_color != (255, 255, 255):
+        # Pulsing aura
+        aura_radius = int(40 + math.sin(t/200) * 5)
+        aura = _get_wizard_aura(wand_color, aura_radius, scale)
+        surface.blit(aura, (x - 50 * scale, y - 70 * scale))
+
+    frame, (ox, oy), (tip_ox, tip_oy) = _get_wizard_frame(facing_right, is_casting, wand_color, t, scale)
+    surface.blit(frame, (x + ox, y + oy))
+    top_x = x + tip_ox
+    top_y = y + tip_oy
+
+    # Crystal
+    crystal_glow = wand_color
+    pulse = (math.sin(t/150) + 1) * 3 # 0 to 6
+    if is_casting: pulse += 5
+    
+    pygame.draw.circle(surface, crystal_glow, (top_x, top_y), (6 + int(pulse/2)) * scale)
+    pygame.draw.circle(surface, (255, 255, 255), (top_x, top_y), 4 * scale)
+    
+    # Floating Particles around staff
+    if is_casting:
+        for _ in range(3):
+            rx = top_x + vfx_rng.randint(-15, 15) * scale
+            ry = top_y + vfx_rng.randint(-15, 15) * scale
+            pygame.draw.circle(surface, crystal_glow, (rx, ry), 2 * scale)
+
+    return (top_x, top_y) # Exact tip position
 
 def draw_wizard(surface, x, y, facing_right, is_casting=False, wand_color=(255, 255, 255)):
     """Draws a much more detailed Wizard."""
+    return _draw_wizard_composite(surface, x, y, facing_right, is_casting, wand_color)
+
+def _render_wizard_pose(surface, x, y, facing_right, wand_color, t):
+    """Paints the wizard body (cape to staff claw) for animation time t."""
     
     # Body Colors with gradients (simulated by layering)
     robe_base = (0, 0, 180)
@@ -15,17 +156,7 @@ def draw_wizard(surface, x, y, facing_right, is_casting=False, wand_color=(255,
     direction = 1 if facing_right else -1
     
     # Animation: Breathing/Idle
-    t = pygame.time.get_ticks()
     breath = math.sin(t / 500) * 3
-    
-    # --- Aura (Epic Effect) ---
-    if is_casting or wand_color != (255, 255, 255):
-        # Draw pulsing aura
-        aura_radius = 40 + math.sin(t/200) * 5
-        s = pygame.Surface((100, 100), pygame.SRCALPHA)
-        r, g, b = wand_color[:3]
-        pygame.draw.circle(s, (r, g, b, 50), (50, 50), aura_radius)
-        surface.blit(s, (x - 50, y - 50 - 20))
 
     # --- Cape (Flowing) ---
     cape_points = [
@@ -108,64 +239,45 @@ def draw_wizard(surface, x, y, facing_right, is_casting=False, wand_color=(255,
     top_y = staff_y - 40
     pygame.draw.circle(surface, (200, 200, 200), (top_x, top_y + 5), 6) # Metal ring
     
-    # Crystal
-    crystal_glow = wand_color
-    pulse = (math.sin(t/150) + 1) * 3 # 0 to 6
-    if is_casting: pulse += 5
-    
-    pygame.draw.circle(surface, crystal_glow, (top_x, top_y), 6 + int(pulse/2))
-    pygame.draw.circle(surface, (255, 255, 255), (top_x, top_y), 4)
-    
-    # Floating Particles around staff
-    if is_casting:
-        for _ in range(3):
-            rx = top_x + random.randint(-15, 15)
-            ry = top_y + random.randint(-15, 15)
-            pygame.draw.circle(surface, crystal_glow, (rx, ry), 2)
-
-    return (top_x, top_y) # Exact tip position
+    return (top_x, top_y) # Crystal position
 
 def draw_scaled_wizard(surface, x, y, scale=1.0):
     """Draws the wizard scaled up for menus/intros."""
-    w, h = 300, 300
-    s = pygame.Surface((w, h), pygame.SRCALPHA)
-    
-    # Draw at center of temp surface
-    # Feet at 280 (leaving room). Center X at 150.
+    # Feet sit 20px (unscaled) above the bottom edge, as on the old 300x300 canvas.
     # Wand Color: RED FIRE (255, 69, 0)
-    draw_wizard(s, 150, 280, facing_right=True, is_casting=True, wand_color=(255, 69, 0))
-    
-    if scale != 1.0:
-        s = pygame.transform.scale(s, (int(w*scale), int(h*scale)))
-        
-    rect = s.get_rect(midbottom=(x, y))
-    surface.blit(s, rect)
+    _draw_wizard_composite(surface, x, y - 20 * scale, True, True, (255, 69, 0), scale)
+
 
+# Palette & weapon per monster body type (shared by draw_* and the frame atlas)
+_MONSTER_STYLES = {
+    "OGRE": {"skin_color": (80, 150, 50), "outfit_color": (120, 65, 20), "weapon": "CLUB"},
+    "GOBLIN": {"skin_color": (150, 200, 50), "outfit_color": (100, 50, 50), "weapon": "DAGGER", "is_goblin": True},
+    "TROLL": {"skin_color": (100, 100, 120), "outfit_color": (50, 50, 50), "weapon": "ROCK"},
+}
+_MONSTER_STYLES["OGRE_KING"] = _MONSTER_STYLES["OGRE"]
 
 def draw_ogre(surface, x, y, facing_right, scale=1.0, tick=0, is_attacking=False, attack_phase=0.0):
     """Draws a Green Ogre with rich tones."""
-    _draw_monster_base(surface, x, y, facing_right, scale, 
-                       skin_color=(80, 150, 50), 
-                       outfit_color=(120, 65, 20), 
-                       weapon="CLUB", tick=tick, is_attacking=is_attacking, attack_phase=attack_phase)
+    _draw_monster_base(surface, x, y, facing_right, scale, tick=tick, is_attacking=is_attacking,
+                       attack_phase=attack_phase, **_MONSTER_STYLES["OGRE"])
 
 def draw_goblin(surface, x, y, facing_right, scale=0.8, tick=0, is_attacking=False, attack_phase=0.0):
     """Draws a small, fast Goblin."""
-    _draw_monster_base(surface, x, y, facing_right, scale, 
-                       skin_color=(150, 200, 50), 
-                       outfit_color=(100, 50, 50), 
-                       weapon="DAGGER",
-                       is_goblin=True, tick=tick, is_attacking=is_attacking, attack_phase=attack_phase)
+    _draw_monster_base(surface, x, y, facing_right, scale, tick=tick, is_attacking=is_attacking,
+                       attack_phase=attack_phase, **_MONSTER_STYLES["GOBLIN"])
 
 def draw_troll(surface, x, y, facing_right, scale=1.3, tick=0, is_attacking=False, attack_phase=0.0):
     """Draws a large, regenerating Troll."""
-    _draw_monster_base(surface, x, y, facing_right, scale, 
-                       skin_color=(100, 100, 120), 
-                       outfit_color=(50, 50, 50), 
-                       weapon="ROCK", tick=tick, is_attacking=is_attacking, attack_phase=attack_phase)
+    _draw_monster_base(surface, x, y, facing_right, scale, tick=tick, is_attacking=is_attacking,
+                       attack_phase=attack_phase, **_MONSTER_STYLES["TROLL"])
 
 def draw_skeleton(surface, x, y, facing_right, scale=1.0, tick=0, is_attacking=False, attack_phase=0.0):
     """Draws a detailed Skeleton Archer with articulated bones, hood, and quiver."""
+    s = _render_skeleton_canvas(facing_right, scale, tick, is_attacking, attack_phase)
+    surface.blit(s, s.get_rect(midbottom=(x, y)))
+
+def _render_skeleton_canvas(facing_right, scale=1.0, tick=0, is_attacking=False, attack_phase=0.0):
+    """Paints the Skeleton Archer on its own canvas (feet at the bottom centre)."""
     direction = 1 if facing_right else -1
     
     w, h = 300, 300 
@@ -387,13 +499,18 @@ def draw_skeleton(surface, x, y, facing_right, scale=1.0, tick=0, is_attacking=F
         pygame.draw.line(s, (100, 100, 100), (arrow_end[0], arrow_end[1] - 3), (arrow_end[0] + 4 * (-direction), arrow_end[1] - 5), 1)
         pygame.draw.line(s, (100, 100, 100), (arrow_end[0], arrow_end[1] + 3), (arrow_end[0] + 4 * (-direction), arrow_end[1] + 5), 1)
 
-    # Scale & Blit
+    # Scale
     if scale != 1.0:
         s = pygame.transform.scale(s, (int(w*scale), int(h*scale)))
     
-    surface.blit(s, s.get_rect(midbottom=(x, y)))
+    return s
 
 def _draw_monster_base(surface, x, y, facing_right, scale, skin_color, outfit_color, weapon, is_goblin=False, tick=0, is_attacking=False, attack_phase=0.0):
+    s = _render_monster_canvas(facing_right, scale, skin_color, outfit_color, weapon, is_goblin, tick, is_attacking, attack_phase)
+    surface.blit(s, s.get_rect(midbottom=(x, y)))
+
+def _render_monster_canvas(facing_right, scale, skin_color, outfit_color, weapon, is_goblin=False, tick=0, is_attacking=False, attack_phase=0.0):
+    """Paints an ogre-type monster on its own canvas (feet at the bottom centre)."""
     direction = 1 if facing_right else -1
     
     # Increase canvas size
@@ -680,67 +797,290 @@ def _draw_monster_base(surface, x, y, facing_right, scale, skin_color, outfit_co
         # Detail
         pygame.draw.circle(s, (60, 50, 50), (hand_x - 5, hand_y + 10), 8)
 
-    # Scale & Blit
+    # Scale
     if scale != 1.0:
         s = pygame.transform.scale(s, (int(w*scale), int(h*scale)))
     
-    surface.blit(s, s.get_rect(midbottom=(x, y)))
+    return s
+
+# --- ENEMY FRAME ATLAS ---
+# Enemy poses are baked lazily into frames keyed by
+# (type, facing, walking/attacking, phase bucket, scale), so drawing an
+# enemy is a single blit instead of a fresh canvas full of primitives.
+ENEMY_ANIM_FRAMES = 12
+_WALK_CYCLE_MS = 2 * math.pi * 150 # One stride (legs use sin(tick / 150))
+_ENEMY_FRAME_ATLAS = {}
+
+# Draw scale per enemy type (same as the draw_* defaults / Enemy.draw)
+ENEMY_DRAW_SCALES = {
+    "OGRE": 1.0,
+    "GOBLIN": 0.8,
+    "TROLL": 1.3,
+    "SKELETON_ARCHER": 1.0,
+    "OGRE_KING": 2.5,
+}
+
+def _enemy_frame_count(scale):
+    # Huge sprites (Ogre King) get half the frames to keep atlas memory bounded
+    return ENEMY_ANIM_FRAMES if scale <= 1.5 else ENEMY_ANIM_FRAMES // 2
+
+def _bake_enemy_frame(enemy_type, facing_right, is_attacking, bucket, scale):
+    frames = _enemy_frame_count(scale)
+    # Representative tick / phase at the start of the bucket
+    tick = bucket * _WALK_CYCLE_MS / frames
+    attack_phase = bucket / frames if is_attacking else 0.0
+
+    if enemy_type == "SKELETON_ARCHER":
+        canvas = _render_skeleton_canvas(facing_right, scale, tick, is_attacking, attack_phase)
+    else:
+        style = _MONSTER_STYLES[enemy_type]
+        canvas = _render_monster_canvas(facing_right, scale, tick=tick, is_attacking=is_attacking,
+                                        attack_phase=attack_phase, **style)
+
+    # Crop to the drawn pixels, remember the offset from the feet (midbottom)
+    bounds = canvas.get_bounding_rect()
+    frame = _to_display_format(canvas.subsurface(bounds).copy(), alpha=True)
+    offset = (bounds.x - canvas.get_width() // 2, bounds.y - canvas.get_height())
+    return frame, offset
+
+def get_enemy_frame(enemy_type, facing_right, is_attacking, tick, attack_phase=0.0, scale=None):
+    """Returns (frame, (ox, oy)) for an enemy pose; blit it at (centerx + ox, bottom + oy)."""
+    if scale is None:
+        scale = ENEMY_DRAW_SCALES[enemy_type]
+    frames = _enemy_frame_count(scale)
+
+    if is_attacking:
+        bucket = min(frames - 1, int(attack_phase * frames))
+    else:
+        bucket = int((tick % _WALK_CYCLE_MS) / _WALK_CYCLE_MS * frames) % frames
+
+    key = (enemy_type, facing_right, is_attacking, bucket, scale)
+    entry = _ENEMY_FRAME_ATLAS.get(key)
+    if entry is None:
+        entry = _bake_enemy_frame(enemy_type, facing_right, is_attacking, bucket, scale)
+        _ENEMY_FRAME_ATLAS[key] = entry
+    return entry
+
+def warm_enemy_atlas(enemy_types=("OGRE", "GOBLIN", "TROLL", "SKELETON_ARCHER")):
+    """Bakes every frame of the given enemy types up front (avoids mid-wave hitches)."""
+    for enemy_type in enemy_types:
+        scale = ENEMY_DRAW_SCALES[enemy_type]
+        frames = _enemy_frame_count(scale)
+        for facing_right in (False, True):
+            for is_attacking in (False, True):
+                for bucket in range(frames):
+                    key = (enemy_type, facing_right, is_attacking, bucket, scale)
+                    if key not in _ENEMY_FRAME_ATLAS:
+                        _ENEMY_FRAME_ATLAS[key] = _bake_enemy_frame(enemy_type, facing_right, is_attacking, bucket, scale)
+
+# --- GLOW STAMP LIBRARY ---
+# Radial glows (trail sparks, hit particles, projectile halos, impact flares)
+# are concentric circles pre-rendered once per layer set and blitted, instead
+# of allocating an SRCALPHA surface and drawing circles per particle per frame.
+# Alphas are quantized so fading particles share a handful of stamps.
+GLOW_ALPHA_STEP = 16
+_GLOW_CACHE_MAX = 4096
+_GLOW_STAMPS = {}
+
+def _quantize_alpha(alpha):
+    return max(0, min(255, int(alpha / GLOW_ALPHA_STEP + 0.5) * GLOW_ALPHA_STEP))
+
+def get_glow_stamp(layers):
+    """
+    Returns a stamp for concentric circles painted outer-first.
+    layers: sequence of (color, radius) or (color, radius, width); colour is RGB or RGBA.
+    The stamp is square and centred at (radius + 1) of its largest layer.
+    """
+    key = []
+    for layer in layers:
+        col = layer[0]
+        alpha = _quantize_alpha(col[3]) if len(col) > 3 else 255
+        width = layer[2] if len(layer) > 2 else 0
+        key.append(((col[0], col[1], col[2], alpha), max(0, int(layer[1])), width))
+    key = tuple(key)
 
-def draw_projectile(surface, x, y, color=WHITE, particles=None, scale=1.0, p_type="DEFAULT"):
+    stamp = _GLOW_STAMPS.get(key)
+    if stamp is None:
+        half = max(radius for _, radius, _ in key) + 1
+        stamp = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        for col, radius, width in key:
+            if col[3] > 0 and radius > 0:
+                pygame.draw.circle(stamp, col, (half, half), radius, width)
+        stamp = _to_display_format(stamp, alpha=True)
+        if len(_GLOW_STAMPS) >= _GLOW_CACHE_MAX:
+            _GLOW_STAMPS.clear()
+        _GLOW_STAMPS[key] = stamp
+    return stamp
+
+def blit_glow(surface, center, layers):
+    """Blits the glow stamp for `layers` centred on `center`."""
+    stamp = get_glow_stamp(layers)
+    half = stamp.get_width() // 2
+    surface.blit(stamp, (center[0] - half, center[1] - half))
+
+def draw_projectile(surface, x, y, color=WHITE, scale=1.0, p_type="DEFAULT"):
     """Draws ULTRA-PREMIUM projectile visualization with cinematic effects."""
     
     t = pygame.time.get_ticks()
     
-    # --- PARTICLE TRAIL (Per-type color gradients) ---
-    if particles:
-        for p in particles:
-             px, py, vx, vy, life, max_life, size = p
-             alpha = int((life / max_life) * 220)
-             if alpha <= 0: continue
-             
-             progress = 1.0 - (life / max_life)
-             
-             if p_type == "FIRE_RING":
-                 # Molten lava gradient
-                 if progress < 0.15: col = (255, 255, 200)
-                 elif progress < 0.3: col = (255, 200, 50)
-                 elif progress < 0.5: col = (255, 120, 0)
-                 elif progress < 0.75: col = (200, 40, 0)
-                 else: col = (80, 20, 0)
-             elif p_type == "VOID_LANCE":
-                 # Dark energy dissipation
-                 if progress < 0.2: col = (200, 150, 255)
-                 elif progress < 0.5: col = (120, 0, 220)
-                 elif progress < 0.8: col = (60, 0, 120)
-                 else: col = (20, 0, 40)
-             elif p_type == "ARCANE_VOLLEY":
-                 # Arcane sparkle decay
-                 if progress < 0.2: col = (220, 200, 255)
-                 elif progress < 0.5: col = (180, 80, 255)
-                 elif progress < 0.8: col = (100, 30, 200)
-                 else: col = (40, 10, 80)
-             else: # Default fireball
-                if progress < 0.1: col = (255, 255, 240)
-                elif progress < 0.25: col = (255, 255, 100)
-                elif progress < 0.45: col = (255, 180, 0)
-                elif progress < 0.65: col = (255, 80, 0)
-                elif progress < 0.85: col = (180, 30, 0)
-                else: col = (60, 60, 60)
-             
-             p_size = max(1, int(size))
-             s = pygame.Surface((p_size*2+2, p_size*2+2), pygame.SRCALPHA)
-             
-             # Glow halo behind particle
-             glow_alpha = max(0, min(255, alpha // 2))
-             glow_col = (col[0], col[1], col[2], glow_alpha)
-             pygame.draw.circle(s, glow_col, (p_size+1, p_size+1), p_size+1)
-             
-             # Core particle
-             core_col = (min(255, col[0]+30), min(255, col[1]+30), min(255, col[2]+30), min(255, alpha))
-             pygame.draw.circle(s, core_col, (p_size+1, p_size+1), max(1, p_size-1))
-             
-             surface.blit(s, (px - p_size - 1, py - p_size - 1))
+    # --- CORE (one blit from the projectile atlas) ---
+    frame, (ox, oy) = get_projectile_frame(p_type, scale, t)
+    surface.blit(frame, (x + ox, y + oy))
+
+    if p_type not in ("FIRE_RING", "VOID_LANCE", "ARCANE_VOLLEY"):
+        base_radius = 18 * scale
+        
+        # Orbiting embers (reseeded every 25ms, so drawn live)
+        scenery_rng.seed(int(t / 25))
+        for i in range(int(4 * scale)):
+            ember_ang = t / 20 + i * 1.5 + scenery_rng.random()
+            ember_dist = base_radius * (0.8 + scenery_rng.random() * 0.6)
+            ex = x + int(math.cos(ember_ang) * ember_dist)
+            ey = y + int(math.sin(ember_ang) * ember_dist)
+            ember_size = max(1, int(2 * scale + scenery_rng.random() * 2))
+            
+            blit_glow(surface, (ex, ey), (((255, 255, 100, 200), ember_size), ((255, 200, 50, 150), ember_size+1)))
+
+# --- PARTICLE RENDERING ---
+# Particles come from the struct-of-arrays engine in src.particles; colours,
+# alphas and radii are computed per kind with NumPy, then every row is one
+# glow-stamp blit submitted through Surface.blits.
+
+# Trail palettes indexed by TRAIL_STYLES: (age thresholds, colours)
+TRAIL_PALETTES = (
+    # Default fireball
+    ((0.1, 0.25, 0.45, 0.65, 0.85), ((255, 255, 240), (255, 255, 100), (255, 180, 0), (255, 80, 0), (180, 30, 0), (60, 60, 60))),
+    # FIRE_RING: molten lava gradient
+    ((0.15, 0.3, 0.5, 0.75), ((255, 255, 200), (255, 200, 50), (255, 120, 0), (200, 40, 0), (80, 20, 0))),
+    # VOID_LANCE: dark energy dissipation
+    ((0.2, 0.5, 0.8), ((200, 150, 255), (120, 0, 220), (60, 0, 120), (20, 0, 40))),
+    # ARCANE_VOLLEY: arcane sparkle decay
+    ((0.2, 0.5, 0.8), ((220, 200, 255), (180, 80, 255), (100, 30, 200), (40, 10, 80))),
+)
+
+def _quantize_alphas(alpha):
+    """Vectorized _quantize_alpha."""
+    return np.clip((alpha / GLOW_ALPHA_STEP + 0.5).astype(np.int32) * GLOW_ALPHA_STEP, 0, 255)
+
+def _blit_stamp_rows(surface, xs, ys, keys, make_layers):
+    """One blit per row; stamps are looked up once per distinct key."""
+    stamps = {}
+    blits = []
+    for x, y, key in zip(xs.tolist(), ys.tolist(), keys):
+        entry = stamps.get(key)
+        if entry is None:
+            stamp = get_glow_stamp(make_layers(key))
+            entry = stamps[key] = (stamp, stamp.get_width() // 2)
+        blits.append((entry[0], (x - entry[1], y - entry[1])))
+    surface.blits(blits, False)
+
+def draw_trail_particles(surface, system):
+    """Projectile trails: per-type colour by age, glow halo plus brighter core."""
+    idx = system.view(KIND_TRAIL)
+    if idx.size == 0:
+        return
+    ratio = system.life[idx] / system.max_life[idx]
+    alpha = (ratio * 220).astype(np.int32)
+    progress = 1.0 - ratio
+
+    col = np.zeros((idx.size, 3), dtype=np.int32)
+    styles = system.style[idx]
+    for style, (thresholds, colours) in enumerate(TRAIL_PALETTES):
+        mask = styles == style
+        if mask.any():
+            col[mask] = np.array(colours)[np.searchsorted(thresholds, progress[mask], side="right")]
+
+    p_size = np.maximum(1, system.size[idx].astype(np.int32))
+    glow_a = _quantize_alphas(np.clip(alpha // 2, 0, 255))
+    core_a = _quantize_alphas(np.minimum(255, alpha))
+    keys = zip(col[:, 0].tolist(), col[:, 1].tolist(), col[:, 2].tolist(),
+               glow_a.tolist(), core_a.tolist(), p_size.tolist())
+
+    def layers(key):
+        r, g, b, ga, ca, size = key
+        return (((r, g, b, ga), size + 1),
+                ((min(255, r + 30), min(255, g + 30), min(255, b + 30), ca), max(1, size - 1)))
+
+    _blit_stamp_rows(surface, system.x[idx], system.y[idx], list(keys), layers)
+
+def draw_spark_particles(surface, system):
+    """Hit and kill feedback: flat discs fading out with life."""
+    idx = system.view(KIND_SPARK)
+    if idx.size == 0:
+        return
+    alpha = _quantize_alphas((system.life[idx] / system.max_life[idx] * 255).astype(np.int32))
+    col = system.color[idx]
+    keys = zip(col[:, 0].tolist(), col[:, 1].tolist(), col[:, 2].tolist(),
+               alpha.tolist(), system.size[idx].astype(np.int32).tolist())
+
+    def layers(key):
+        r, g, b, a, size = key
+        return (((r, g, b, a), size),)
+
+    _blit_stamp_rows(surface, system.x[idx], system.y[idx], list(keys), layers)
+
+# --- PROJECTILE ATLAS ---
+# Projectile bodies are baked into frames keyed by (type, scale bucket, frame).
+# Each type loops over a cycle covering all of its oscillators, with about one
+# baked frame per 60 FPS game frame so spins and pulses look unchanged.
+_PROJECTILE_ANIM = {
+    # type: (cycle in ms, frames per cycle)
+    "FIRE_RING": (2 * math.pi * 240, 90),   # rot t/40 (12-fold), rot2 t/60 (8-fold), t/60, t/80
+    "VOID_LANCE": (2 * math.pi * 30, 12),   # tendrils and pulse at t/30
+    "ARCANE_VOLLEY": (2 * math.pi * 600, 225), # t/40, t/60, t/25, t/50
+    "DEFAULT": (2 * math.pi * 90, 34),      # pulse t/45, flame bumps t/30
+}
+PROJECTILE_SCALE_STEP = 0.25
+_PROJECTILE_ATLAS = {}
+
+def get_projectile_frame(p_type, scale, t):
+    """Returns (frame, (ox, oy)) for a projectile body, offsets relative to its centre."""
+    cycle, frames = _PROJECTILE_ANIM.get(p_type, _PROJECTILE_ANIM["DEFAULT"])
+    scale = max(PROJECTILE_SCALE_STEP, round(scale / PROJECTILE_SCALE_STEP) * PROJECTILE_SCALE_STEP)
+    index = int((t % cycle) / cycle * frames) % frames
+    key = (p_type, scale, index)
+    entry = _PROJECTILE_ATLAS.get(key)
+    if entry is None:
+        half = int(100 * scale)
+        canvas = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        _paint_projectile_core(canvas, half, half, scale, p_type, index * cycle / frames)
+        bounds = canvas.get_bounding_rect()
+        frame = _to_display_format(canvas.subsurface(bounds).copy(), alpha=True)
+        entry = (frame, (bounds.x - half, bounds.y - half))
+        _PROJECTILE_ATLAS[key] = entry
+    return entry
+
+# --- ARROW FRAMES ---
+# Arrows are one grey shaft rotated to their flight angle. Frames are baked
+# per ARROW_ANGLE_STEP degrees; the hitbox keeps the exact rotated size.
+ARROW_SIZE = (30, 5)
+ARROW_ANGLE_STEP = 3
+_ARROW_FRAMES = {}
+
+def rotated_size(w, h, angle):
+    """Size of pygame.transform.rotate's output for a w x h surface, without rotating one."""
+    if not math.fmod(angle, 90.0):
+        return (h, w) if int(angle) % 180 else (w, h)
+    rad = math.radians(angle)
+    c, s = math.cos(rad), math.sin(rad)
+    return (int(max(abs(c * w + s * h), abs(c * w - s * h))),
+            int(max(abs(s * w + c * h), abs(s * w - c * h))))
 
+def get_arrow_frame(angle):
+    """Arrow sprite rotated to `angle` degrees (counter-clockwise, 0 = pointing right)."""
+    key = round(angle / ARROW_ANGLE_STEP) * ARROW_ANGLE_STEP % 360
+    frame = _ARROW_FRAMES.get(key)
+    if frame is None:
+        shaft = pygame.Surface(ARROW_SIZE, pygame.SRCALPHA)
+        shaft.fill((200, 200, 200)) # Grey Arrow Shaft
+        pygame.draw.circle(shaft, (150, 150, 150), (30, 2), 4) # Tip
+        frame = _to_display_format(pygame.transform.rotate(shaft, key), alpha=True)
+        _ARROW_FRAMES[key] = frame
+    return frame
+
+def _paint_projectile_core(surface, x, y, scale, p_type, t):
+    """Paints one projectile body (everything but trail and embers) at time t."""
+    
     if p_type == "FIRE_RING":
         # === INFERNO RING - Rotating double-ring with flame tongues ===
         ring_radius = 22 * scale 
@@ -905,15 +1245,13 @@ def draw_projectile(surface, x, y, color=WHITE, particles=None, scale=1.0, p_typ
         
         # 1. Massive soft outer glow (heat distortion)
         radius_outer = base_radius + pulse + 6
-        glow_size = int(radius_outer * 4)
-        s_glow = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-        gcx, gcy = glow_size // 2, glow_size // 2
         
         # Three-layer glow
-        pygame.draw.circle(s_glow, (255, 50, 0, 25), (gcx, gcy), int(radius_outer * 1.6))
-        pygame.draw.circle(s_glow, (255, 100, 0, 45), (gcx, gcy), int(radius_outer * 1.2))
-        pygame.draw.circle(s_glow, (255, 150, 0, 70), (gcx, gcy), int(radius_outer * 0.9))
-        surface.blit(s_glow, (x - glow_size//2, y - glow_size//2))
+        blit_glow(surface, (x, y), (
+            ((255, 50, 0, 25), int(radius_outer * 1.6)),
+            ((255, 100, 0, 45), int(radius_outer * 1.2)),
+            ((255, 150, 0, 70), int(radius_outer * 0.9)),
+        ))
         
         # 2. Fire body (main flame shape)
         flame_size = int(base_radius * 3.5)
@@ -951,45 +1289,91 @@ def draw_projectile(surface, x, y, color=WHITE, particles=None, scale=1.0, p_typ
         
         # 3. Plasma core (white-hot center)
         core_r = max(1, int(5 * scale + pulse * 0.3))
-        s_core = pygame.Surface((core_r*4, core_r*4), pygame.SRCALPHA)
-        pygame.draw.circle(s_core, (255, 255, 200, 250), (core_r*2, core_r*2), core_r + 2)
-        pygame.draw.circle(s_core, (255, 255, 255), (core_r*2, core_r*2), core_r)
-        surface.blit(s_core, (x - core_r*2, y - core_r*2))
-        
-        # 4. Orbiting embers
-        random.seed(int(t / 25))
-        for i in range(int(4 * scale)):
-            ember_ang = t / 20 + i * 1.5 + random.random()
-            ember_dist = base_radius * (0.8 + random.random() * 0.6)
-            ex = x + int(math.cos(ember_ang) * ember_dist)
-            ey = y + int(math.sin(ember_ang) * ember_dist)
-            ember_size = max(1, int(2 * scale + random.random() * 2))
-            
-            s_ember = pygame.Surface((ember_size*2+2, ember_size*2+2), pygame.SRCALPHA)
-            pygame.draw.circle(s_ember, (255, 255, 100, 200), (ember_size+1, ember_size+1), ember_size)
-            pygame.draw.circle(s_ember, (255, 200, 50, 150), (ember_size+1, ember_size+1), ember_size+1)
-            surface.blit(s_ember, (ex - ember_size-1, ey - ember_size-1))
+        blit_glow(surface, (x, y), (((255, 255, 200, 250), core_r + 2), ((255, 255, 255), core_r)))
 
-def draw_background_scenery(surface, biome, width, height, scroll_x=0):
-    """Draws CINEMATIC biome backgrounds with atmospheric depth and detail."""
-    
-    # Helper for gradients
-    def draw_gradient(surf, color_top, color_bot, rect):
-        h = rect.height
-        for i in range(h):
-            alpha = i / h
-            r = int(color_top[0] * (1 - alpha) + color_bot[0] * alpha)
-            g = int(color_top[1] * (1 - alpha) + color_bot[1] * alpha)
-            b = int(color_top[2] * (1 - alpha) + color_bot[2] * alpha)
-            pygame.draw.line(surf, (r, g, b), (rect.x, rect.y + i), (rect.x + rect.width, rect.y + i))
-            
-    if biome == "FOREST":
+# --- SCREEN OVERLAYS ---
+# Flat full-screen tints (hit flashes, darkening, heat, strobes) reuse one
+# opaque surface per (size, colour); the alpha is applied per use with
+# set_alpha, so a flash costs a blit and no allocation.
+_OVERLAYS = {}
+
+def draw_overlay(surface, color, alpha=None):
+    """Tints the whole surface with an RGB colour at `alpha` (or with an RGBA colour)."""
+    if alpha is None:
+        alpha = color[3] if len(color) > 3 else 255
+    if alpha <= 0:
+        return
+    size = surface.get_size()
+    key = (size, tuple(color[:3]))
+    overlay = _OVERLAYS.get(key)
+    if overlay is None:
+        overlay = pygame.Surface(size)
+        overlay.fill(color[:3])
+        overlay = _to_display_format(overlay)
+        _OVERLAYS[key] = overlay
+    overlay.set_alpha(alpha)
+    surface.blit(overlay, (0, 0))
+
+# --- BACKGROUND CACHE ---
+# Most of a biome never moves: sky gradients, mountains, trees, rocks and cracks.
+# Those parts are painted once per (biome, width, height) into display-format
+# layers; only the time-animated parts are drawn on top every frame.
+_BACKGROUND_CACHE = {}
+
+def _bake_layer(width, height, paint, opaque=False):
+    """Runs a painter once and returns (surface, pos), cropped to what it drew."""
+    if opaque:
+        canvas = pygame.Surface((width, height))
+        paint(canvas)
+        return _to_display_format(canvas), (0, 0)
+
+    canvas = pygame.Surface((width, height), pygame.SRCALPHA)
+    paint(canvas)
+    bounds = canvas.get_bounding_rect()
+    return _to_display_format(canvas.subsurface(bounds).copy(), alpha=True), bounds.topleft
+
+# --- GRADIENTS ---
+_GRADIENT_CACHE = {}
+
+def build_gradient(color_top, color_bot, size):
+    """
+    Returns a cached vertical gradient surface of `size` (w, h).
+    The ramp is computed with NumPy into a 1px column which is then stretched.
+    RGB colours give an opaque surface (set_alpha() works on it); RGBA colours
+    give a per-pixel alpha ramp.
+    """
+    key = (tuple(color_top), tuple(color_bot), tuple(size))
+    grad = _GRADIENT_CACHE.get(key)
+    if grad is None:
+        w, h = max(1, int(size[0])), max(1, int(size[1]))
+        t = (np.arange(h) / h)[:, None]
+        ramp = (np.array(color_top, dtype=float) * (1 - t) + np.array(color_bot, dtype=float) * t).astype(np.uint8)
+
+        has_alpha = len(color_top) > 3
+        column = pygame.Surface((1, h), pygame.SRCALPHA if has_alpha else 0)
+        pygame.surfarray.blit_array(column, ramp[None, :, :3])
+        if has_alpha:
+            alpha = pygame.surfarray.pixels_alpha(column)
+            alpha[0, :] = ramp[:, 3]
+            del alpha # Unlock the surface
+
+        grad = _to_display_format(pygame.transform.scale(column, (w, h)), alpha=has_alpha)
+        _GRADIENT_CACHE[key] = grad
+    return grad
+
+def _draw_gradient(surf, color_top, color_bot, rect):
+    """Vertical two-colour gradient over rect."""
+    surf.blit(build_gradient(color_top, color_bot, rect.size), rect.topleft)
+
+def _bake_forest_layers(width, height):
+    sun_x, sun_y = width - 150, 90
+
+    def paint_sky(surface):
         # 1. Layered Sky (Golden hour gradient)
-        draw_gradient(surface, (25, 80, 160), (120, 180, 230), pygame.Rect(0, 0, width, height // 2))
-        draw_gradient(surface, (120, 180, 230), (180, 220, 200), pygame.Rect(0, height // 2, width, height // 2))
-        
+        _draw_gradient(surface, (25, 80, 160), (120, 180, 230), pygame.Rect(0, 0, width, height // 2))
+        _draw_gradient(surface, (120, 180, 230), (180, 220, 200), pygame.Rect(0, height // 2, width, height // 2))
+
         # Sun (Larger with corona)
-        sun_x, sun_y = width - 150, 90
         # Corona layers
         corona_s = pygame.Surface((250, 250), pygame.SRCALPHA)
         pygame.draw.circle(corona_s, (255, 200, 100, 15), (125, 125), 120)
@@ -1001,57 +1385,46 @@ def draw_background_scenery(surface, biome, width, height, scroll_x=0):
         flare_s = pygame.Surface((30, 30), pygame.SRCALPHA)
         pygame.draw.circle(flare_s, (255, 255, 255, 180), (15, 15), 15)
         surface.blit(flare_s, (sun_x - 15, sun_y - 15))
-        
-        # God Rays (Animated)
-        ray_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        t_ray = pygame.time.get_ticks() / 1000
-        for i in range(7):
-            start_x = sun_x
-            start_y = sun_y
-            end_x = width - 400 - (i * 180) + math.sin(t_ray + i) * 25
-            ray_w = 80 + i * 15
-            poly = [(start_x, start_y), (end_x, height), (end_x + ray_w, height)]
-            pygame.draw.polygon(ray_surface, (255, 255, 200, 15), poly)
-        surface.blit(ray_surface, (0, 0))
 
+    def paint_land(surface):
         # 2. Far Mountains (Layered depth)
         # Layer 1 - Very far (purple-blue)
-        random.seed(10)
+        scenery_rng.seed(10)
         for i in range(0, width, 150):
-            h_mount = 180 + random.randint(0, 60) + int(math.sin(i / 350) * 70)
+            h_mount = 180 + scenery_rng.randint(0, 60) + int(math.sin(i / 350) * 70)
             points = [(i - 20, height), (i + 170, height), (i + 75, height - h_mount)]
             pygame.draw.polygon(surface, (70, 65, 110), points)
             # Snow cap
             pygame.draw.polygon(surface, (180, 180, 200), [
                 (i + 55, height - h_mount + 30), (i + 95, height - h_mount + 30), (i + 75, height - h_mount)
             ])
-        
+
         # Layer 2 - Mid mountains (darker)
-        random.seed(11)
+        scenery_rng.seed(11)
         for i in range(0, width, 120):
-            h_mount = 130 + random.randint(0, 50)
+            h_mount = 130 + scenery_rng.randint(0, 50)
             points = [(i - 10, height), (i + 130, height), (i + 60, height - h_mount)]
             pygame.draw.polygon(surface, (55, 75, 95), points)
 
         # 3. Dense Trees (Multi-layered canopies)
-        random.seed(42)
+        scenery_rng.seed(42)
         tree_colors = [(15, 55, 18), (20, 65, 22), (25, 70, 25), (18, 60, 20)]
         for i in range(-50, width, 70):
             h_t = 170 + (i % 80)
             tc = tree_colors[i % len(tree_colors)]
             tc_light = (min(255, tc[0] + 20), min(255, tc[1] + 25), min(255, tc[2] + 20))
-            
+
             # Trunk with bark texture
             trunk_x = i + 20
             pygame.draw.rect(surface, (50, 35, 18), (trunk_x, height - h_t, 12, h_t))
             # Bark lines
             for bark in range(0, h_t, 12):
                 pygame.draw.line(surface, (35, 25, 12), (trunk_x + 2, height - h_t + bark), (trunk_x + 10, height - h_t + bark + 5), 1)
-            
+
             # Root flares
             pygame.draw.line(surface, (45, 30, 15), (trunk_x - 5, height), (trunk_x + 3, height - 15), 3)
             pygame.draw.line(surface, (45, 30, 15), (trunk_x + 17, height), (trunk_x + 9, height - 15), 3)
-            
+
             # Leaves (3 tiers)
             leaf_cx = trunk_x + 6
             for tier in range(3):
@@ -1068,50 +1441,48 @@ def draw_background_scenery(surface, biome, width, height, scroll_x=0):
         # 4. GROUND (Layered)
         ground_top = height - 80
         # Dirt layer
-        draw_gradient(surface, (45, 90, 35), (30, 60, 25), pygame.Rect(0, ground_top, width, 80))
+        _draw_gradient(surface, (45, 90, 35), (30, 60, 25), pygame.Rect(0, ground_top, width, 80))
         # Moss edge
         pygame.draw.rect(surface, (40, 100, 35), (0, ground_top, width, 5))
         # Edge detail
         pygame.draw.rect(surface, (55, 120, 45), (0, ground_top, width, 2))
-        
+
         # Grass tufts
-        random.seed(99)
+        scenery_rng.seed(99)
         for i in range(0, width, 7):
-            g_h = random.randint(6, 16)
-            g_lean = random.randint(-4, 4)
-            g_col = (40 + random.randint(0, 30), 130 + random.randint(0, 40), 40 + random.randint(0, 20))
+            g_h = scenery_rng.randint(6, 16)
+            g_lean = scenery_rng.randint(-4, 4)
+            g_col = (40 + scenery_rng.randint(0, 30), 130 + scenery_rng.randint(0, 40), 40 + scenery_rng.randint(0, 20))
             pygame.draw.line(surface, g_col, (i, ground_top), (i + g_lean, ground_top - g_h), 2)
-        
+
         # Wildflowers
-        random.seed(200)
+        scenery_rng.seed(200)
         for _ in range(15):
-            fx = random.randint(0, width)
+            fx = scenery_rng.randint(0, width)
             flower_colors = [(255, 80, 80), (255, 200, 50), (200, 100, 255), (255, 150, 200)]
-            fc = flower_colors[random.randint(0, 3)]
+            fc = flower_colors[scenery_rng.randint(0, 3)]
             pygame.draw.circle(surface, fc, (fx, ground_top - 2), 3)
             pygame.draw.line(surface, (30, 90, 30), (fx, ground_top - 2), (fx, ground_top + 3), 1)
-            
-        # Falling Leaves (Animated, various colors)
-        t_leaf = pygame.time.get_ticks() / 10
-        leaf_colors = [(255, 190, 80), (255, 140, 50), (220, 100, 30), (180, 200, 60)]
-        for i in range(25):
-            lx = (i * 123 + t_leaf * 0.7) % width
-            ly = (i * 57 + t_leaf * 1.5) % (height - 60)
-            lc = leaf_colors[i % len(leaf_colors)]
-            rot = math.sin(t_leaf / 10 + i) * 3
-            pygame.draw.circle(surface, lc, (int(lx + rot), int(ly)), 3)
 
-    elif biome == "ICE":
+    return {
+        "sky": _bake_layer(width, height, paint_sky, opaque=True),
+        "land": _bake_layer(width, height, paint_land),
+    }
+
+def _bake_ice_layers(width, height):
+    ground_top = height - 70
+
+    def paint_sky(surface):
         # 1. SKY (Deep arctic twilight)
-        draw_gradient(surface, (8, 15, 60), (40, 80, 140), pygame.Rect(0, 0, width, height // 2))
-        draw_gradient(surface, (40, 80, 140), (80, 150, 200), pygame.Rect(0, height // 2, width, height // 2))
-        
+        _draw_gradient(surface, (8, 15, 60), (40, 80, 140), pygame.Rect(0, 0, width, height // 2))
+        _draw_gradient(surface, (40, 80, 140), (80, 150, 200), pygame.Rect(0, height // 2, width, height // 2))
+
         # Stars (Various brightness)
-        random.seed(555)
+        scenery_rng.seed(555)
         for _ in range(80):
-            sx = random.randint(0, width)
-            sy = random.randint(0, int(height * 0.6))
-            brightness = random.randint(150, 255)
+            sx = scenery_rng.randint(0, width)
+            sy = scenery_rng.randint(0, int(height * 0.6))
+            brightness = scenery_rng.randint(150, 255)
             star_size = 1 if brightness < 200 else 2
             pygame.draw.circle(surface, (brightness, brightness, brightness), (sx, sy), star_size)
 
@@ -1122,45 +1493,20 @@ def draw_background_scenery(surface, biome, width, height, scroll_x=0):
         pygame.draw.circle(moon_glow, (200, 220, 255, 15), (125, 125), 120)
         pygame.draw.circle(moon_glow, (210, 230, 255, 30), (125, 125), 100)
         surface.blit(moon_glow, (moon_x - 125, moon_y - 125))
-        
+
         pygame.draw.circle(surface, (220, 235, 255), (moon_x, moon_y), 85)
         # Surface detail
         pygame.draw.circle(surface, (195, 215, 240), (moon_x - 25, moon_y + 15), 22)
         pygame.draw.circle(surface, (200, 218, 242), (moon_x + 35, moon_y - 25), 12)
         pygame.draw.circle(surface, (190, 210, 238), (moon_x + 10, moon_y + 35), 15)
         pygame.draw.circle(surface, (205, 220, 245), (moon_x - 40, moon_y - 20), 8)
-        
-        # Aurora (3 ribbons with distinct colors)
-        t_aur = pygame.time.get_ticks() / 2000
-        s_aurora = pygame.Surface((width, height), pygame.SRCALPHA)
-        aurora_colors = [
-            (30, 255, 170, 35),   # Green
-            (80, 140, 255, 25),   # Blue
-            (200, 100, 255, 20),  # Magenta
-        ]
-        for rib in range(3):
-            points = []
-            for x_a in range(0, width + 20, 15):
-                y_base = 80 + rib * 40
-                y_off = (math.sin(x_a / 250 + t_aur * 1.5 + rib * 1.2) * 45 + 
-                        math.sin(x_a / 120 + rib * 0.8) * 20 +
-                        math.cos(x_a / 180 + t_aur * 0.7) * 15)
-                points.append((x_a, int(y_base + y_off)))
-            
-            if len(points) > 1:
-                # Draw ribbon as filled polygon
-                poly_pts = points + [(width, 0), (0, 0)]
-                pygame.draw.polygon(s_aurora, aurora_colors[rib], poly_pts)
-                # Bright edge line
-                edge_col = (aurora_colors[rib][0], aurora_colors[rib][1], aurora_colors[rib][2], 80)
-                pygame.draw.lines(s_aurora, edge_col, False, points, 2)
-        surface.blit(s_aurora, (0, 0))
-        
+
+    def paint_land(surface):
         # 2. FROZEN SPIRES (Taller, crystalline)
-        random.seed(777)
+        scenery_rng.seed(777)
         for i in range(0, width, 75):
-            h_spike = 220 + random.randint(0, 320)
-            base_w = 35 + random.randint(0, 15)
+            h_spike = 220 + scenery_rng.randint(0, 320)
+            base_w = 35 + scenery_rng.randint(0, 15)
             poly = [
                 (i, height), (i + base_w, height), (i + base_w // 2, height - h_spike)
             ]
@@ -1183,46 +1529,211 @@ def draw_background_scenery(surface, biome, width, height, scroll_x=0):
             pygame.draw.rect(surface, (60, 70, 110), (k_x + ci - 4, k_y - 330, 8, 15))
         # Trim lines
         pygame.draw.rect(surface, (90, 110, 170), (k_x - 35, k_y - 310, 70, 310), 2)
-        # Windows (Frost glow)
-        for wy in range(k_y - 280, k_y - 50, 70):
-            win_s = pygame.Surface((30, 50), pygame.SRCALPHA)
-            glow_alpha = 150 + int(math.sin(pygame.time.get_ticks() / 500 + wy) * 50)
-            pygame.draw.rect(win_s, (150, 220, 255, max(50, min(255, glow_alpha))), (5, 5, 20, 40))
-            pygame.draw.rect(win_s, (100, 150, 200, 200), (5, 5, 20, 40), 2)
-            surface.blit(win_s, (k_x - 15, wy))
 
         # 3. FROZEN GROUND (Ice with cracks)
-        ground_top = height - 70
         # Ice base
-        draw_gradient(surface, (140, 190, 225), (100, 160, 200), pygame.Rect(0, ground_top, width, 70))
+        _draw_gradient(surface, (140, 190, 225), (100, 160, 200), pygame.Rect(0, ground_top, width, 70))
         # Horizon line
         pygame.draw.rect(surface, (230, 240, 255), (0, ground_top, width, 3))
-        
+
         # Ice crack network
-        random.seed(888)
+        scenery_rng.seed(888)
         for _ in range(25):
-            cx = random.randint(0, width)
-            cy = random.randint(ground_top + 5, height - 5)
+            cx = scenery_rng.randint(0, width)
+            cy = scenery_rng.randint(ground_top + 5, height - 5)
             for seg in range(3):
-                dx = random.randint(-30, 30)
-                dy = random.randint(-10, 10)
+                dx = scenery_rng.randint(-30, 30)
+                dy = scenery_rng.randint(-10, 10)
                 pygame.draw.line(surface, (180, 210, 240), (cx, cy), (cx + dx, cy + dy), 1)
                 cx += dx
                 cy += dy
-        
+
         # Reflections (spire shapes inverted)
         s_ref = pygame.Surface((width, 70), pygame.SRCALPHA)
-        random.seed(777)
+        scenery_rng.seed(777)
         for i in range(0, width, 75):
-            h_spike = 220 + random.randint(0, 320)
-            base_w = 35 + random.randint(0, 15)
+            h_spike = 220 + scenery_rng.randint(0, 320)
+            base_w = 35 + scenery_rng.randint(0, 15)
             ref_h = min(60, h_spike * 0.25)
             pygame.draw.polygon(s_ref, (200, 220, 255, 20), [
                 (i, 0), (i + base_w, 0), (i + base_w // 2, int(ref_h))
             ])
         surface.blit(s_ref, (0, ground_top + 3))
-        
+
+    return {
+        "sky": _bake_layer(width, height, paint_sky, opaque=True),
+        "land": _bake_layer(width, height, paint_land),
+    }
+
+def _bake_volcano_layers(width, height):
+    v_x = width // 2
+    v_top_y = height - 460
+    ground_top = height - 80
+
+    def paint_sky(surface):
+        # 1. Hellscape Sky (with orange horizon glow)
+        _draw_gradient(surface, (30, 2, 2), (60, 8, 0), pygame.Rect(0, 0, width, height * 2 // 3))
+        _draw_gradient(surface, (60, 8, 0), (100, 25, 0), pygame.Rect(0, height * 2 // 3, width, height // 3))
+
+    def paint_mountain(surface):
+        # 2. Mega Volcano (Textured)
+        # Volcano body
+        pygame.draw.polygon(surface, (18, 5, 3), [
+            (v_x - 520, height), (v_x + 520, height), (v_x, v_top_y)
+        ])
+
+        # Rocky texture details
+        scenery_rng.seed(333)
+        for _ in range(40):
+            rx = v_x + scenery_rng.randint(-400, 400)
+            ry = scenery_rng.randint(v_top_y + 50, height - 30)
+            # Only draw if inside volcano shape
+            y_ratio = (ry - v_top_y) / (height - v_top_y)
+            max_x_off = 520 * y_ratio
+            if abs(rx - v_x) < max_x_off:
+                rock_w = scenery_rng.randint(8, 25)
+                rock_h = scenery_rng.randint(5, 15)
+                rock_col = (25 + scenery_rng.randint(0, 15), 8 + scenery_rng.randint(0, 8), 5 + scenery_rng.randint(0, 5))
+                pygame.draw.ellipse(surface, rock_col, (rx, ry, rock_w, rock_h))
+
+    def paint_lava(surface):
+        # 3. Lava flow (Side of volcano)
+        lava_poly = [
+            (v_x, v_top_y + 10),
+            (v_x - 110, height),
+            (v_x + 110, height)
+        ]
+        pygame.draw.polygon(surface, (180, 40, 0), lava_poly)
+
+    def paint_ground(surface):
+        # 5. Ground (Cracked obsidian with lava underneath)
+        pygame.draw.rect(surface, (35, 15, 10), (0, ground_top, width, 80))
+
+    def paint_cracks(surface):
+        # Surface cracks revealing lava
+        scenery_rng.seed(444)
+        for _ in range(20):
+            cx = scenery_rng.randint(0, width)
+            cy = scenery_rng.randint(ground_top + 2, ground_top + 30)
+            crack_len = scenery_rng.randint(15, 50)
+            crack_dir = scenery_rng.uniform(-0.5, 0.5)
+            ex = cx + int(crack_len * math.cos(crack_dir))
+            ey = cy + int(crack_len * math.sin(crack_dir))
+            # Crack (dark)
+            pygame.draw.line(surface, (15, 5, 0), (cx, cy), (ex, ey), 2)
+            # Lava glow in crack
+            pygame.draw.line(surface, (255, 80, 0), (cx + 1, cy + 1), (ex + 1, ey + 1), 1)
+
+    return {
+        "sky": _bake_layer(width, height, paint_sky, opaque=True),
+        "mountain": _bake_layer(width, height, paint_mountain),
+        "lava": _bake_layer(width, height, paint_lava),
+        "ground": _bake_layer(width, height, paint_ground),
+        "cracks": _bake_layer(width, height, paint_cracks),
+    }
+
+_BACKGROUND_BAKERS = {
+    "FOREST": _bake_forest_layers,
+    "ICE": _bake_ice_layers,
+    "VOLCANO": _bake_volcano_layers,
+}
+
+def _get_background_layers(biome, width, height):
+    key = (biome, width, height)
+    layers = _BACKGROUND_CACHE.get(key)
+    if layers is None:
+        layers = _BACKGROUND_BAKERS[biome](width, height)
+        # Reusable canvas for the full-screen translucent animated layers
+        layers["scratch"] = _to_display_format(pygame.Surface((width, height), pygame.SRCALPHA), alpha=True)
+        _BACKGROUND_CACHE[key] = layers
+    return layers
+
+def draw_background_scenery(surface, biome, width, height, scroll_x=0):
+    """Draws CINEMATIC biome backgrounds with atmospheric depth and detail."""
+
+    if biome not in _BACKGROUND_BAKERS:
+        return
+    layers = _get_background_layers(biome, width, height)
+
+    def blit_layer(name):
+        layer, pos = layers[name]
+        surface.blit(layer, pos)
+
+    if biome == "FOREST":
+        blit_layer("sky")
+
+        # God Rays (Animated)
+        sun_x, sun_y = width - 150, 90
+        ray_surface = layers["scratch"]
+        ray_surface.fill((0, 0, 0, 0))
+        t_ray = pygame.time.get_ticks() / 1000
+        for i in range(7):
+            start_x = sun_x
+            start_y = sun_y
+            end_x = width - 400 - (i * 180) + math.sin(t_ray + i) * 25
+            ray_w = 80 + i * 15
+            poly = [(start_x, start_y), (end_x, height), (end_x + ray_w, height)]
+            pygame.draw.polygon(ray_surface, (255, 255, 200, 15), poly)
+        surface.blit(ray_surface, (0, 0))
+
+        # Mountains, trees and ground are baked
+        blit_layer("land")
+
+        # Falling Leaves (Animated, various colors)
+        t_leaf = pygame.time.get_ticks() / 10
+        leaf_colors = [(255, 190, 80), (255, 140, 50), (220, 100, 30), (180, 200, 60)]
+        for i in range(25):
+            lx = (i * 123 + t_leaf * 0.7) % width
+            ly = (i * 57 + t_leaf * 1.5) % (height - 60)
+            lc = leaf_colors[i % len(leaf_colors)]
+            rot = math.sin(t_leaf / 10 + i) * 3
+            pygame.draw.circle(surface, lc, (int(lx + rot), int(ly)), 3)
+
+    elif biome == "ICE":
+        blit_layer("sky")
+
+        # Aurora (3 ribbons with distinct colors)
+        t_aur = pygame.time.get_ticks() / 2000
+        s_aurora = layers["scratch"]
+        s_aurora.fill((0, 0, 0, 0))
+        aurora_colors = [
+            (30, 255, 170, 35),   # Green
+            (80, 140, 255, 25),   # Blue
+            (200, 100, 255, 20),  # Magenta
+        ]
+        for rib in range(3):
+            points = []
+            for x_a in range(0, width + 20, 15):
+                y_base = 80 + rib * 40
+                y_off = (math.sin(x_a / 250 + t_aur * 1.5 + rib * 1.2) * 45 +
+                        math.sin(x_a / 120 + rib * 0.8) * 20 +
+                        math.cos(x_a / 180 + t_aur * 0.7) * 15)
+                points.append((x_a, int(y_base + y_off)))
+
+            if len(points) > 1:
+                # Draw ribbon as filled polygon
+                poly_pts = points + [(width, 0), (0, 0)]
+                pygame.draw.polygon(s_aurora, aurora_colors[rib], poly_pts)
+                # Bright edge line
+                edge_col = (aurora_colors[rib][0], aurora_colors[rib][1], aurora_colors[rib][2], 80)
+                pygame.draw.lines(s_aurora, edge_col, False, points, 2)
+        surface.blit(s_aurora, (0, 0))
+
+        # Spires, keep and frozen ground are baked
+        blit_layer("land")
+
+        # Keep windows (Frost glow)
+        k_x = width // 2 + 100
+        k_y = height - 50
+        for wy in range(k_y - 280, k_y - 50, 70):
+            win_s = pygame.Surface((30, 50), pygame.SRCALPHA)
+            glow_alpha = 150 + int(math.sin(pygame.time.get_ticks() / 500 + wy) * 50)
+            pygame.draw.rect(win_s, (150, 220, 255, max(50, min(255, glow_alpha))), (5, 5, 20, 40))
+            pygame.draw.rect(win_s, (100, 150, 200, 200), (5, 5, 20, 40), 2)
+            surface.blit(win_s, (k_x - 15, wy))
+
         # 4. ROLLING MIST & SNOW
+        ground_top = height - 70
         t_mist = pygame.time.get_ticks() / 50
         for i in range(6):
             mx = (t_mist * (i + 1) * 18) % (width + 500) - 250
@@ -1230,7 +1741,7 @@ def draw_background_scenery(surface, biome, width, height, scroll_x=0):
             s_mist = pygame.Surface((mist_w, 45), pygame.SRCALPHA)
             pygame.draw.ellipse(s_mist, (220, 235, 255, 25), (0, 0, mist_w, 45))
             surface.blit(s_mist, (int(mx), ground_top - 25 + i * 6))
-        
+
         # Snowflakes
         t_snow = pygame.time.get_ticks() / 15
         for i in range(35):
@@ -1240,12 +1751,11 @@ def draw_background_scenery(surface, biome, width, height, scroll_x=0):
             pygame.draw.circle(surface, (240, 245, 255), (int(sx), int(sy)), snow_size)
 
     elif biome == "VOLCANO":
-        # 1. Hellscape Sky (with orange horizon glow)
-        draw_gradient(surface, (30, 2, 2), (60, 8, 0), pygame.Rect(0, 0, width, height * 2 // 3))
-        draw_gradient(surface, (60, 8, 0), (100, 25, 0), pygame.Rect(0, height * 2 // 3, width, height // 3))
-        
+        blit_layer("sky")
+
         # Ash clouds (drifting)
-        s_smoke = pygame.Surface((width, height), pygame.SRCALPHA)
+        s_smoke = layers["scratch"]
+        s_smoke.fill((0, 0, 0, 0))
         t_smoke = pygame.time.get_ticks() / 1000
         for i in range(12):
             scx = int((t_smoke * 18 + i * 180) % (width + 400) - 200)
@@ -1261,48 +1771,24 @@ def draw_background_scenery(surface, biome, width, height, scroll_x=0):
             ex = int((i * 137 + t_emb) % width)
             ey = int((i * 73 + t_emb * 0.5) % (height * 0.6))
             pygame.draw.circle(surface, (255, 120, 0), (ex, ey), 1)
-        
-        # 2. Mega Volcano (Textured)
+
+        # Volcano body and rocks are baked
         v_x = width // 2
         v_top_y = height - 460
-        
-        # Volcano body
-        pygame.draw.polygon(surface, (18, 5, 3), [
-            (v_x - 520, height), (v_x + 520, height), (v_x, v_top_y)
-        ])
-        
-        # Rocky texture details
-        random.seed(333)
-        for _ in range(40):
-            rx = v_x + random.randint(-400, 400)
-            ry = random.randint(v_top_y + 50, height - 30)
-            # Only draw if inside volcano shape
-            y_ratio = (ry - v_top_y) / (height - v_top_y)
-            max_x_off = 520 * y_ratio
-            if abs(rx - v_x) < max_x_off:
-                rock_w = random.randint(8, 25)
-                rock_h = random.randint(5, 15)
-                rock_col = (25 + random.randint(0, 15), 8 + random.randint(0, 8), 5 + random.randint(0, 5))
-                pygame.draw.ellipse(surface, rock_col, (rx, ry, rock_w, rock_h))
-        
+        blit_layer("mountain")
+
         # Crater glow (pulsing orange at top)
         glow_t = pygame.time.get_ticks() / 200
         glow_intensity = 60 + int(math.sin(glow_t) * 30)
         crater_s = pygame.Surface((120, 60), pygame.SRCALPHA)
         pygame.draw.ellipse(crater_s, (255, 80, 0, max(0, min(255, glow_intensity))), (0, 0, 120, 60))
         surface.blit(crater_s, (v_x - 60, v_top_y - 15))
-        
-        # 3. Lava flow (Side of volcano)
+
+        # 3. Lava flow (baked) with moving veins
         t = pygame.time.get_ticks()
         flow_offset = (t / 50) % 20
-        
-        lava_poly = [
-            (v_x, v_top_y + 10), 
-            (v_x - 110, height), 
-            (v_x + 110, height)
-        ]
-        pygame.draw.polygon(surface, (180, 40, 0), lava_poly)
-        
+        blit_layer("lava")
+
         # Bright veins in lava
         for i in range(12):
             ly = int(v_top_y + 10 + i * 35 + flow_offset)
@@ -1316,15 +1802,15 @@ def draw_background_scenery(surface, biome, width, height, scroll_x=0):
         for i in range(6):
             cycle_dur = 2200
             local_t = (t + i * 370) % cycle_dur
-            
+
             if local_t < 1600:
                 prog = local_t / 1600.0
                 spread = (280 + i * 30) * (-1 if i % 2 == 0 else 1)
-                
+
                 curr_x = v_x + spread * prog
                 arc_h = 220 * math.sin(prog * 3.14159)
                 curr_y = v_top_y - arc_h + (prog * 470)
-                
+
                 # Rock (darker, larger)
                 rock_r = 5 + i % 3
                 pygame.draw.circle(surface, (40, 30, 30), (int(curr_x), int(curr_y)), rock_r)
@@ -1332,7 +1818,7 @@ def draw_background_scenery(surface, biome, width, height, scroll_x=0):
                 pygame.draw.circle(surface, (255, 120, 0), (int(curr_x), int(curr_y)), max(1, rock_r - 2))
                 # Hot center
                 pygame.draw.circle(surface, (255, 220, 80), (int(curr_x) + 1, int(curr_y) - 1), max(1, rock_r - 4))
-                
+
                 # Glowing trail
                 if prog < 0.85:
                     for trail_i in range(3):
@@ -1345,41 +1831,29 @@ def draw_background_scenery(surface, biome, width, height, scroll_x=0):
                         pygame.draw.circle(ts, (255, 100, 0, max(0, trail_alpha)), (4, 4), 4)
                         surface.blit(ts, (int(tx) - 4, int(ty) - 4))
 
-        # 5. Ground (Cracked obsidian with lava underneath)
+        # 5. Ground (baked obsidian, pulsing lava underneath, baked cracks on top)
         ground_top = height - 80
-        pygame.draw.rect(surface, (35, 15, 10), (0, ground_top, width, 80))
-        
+        blit_layer("ground")
+
         # Lava underneath showing through cracks
         lava_y = ground_top + 35
         lava_glow = 180 + int(math.sin(t / 150) * 40)
         pygame.draw.rect(surface, (min(255, lava_glow + 50), 50, 0), (0, lava_y, width, 35))
-        
-        # Surface cracks revealing lava
-        random.seed(444)
-        for _ in range(20):
-            cx = random.randint(0, width)
-            cy = random.randint(ground_top + 2, ground_top + 30)
-            crack_len = random.randint(15, 50)
-            crack_dir = random.uniform(-0.5, 0.5)
-            ex = cx + int(crack_len * math.cos(crack_dir))
-            ey = cy + int(crack_len * math.sin(crack_dir))
-            # Crack (dark)
-            pygame.draw.line(surface, (15, 5, 0), (cx, cy), (ex, ey), 2)
-            # Lava glow in crack
-            pygame.draw.line(surface, (255, 80, 0), (cx + 1, cy + 1), (ex + 1, ey + 1), 1)
-        
+
+        blit_layer("cracks")
+
         # Lava bubbles & hot spots
-        random.seed(int(t / 100))
+        scenery_rng.seed(int(t / 100))
         for _ in range(12):
-            bx = random.randint(0, width)
-            by = lava_y + random.randint(2, 30)
-            bubble_r = random.randint(2, 5)
+            bx = scenery_rng.randint(0, width)
+            by = lava_y + scenery_rng.randint(2, 30)
+            bubble_r = scenery_rng.randint(2, 5)
             pygame.draw.circle(surface, (255, 200, 50), (bx, by), bubble_r)
             pygame.draw.circle(surface, (255, 255, 150), (bx - 1, by - 1), max(1, bubble_r - 2))
-        
+
         # Rising heat sparks
         for i in range(8):
-            sx = random.randint(0, width)
+            sx = scenery_rng.randint(0, width)
             sy = int(ground_top - (t / 5 + i * 50) % 60)
             pygame.draw.circle(surface, (255, 150, 50), (sx, sy), 1)
 
@@ -1407,102 +1881,122 @@ def draw_health_bar(surface, x, y, current_hp, max_hp):
     pygame.draw.rect(surface, WHITE, (x, y, bar_width, bar_height), 2, border_radius=5)
     
     # Text
-    font = pygame.font.SysFont("Arial", 18, bold=True)
-    text = font.render(f"{current_hp}/{max_hp}", True, WHITE)
+    text = render_text("health", f"{current_hp}/{max_hp}", WHITE)
     text_rect = text.get_rect(center=(x + bar_width // 2, y + bar_height // 2))
     surface.blit(text, text_rect)
 
-def draw_lightning_bolt(surface, start_pos, end_pos):
+# --- LIGHTNING ARCS ---
+# A bolt's polyline is generated once per cast: a few jitter variants are
+# painted into bounding-box-sized surfaces and cycled for the effect's life.
+LIGHTNING_VARIANTS = 4
+_ARC_PAD = 8 # Half of the widest glow line
+
+def _lightning_segments(start, end, depth, displace, width_scale, out, is_branch=False):
+    """Midpoint-displacement bolt; appends (start, end, width_scale, is_branch) in paint order."""
+    if depth == 0:
+        out.append(((int(start[0]), int(start[1])), (int(end[0]), int(end[1])), width_scale, is_branch))
+        return
+
+    mid_x = (start[0] + end[0]) / 2
+    mid_y = (start[1] + end[1]) / 2
+    
+    # Perpendicular vector
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    px, py = -dy, dx
+    L = math.hypot(px, py)
+    if L > 0: px /= L; py /= L
+        
+    # Increased jitter for more dramatic shape
+    offset = (vfx_rng.random() - 0.5) * displace
+    mid = (mid_x + px * offset, mid_y + py * offset)
+    
+    _lightning_segments(start, mid, depth - 1, displace * 0.55, width_scale, out, is_branch)
+    _lightning_segments(mid, end, depth - 1, displace * 0.55, width_scale, out, is_branch)
+    
+    # Branches (more frequent, more dramatic)
+    if depth > 2 and vfx_rng.random() < 0.4:
+        # Branch direction biased towards the main bolt direction
+        base_angle = math.atan2(dy, dx)
+        branch_angle = base_angle + vfx_rng.uniform(-1.2, 1.2)
+        length = displace * 0.65
+        bx = mid[0] + math.cos(branch_angle) * length
+        by = mid[1] + math.sin(branch_angle) * length
+        _lightning_segments(mid, (bx, by), depth - 2, displace * 0.4, max(1, width_scale - 2), out, True)
+
+def _paint_lightning_segments(segments):
+    """Paints segments into a surface cropped to their bounding box; returns (surface, topleft)."""
+    xs = [p[0] for seg in segments for p in seg[:2]]
+    ys = [p[1] for seg in segments for p in seg[:2]]
+    left, top = min(xs) - _ARC_PAD, min(ys) - _ARC_PAD
+    surf = pygame.Surface((max(xs) - left + _ARC_PAD + 1, max(ys) - top + _ARC_PAD + 1), pygame.SRCALPHA)
+    
+    for (s_x, s_y), (e_x, e_y), width_scale, is_branch in segments:
+        a, b = (s_x - left, s_y - top), (e_x - left, e_y - top)
+        
+        # Outer plasma glow (wide, purple-blue)
+        for w in range(width_scale + 6, width_scale + 1, -1):
+            alpha = 30 + (width_scale + 6 - w) * 10
+            col = (100, 80, 255, min(255, alpha))
+            pygame.draw.line(surf, col, a, b, w)
+        
+        # Mid glow (electric blue)
+        pygame.draw.line(surf, (150, 180, 255, 200), a, b, max(1, width_scale))
+        
+        # Core (bright white with slight cyan)
+        if not is_branch:
+            pygame.draw.line(surf, (220, 240, 255), a, b, max(1, width_scale - 1))
+            pygame.draw.line(surf, (255, 255, 255), a, b, max(1, width_scale - 3))
+        else:
+            pygame.draw.line(surf, (180, 200, 255), a, b, max(1, width_scale - 2))
+    
+    return _to_display_format(surf, alpha=True), (left, top)
+
+def build_lightning_arc(start_pos, end_pos, variants=LIGHTNING_VARIANTS):
+    """Generates and paints a bolt's jitter variants once; keep the result on the effect."""
+    frames = []
+    for _ in range(variants):
+        segments = []
+        # Main bolt (deeper recursion for smoother look)
+        _lightning_segments(start_pos, end_pos, 7, 90, 6, segments)
+        # Flicker effect (slight randomization per variant)
+        if vfx_rng.random() < 0.3:
+            _lightning_segments(start_pos, end_pos, 5, 60, 3, segments)
+        frames.append(_paint_lightning_segments(segments))
+    return {"frames": frames, "frame": 0}
+
+def draw_lightning_bolt(surface, start_pos, end_pos, arc=None):
     """Draws a CINEMATIC plasma lightning bolt with multi-layer glow, branches, and impact effects."""
     
     t = pygame.time.get_ticks()
     
-    # Create alpha surface for proper glow blending
-    bolt_s = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-    
-    # 1. Main Bolt Logic (Enhanced recursion)
-    def recursive_bolt(surf, start, end, depth, displace, width_scale, is_branch=False):
-        if depth == 0:
-            s_x, s_y = int(start[0]), int(start[1])
-            e_x, e_y = int(end[0]), int(end[1])
-            
-            # Outer plasma glow (wide, purple-blue)
-            for w in range(width_scale + 6, width_scale + 1, -1):
-                alpha = 30 + (width_scale + 6 - w) * 10
-                col = (100, 80, 255, min(255, alpha))
-                pygame.draw.line(surf, col, (s_x, s_y), (e_x, e_y), w)
-            
-            # Mid glow (electric blue)
-            pygame.draw.line(surf, (150, 180, 255, 200), (s_x, s_y), (e_x, e_y), max(1, width_scale))
-            
-            # Core (bright white with slight cyan)
-            if not is_branch:
-                pygame.draw.line(surf, (220, 240, 255), (s_x, s_y), (e_x, e_y), max(1, width_scale - 1))
-                pygame.draw.line(surf, (255, 255, 255), (s_x, s_y), (e_x, e_y), max(1, width_scale - 3))
-            else:
-                pygame.draw.line(surf, (180, 200, 255), (s_x, s_y), (e_x, e_y), max(1, width_scale - 2))
-            return
-
-        mid_x = (start[0] + end[0]) / 2
-        mid_y = (start[1] + end[1]) / 2
-        
-        # Perpendicular vector
-        dx = end[0] - start[0]
-        dy = end[1] - start[1]
-        px, py = -dy, dx
-        L = math.hypot(px, py)
-        if L > 0: px /= L; py /= L
-            
-        # Increased jitter for more dramatic shape
-        offset = (random.random() - 0.5) * displace
-        mid = (mid_x + px * offset, mid_y + py * offset)
-        
-        recursive_bolt(surf, start, mid, depth - 1, displace * 0.55, width_scale, is_branch)
-        recursive_bolt(surf, mid, end, depth - 1, displace * 0.55, width_scale, is_branch)
-        
-        # Branches (more frequent, more dramatic)
-        if depth > 2 and random.random() < 0.4:
-            # Branch direction biased towards the main bolt direction
-            base_angle = math.atan2(dy, dx)
-            branch_angle = base_angle + random.uniform(-1.2, 1.2)
-            length = displace * 0.65
-            bx = mid[0] + math.cos(branch_angle) * length
-            by = mid[1] + math.sin(branch_angle) * length
-            recursive_bolt(surf, mid, (bx, by), depth - 2, displace * 0.4, max(1, width_scale - 2), True)
-    
-    # Draw main bolt (deeper recursion for smoother look)
-    recursive_bolt(bolt_s, start_pos, end_pos, 7, 90, 6)
-    
-    # Flicker effect (slight randomization per frame)
-    if random.random() < 0.3:
-        recursive_bolt(bolt_s, start_pos, end_pos, 5, 60, 3)
-    
-    surface.blit(bolt_s, (0, 0))
+    # 1. Main Bolt (cycle through the cast's pre-painted variants)
+    if arc is None:
+        arc = build_lightning_arc(start_pos, end_pos, variants=1)
+    bolt_s, bolt_pos = arc["frames"][arc["frame"] % len(arc["frames"])]
+    arc["frame"] += 1
+    surface.blit(bolt_s, bolt_pos)
     
     # 2. Enhanced Impact Effect at end_pos
-    impact_s = pygame.Surface((200, 200), pygame.SRCALPHA)
-    icx, icy = 100, 100
-    
     # Multi-layer impact glow
-    pygame.draw.circle(impact_s, (80, 80, 255, 30), (icx, icy), 80)
-    pygame.draw.circle(impact_s, (120, 120, 255, 60), (icx, icy), 50)
-    pygame.draw.circle(impact_s, (180, 200, 255, 120), (icx, icy), 25)
-    pygame.draw.circle(impact_s, (255, 255, 255, 220), (icx, icy), 10)
-    pygame.draw.circle(impact_s, (255, 255, 255), (icx, icy), 4)
-    surface.blit(impact_s, (int(end_pos[0]) - 100, int(end_pos[1]) - 100))
+    blit_glow(surface, (int(end_pos[0]), int(end_pos[1])), (
+        ((80, 80, 255, 30), 80),
+        ((120, 120, 255, 60), 50),
+        ((180, 200, 255, 120), 25),
+        ((255, 255, 255, 220), 10),
+        ((255, 255, 255), 4),
+    ))
     
     # Expanding shock ring at impact
     ring_phase = (t % 300) / 300.0
     ring_r = int(10 + ring_phase * 40)
     ring_alpha = int(200 * (1.0 - ring_phase))
-    ring_s = pygame.Surface((ring_r * 2 + 10, ring_r * 2 + 10), pygame.SRCALPHA)
-    pygame.draw.circle(ring_s, (200, 200, 255, max(0, ring_alpha)), (ring_r + 5, ring_r + 5), ring_r, 2)
-    surface.blit(ring_s, (int(end_pos[0]) - ring_r - 5, int(end_pos[1]) - ring_r - 5))
+    blit_glow(surface, (int(end_pos[0]), int(end_pos[1])), (((200, 200, 255, max(0, ring_alpha)), ring_r, 2),))
     
     # Spark particles radiating from impact
     for _ in range(15):
-        spark_angle = random.uniform(0, 6.2832)
-        spark_len = random.randint(10, 40)
+        spark_angle = vfx_rng.uniform(0, 6.2832)
+        spark_len = vfx_rng.randint(10, 40)
         ix = int(end_pos[0]) + int(math.cos(spark_angle) * spark_len)
         iy = int(end_pos[1]) + int(math.sin(spark_angle) * spark_len)
         
@@ -1511,23 +2005,48 @@ def draw_lightning_bolt(surface, start_pos, end_pos):
         pygame.draw.circle(surface, (255, 255, 255), (ix, iy), 2)
     
     # 3. Origin point glow (at caster)
-    origin_s = pygame.Surface((60, 60), pygame.SRCALPHA)
-    pygame.draw.circle(origin_s, (150, 150, 255, 80), (30, 30), 25)
-    pygame.draw.circle(origin_s, (200, 200, 255, 150), (30, 30), 12)
-    pygame.draw.circle(origin_s, (255, 255, 255), (30, 30), 4)
-    surface.blit(origin_s, (int(start_pos[0]) - 30, int(start_pos[1]) - 30))
+    blit_glow(surface, (int(start_pos[0]), int(start_pos[1])), (
+        ((150, 150, 255, 80), 25),
+        ((200, 200, 255, 150), 12),
+        ((255, 255, 255), 4),
+    ))
     
     # 4. Screen flash (dramatic effect)
-    if random.random() < 0.25:
-        s_flash = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        flash_intensity = random.randint(20, 50)
-        s_flash.fill((180, 200, 255, flash_intensity))
-        surface.blit(s_flash, (0, 0))
+    if vfx_rng.random() < 0.25:
+        flash_intensity = vfx_rng.randint(20, 50)
+        draw_overlay(surface, (180, 200, 255), flash_intensity)
+
+# --- TORNADO FRAMES ---
+# A tornado lives TORNADO_LIFE frames; its animation is baked once into a loop
+# of TORNADO_FRAMES cropped frames (one per two game frames) and shared by
+# every TORNADO_MOVING effect, so each tornado costs a single blit.
+TORNADO_LIFE = 100
+TORNADO_FRAMES = 50
+_TORNADO_ANCHOR = (160, 350) # Tornado base inside the bake canvas
+_TORNADO_FRAMES = {}
+
+def _get_tornado_frame(index):
+    entry = _TORNADO_FRAMES.get(index)
+    if entry is None:
+        ax, ay = _TORNADO_ANCHOR
+        canvas = pygame.Surface((ax * 2, ay + 30), pygame.SRCALPHA)
+        # Two game frames per baked frame, in the same units as get_ticks() / 120
+        t = index * 2 * (1000 / FPS) / 120
+        _render_tornado(canvas, ax, ay, t)
+        bounds = canvas.get_bounding_rect()
+        frame = _to_display_format(canvas.subsurface(bounds).copy(), alpha=True)
+        entry = (frame, (bounds.x - ax, bounds.y - ay))
+        _TORNADO_FRAMES[index] = entry
+    return entry
 
 def draw_tornado_effect(surface, x, y, life_counter):
     """Draws a CINEMATIC volumetric tornado with swirling debris, wind streaks, and ground effects."""
-    
-    t = pygame.time.get_ticks() / 120  # Smooth rotation speed
+    index = ((TORNADO_LIFE - life_counter) // 2) % TORNADO_FRAMES
+    frame, (ox, oy) = _get_tornado_frame(index)
+    surface.blit(frame, (x + ox, y + oy))
+
+def _render_tornado(surface, x, y, t):
+    """Paints one tornado frame at animation time t (get_ticks() / 120 units)."""
     
     # Tornado Parameters
     height = 300
@@ -1688,18 +2207,14 @@ def draw_dragon_effect(surface, x, y, life_counter):
     t = pygame.time.get_ticks()
     
     # 1. Screen Darken with vignette
-    shake_x = random.randint(-4, 4)
-    shake_y = random.randint(-4, 4)
+    shake_x = vfx_rng.randint(-4, 4)
+    shake_y = vfx_rng.randint(-4, 4)
     
     # Dark overlay with vignette gradient
-    s_dark = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-    s_dark.fill((0, 0, 0, 140))
-    surface.blit(s_dark, (0, 0))
+    draw_overlay(surface, (0, 0, 0), 140)
     
     # Red atmospheric tint (heat)
-    s_heat = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-    s_heat.fill((40, 0, 0, 40))
-    surface.blit(s_heat, (0, 0))
+    draw_overlay(surface, (40, 0, 0), 40)
     
     # 2. DRAGON HEAD (Detailed with scales, horns, and features)
     head_y = 55 + math.sin(t / 250) * 15 + shake_y
@@ -1735,7 +2250,7 @@ def draw_dragon_effect(surface, x, y, life_counter):
     # B. Scale texture (subtle lighter patches)
     for sx in range(-80, 80, 25):
         for sy in range(-130, 40, 20):
-            scale_alpha = random.randint(10, 30)
+            scale_alpha = vfx_rng.randint(10, 30)
             ss = pygame.Surface((12, 8), pygame.SRCALPHA)
             pygame.draw.ellipse(ss, (60, 10, 10, scale_alpha), (0, 0, 12, 8))
             surface.blit(ss, (head_x + sx, head_y + sy))
@@ -1835,7 +2350,7 @@ def draw_dragon_effect(surface, x, y, life_counter):
             # Multiple particles per row for density
             num_particles = 2 + int(prog * 4)
             for p_idx in range(num_particles):
-                px = stream_x + random.randint(int(-width / 2), int(width / 2))
+                px = stream_x + vfx_rng.randint(int(-width / 2), int(width / 2))
                 
                 # 8-step color gradient: White -> Yellow-white -> Yellow -> Orange -> Deep orange -> Red -> Dark red -> Smoke
                 if prog < 0.05:
@@ -1856,7 +2371,7 @@ def draw_dragon_effect(surface, x, y, life_counter):
                     col = (60, 20, 10)
                 
                 # Alpha decreases at edges
-                alpha = random.randint(80, 200) - int(prog * 80)
+                alpha = vfx_rng.randint(80, 200) - int(prog * 80)
                 alpha = max(20, min(255, alpha))
                 
                 # Size grows with distance
@@ -1869,16 +2384,16 @@ def draw_dragon_effect(surface, x, y, life_counter):
     # 4. Embers floating upward (with velocity trails)
     for i in range(30):
         ember_seed = (t // 30 + i * 17) % 1000
-        random.seed(ember_seed)
+        scenery_rng.seed(ember_seed)
         
-        ex = random.randint(int(head_x - 300), int(head_x + 300))
-        ey_base = random.randint(0, SCREEN_HEIGHT)
+        ex = scenery_rng.randint(int(head_x - 300), int(head_x + 300))
+        ey_base = scenery_rng.randint(0, SCREEN_HEIGHT)
         # Float upward based on time
         ey = int(ey_base - (t / 10 + i * 20) % SCREEN_HEIGHT)
         if ey < 0:
             ey += SCREEN_HEIGHT
         
-        ember_size = random.randint(2, 5)
+        ember_size = scenery_rng.randint(2, 5)
         ember_s = pygame.Surface((ember_size * 2 + 4, ember_size * 2 + 4), pygame.SRCALPHA)
         
         # Ember glow
@@ -1886,15 +2401,12 @@ def draw_dragon_effect(surface, x, y, life_counter):
         pygame.draw.circle(ember_s, (255, 255, 100, 220), (ember_size + 2, ember_size + 2), ember_size)
         
         # Trail line
-        trail_len = random.randint(5, 15)
+        trail_len = scenery_rng.randint(5, 15)
         pygame.draw.line(ember_s, (255, 150, 0, 80), (ember_size + 2, ember_size + 2), 
                         (ember_size + 2, ember_size + 2 + trail_len), 1)
         
         surface.blit(ember_s, (ex - ember_size - 2, ey - ember_size - 2))
     
-    # Reset random seed
-    random.seed()
-    
     # 5. Heat wave distortion overlay
     heat_s = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
     for hy in range(0, SCREEN_HEIGHT, 40):
@@ -1905,8 +2417,63 @@ def draw_dragon_effect(surface, x, y, life_counter):
     surface.blit(heat_s, (0, 0))
 
 
+# --- DRAGON BOSS FRAME CACHE ---
+# The boss is baked per (animation bucket, attack state, cache scale) facing
+# right; left-facing frames are mirrored copies. Hover is applied as a blit
+# offset. Wings (t/150), tail (t/200) and breath (t/100) all loop every
+# 2*pi*600 ms, so one bucket covers every animated part at once.
+DRAGON_ANIM_FRAMES = 36
+DRAGON_CACHE_SCALES = (0.9, 1.0, 1.2, 1.4, 1.6, 1.8)
+_DRAGON_CYCLE_MS = 2 * math.pi * 600
+_DRAGON_CACHE_MAX = 128
+_DRAGON_FRAME_CACHE = OrderedDict()
+
+def _dragon_cache_scale(scale):
+    return min(DRAGON_CACHE_SCALES, key=lambda s: abs(s - scale))
+
+def _dragon_attack_state(is_attacking, attack_phase):
+    """0 = idle, 1 = charging (throat glow), 2 = releasing (flamethrower)."""
+    if not is_attacking:
+        return 0
+    return 2 if attack_phase > 0.3 else 1
+
+def get_dragon_frame(facing_right, scale, tick, is_attacking=False, attack_phase=0.0):
+    """Returns (frame, (ox, oy)) with offsets relative to the dragon's body centre."""
+    scale = _dragon_cache_scale(scale)
+    bucket = int((tick % _DRAGON_CYCLE_MS) / _DRAGON_CYCLE_MS * DRAGON_ANIM_FRAMES) % DRAGON_ANIM_FRAMES
+    state = _dragon_attack_state(is_attacking, attack_phase)
+    key = (facing_right, bucket, state, scale)
+
+    entry = _DRAGON_FRAME_CACHE.get(key)
+    if entry is not None:
+        _DRAGON_FRAME_CACHE.move_to_end(key)
+        return entry
+
+    if facing_right:
+        frame_tick = bucket * _DRAGON_CYCLE_MS / DRAGON_ANIM_FRAMES
+        canvas = _render_dragon_canvas(True, scale, frame_tick, state > 0, 1.0 if state == 2 else 0.0)
+        cx, cy = canvas.get_width() // 2, canvas.get_height() // 2
+        bounds = canvas.get_bounding_rect()
+        frame = _to_display_format(canvas.subsurface(bounds).copy(), alpha=True)
+        entry = (frame, (bounds.x - cx, bounds.y - cy))
+    else:
+        # Mirror the right-facing pose around the body centre
+        right, (ox, oy) = get_dragon_frame(True, scale, tick, is_attacking, attack_phase)
+        entry = (pygame.transform.flip(right, True, False), (-ox - right.get_width(), oy))
+
+    _DRAGON_FRAME_CACHE[key] = entry
+    if len(_DRAGON_FRAME_CACHE) > _DRAGON_CACHE_MAX:
+        _DRAGON_FRAME_CACHE.popitem(last=False)
+    return entry
+
 def draw_dragon_boss(surface, x, y, facing_right, scale=1.0, tick=0, is_attacking=False, attack_phase=0.0):
     """Draws a massive, animated Dragon Boss entity."""
+    frame, (ox, oy) = get_dragon_frame(facing_right, scale, tick, is_attacking, attack_phase)
+    hover_y = math.sin(tick / 250) * (20 * _dragon_cache_scale(scale))
+    surface.blit(frame, (int(x) + ox, int(y + hover_y) + oy))
+
+def _render_dragon_canvas(facing_right, scale, tick, is_attacking, attack_phase):
+    """Paints one dragon pose (no hover) on a fresh 500*scale canvas."""
     
     direction = 1 if facing_right else -1
     
@@ -1916,13 +2483,12 @@ def draw_dragon_boss(surface, x, y, facing_right, scale=1.0, tick=0, is_attackin
     cx, cy = w//2, h//2
     
     # Animation Parameters
-    hover_y = math.sin(tick / 250) * (20 * scale)
     wing_phase = math.sin(tick / 150)
     breath_pulse = (math.sin(tick / 100) + 1.5) * 0.5 # 0.5 to 1.25
     
     # Position adjustments
     body_x = cx
-    body_y = cy + hover_y
+    body_y = cy
     
     # 1. WINGS (Behind Body)
     wing_span = 180 * scale
@@ -2043,8 +2609,7 @@ def draw_dragon_boss(surface, x, y, facing_right, scale=1.0, tick=0, is_attackin
                 # Particles at end
                 pygame.draw.circle(s, (*col, alpha), (int(end_x), int(end_y)), int(width*scale))
 
-
-    surface.blit(s, s.get_rect(center=(x, y)))
+    return s
 
 def draw_dragon_cinematic_entrance(surface, progress):
     """
@@ -2057,16 +2622,12 @@ def draw_dragon_cinematic_entrance(surface, progress):
     
     # 1. Darken Sky (Weather Change)
     darkness = int(min(200, progress * 200)) # Fade to dark storm
-    s_dark = pygame.Surface((w, h), pygame.SRCALPHA)
-    s_dark.fill((20, 10, 30, darkness))
-    surface.blit(s_dark, (0,0))
+    draw_overlay(surface, (20, 10, 30), darkness)
     
     # 2. Lightning Flashes (Dramatic Strobe)
     if 0.3 < progress < 0.8:
-        if random.random() < 0.1: # Flash
-            s_flash = pygame.Surface((w, h), pygame.SRCALPHA)
-            s_flash.fill((200, 220, 255, random.randint(50, 150)))
-            surface.blit(s_flash, (0,0))
+        if vfx_rng.random() < 0.1: # Flash
+            draw_overlay(surface, (200, 220, 255), vfx_rng.randint(50, 150))
             
     # 3. Dragon Descent
     # Starts high up (y = -300) and descends to fight pos (cy - 100)
@@ -2092,7 +2653,6 @@ def draw_dragon_cinematic_entrance(surface, progress):
     # Text
     if progress > 0.5:
         # Large menacing text
-        font_big = pygame.font.SysFont("Verdana", 80, bold=True)
-        txt = font_big.render("THE ANCIENT DRAGON", True, (255, 50, 0))
+        txt = render_text("cinematic", "THE ANCIENT DRAGON", (255, 50, 0))
         rect = txt.get_rect(center=(cx, h - 150))
         surface.blit(txt, rect)
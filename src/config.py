@@ -6,6 +6,14 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 
+# Timing: the simulation always steps at SIM_HZ (every per-frame speed,
+# cooldown and timer is per sim tick); rendering runs at up to RENDER_FPS_CAP
+# (0 = uncapped) and interpolates between the last two ticks.
+SIM_HZ = FPS
+SIM_DT_MS = 1000.0 / SIM_HZ
+RENDER_FPS_CAP = 144
+MAX_FRAME_MS = 250 # Longer stalls (window drag, breakpoint) are not caught up
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -70,6 +78,24 @@ SHOP_UPGRADES_LIST = [
     {"id": "PERMA_SPEED", "name": "Wind Soul", "cost": 400, "desc": "+Attack Speed (Permanent)", "stat": "attack_speed_boost", "val": 5}
 ]
 
+# Particle Budget (live particles; see src/particles.py)
+PARTICLE_GLOBAL_CAP = 12000
+PARTICLE_QUOTAS = {"TRAIL": 8000, "HIT": 1500, "DEATH": 3000, "AMBIENT": 1000}
+# When the global cap binds, live particles of lower priority are shed first
+PARTICLE_PRIORITIES = {"AMBIENT": 0, "TRAIL": 1, "DEATH": 2, "HIT": 3}
+PARTICLE_MAX_MERGE = 3.0 # Max size growth when an emission is merged into fewer particles
+
+# Collision broadphase (uniform grid cell size in px)
+SPATIAL_CELL_SIZE = 128
+# Shots at least this fast (px/tick) are hit-tested along their whole path
+# this tick (Void Lance, arrows, dragon breath) instead of where they end up
+SWEPT_COLLISION_SPEED = 14
+
+# Entity pools (instances pre-built at startup; pools grow past this on demand)
+PROJECTILE_POOL_RESERVE = 256
+ENEMY_PROJECTILE_POOL_RESERVE = 64
+ENEMY_POOL_RESERVE = 64
+
 # Wave Settings
 ENEMIES_PER_WAVE_BASE = 5 # Starts low
 TOTAL_WAVES = 9999 # Infinite
@@ -0,0 +1,65 @@
+import pygame
+from src.config import SCREEN_WIDTH
+
+# --- CONTROLS ---
+# One sim tick of player input, independent of where it came from:
+#   {"keys": held keys (indexable by pygame key code), "fire": bool,
+#    "aim": (x, y), "weapons": [slot numbers pressed this tick]}
+# The live game reads the keyboard and mouse; headless runs pass scripted
+# input or the bot below.
+
+WEAPON_KEYS = {pygame.K_1: 1, pygame.K_2: 2, pygame.K_3: 3, pygame.K_4: 4}
+
+class HeldKeys:
+    """Stand-in for pygame.key.get_pressed(): keys[code] is True for held codes."""
+    def __init__(self, codes=()):
+        self.codes = frozenset(codes)
+
+    def __getitem__(self, code):
+        return code in self.codes
+
+def make_controls(keys=(), fire=False, aim=(0, 0), weapons=()):
+    """Controls for a scripted tick; keys is an iterable of pygame key codes."""
+    return {"keys": HeldKeys(keys), "fire": fire, "aim": aim, "weapons": list(weapons)}
+
+def read_controls(events):
+    """Live keyboard and mouse state, plus weapon hotkeys pressed in events."""
+    return {
+        "keys": pygame.key.get_pressed(),
+        "fire": pygame.mouse.get_pressed()[0],
+        "aim": pygame.mouse.get_pos(),
+        "weapons": [WEAPON_KEYS[e.key] for e in events
+                    if e.type == pygame.KEYDOWN and e.key in WEAPON_KEYS],
+    }
+
+# --- BOT ---
+BOT_KEEP_AWAY = 250 # Backs off from enemies closer than this (px)
+
+def bot_controls(wizard, enemy_index):
+    """
+    Simple kiting bot for headless runs: fires at the nearest enemy, backs
+    away when one gets close, casts abilities whenever they are ready and
+    keeps the strongest unlocked weapon selected.
+    """
+    held = [pygame.K_t, pygame.K_r]
+    aim = (wizard.rect.centerx + (100 if wizard.facing_right else -100), wizard.rect.centery)
+    nearest = enemy_index.nearest(wizard.rect.center)
+    if nearest:
+        target = nearest[0].rect
+        aim = target.center
+        if abs(target.centerx - wizard.rect.centerx) < BOT_KEEP_AWAY:
+            away_left = target.centerx > wizard.rect.centerx
+            if away_left and wizard.rect.left > 40:
+                held.append(pygame.K_a)
+            elif not away_left and wizard.rect.right < SCREEN_WIDTH - 40:
+                held.append(pygame.K_d)
+            else:
+                held.append(pygame.K_w) # Cornered: jump over
+
+    weapons = []
+    for slot, weapon in ((4, "FIRE_RING"), (3, "VOID_LANCE"), (2, "ARCANE_VOLLEY")):
+        if weapon in wizard.unlocked_weapons:
+            if wizard.current_weapon != weapon:
+                weapons.append(slot)
+            break
+    return make_controls(held, fire=bool(nearest), aim=aim, weapons=weapons)
@@ -0,0 +1,146 @@
+import numpy as np
+from src.config import GRAVITY, SCREEN_HEIGHT
+
+# --- ENEMY TABLE ---
+# Regular enemies keep their AI state in one struct-of-arrays table, so a
+# tick of chase / stop-and-attack / gravity runs as a handful of NumPy ops
+# for the whole horde. Enemy sprites are thin views onto their row (see
+# src.entities); rows are swap-removed when an enemy dies. The Dragon Boss
+# keeps its own state machine and is not in the table.
+
+ENEMY_TYPE_IDS = {"OGRE": 0, "GOBLIN": 1, "TROLL": 2, "SKELETON_ARCHER": 3, "OGRE_KING": 4}
+TYPE_ARCHER = ENEMY_TYPE_IDS["SKELETON_ARCHER"]
+TYPE_KING = ENEMY_TYPE_IDS["OGRE_KING"]
+
+ENEMY_TABLE_CAPACITY = 256 # Initial rows (doubles when full)
+ATTACK_HYSTERESIS = 100 # Extra range before an attacking enemy gives chase again
+MELEE_RANGE = 150 # Melee swings only land within this distance of the player
+GROUND_Y = SCREEN_HEIGHT - 50
+
+def _round_half_away(v):
+    """Rounds like pygame.Rect does when a float is assigned to it."""
+    return np.copysign(np.floor(np.abs(v) + 0.5), v)
+
+class EnemyTable:
+    # column name -> dtype
+    COLUMNS = {
+        "x": np.float64, "y": np.float64, # rect left / top (whole pixels)
+        "w": np.int32, "h": np.int32,
+        "vel_y": np.float64, "speed": np.float64, "stop_range": np.float64,
+        "attack_timer": np.int32, "attack_cooldown_max": np.int32,
+        "damage": np.float64, "health": np.float64, "type_id": np.int8,
+        "direction": np.int8, "is_attacking": np.bool_, "did_attack": np.bool_,
+    }
+
+    def __init__(self, capacity=ENEMY_TABLE_CAPACITY):
+        self.count = 0
+        self.owners = [] # row -> Enemy sprite
+        self._alloc(capacity)
+
+    def _alloc(self, capacity):
+        n = self.count
+        for name, dtype in self.COLUMNS.items():
+            col = np.zeros(capacity, dtype=dtype)
+            if n:
+                col[:n] = getattr(self, name)[:n]
+            setattr(self, name, col)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def add(self, owner, **values):
+        """Appends a row for owner (values are column initial values); returns the row."""
+        if self.count == self.capacity:
+            self._alloc(self.capacity * 2)
+        row = self.count
+        for name in self.COLUMNS:
+            getattr(self, name)[row] = values.get(name, 0)
+        self.owners.append(owner)
+        self.count += 1
+        owner.slot = row
+        return row
+
+    def remove(self, owner):
+        """Swap-removes owner's row: the last row moves into the hole."""
+        row, last = owner.slot, self.count - 1
+        if row != last:
+            for name in self.COLUMNS:
+                col = getattr(self, name)
+                col[row] = col[last]
+            moved = self.owners[last]
+            self.owners[row] = moved
+            moved.slot = row
+        self.owners.pop()
+        self.count -= 1
+        owner.slot = None
+
+    def clear(self):
+        for owner in self.owners:
+            owner.slot = None
+        self.owners.clear()
+        self.count = 0
+
+    def step(self, player_rect):
+        """
+        One AI tick for every row: face and chase the player, stop inside
+        stop_range (with hysteresis) and run the attack timer, then gravity.
+        The table owns positions: rects of rows that moved are written back
+        (anything else moving an enemy goes through EnemySprite.nudge).
+        Returns (shots, melee hits in range, enemies touching the player);
+        shots are (owner, muzzle x, muzzle y) for archers and the Ogre King.
+        """
+        n = self.count
+        if n == 0:
+            return [], [], []
+        owners = self.owners
+        x, y = self.x[:n], self.y[:n]
+        old_x, old_y = x.copy(), y.copy()
+        w, h = self.w[:n], self.h[:n]
+        px, py = player_rect.center
+
+        # Face and chase (hysteresis while attacking)
+        dist = x + w // 2 - px
+        direction = np.where(dist > 0, -1, 1).astype(np.int8)
+        self.direction[:n] = direction
+        reach = self.stop_range[:n] + np.where(self.is_attacking[:n], ATTACK_HYSTERESIS, 0)
+        moving = np.abs(dist) > reach
+        x[:] = np.where(moving, _round_half_away(x + self.speed[:n] * direction), x)
+
+        # Stop and attack: trigger at half swing, wrap at the full cooldown
+        timer = np.where(moving, 0, self.attack_timer[:n] + 1)
+        cooldown = self.attack_cooldown_max[:n]
+        trigger = ~moving & (timer == cooldown // 2)
+        timer[~moving & (timer >= cooldown)] = 0
+        self.attack_timer[:n] = timer
+        self.is_attacking[:n] = ~moving
+        type_id = self.type_id[:n]
+        did_attack = trigger & (type_id != TYPE_ARCHER)
+        self.did_attack[:n] = did_attack
+
+        # Archers and the Ogre King shoot from their pre-gravity centre
+        shooting = np.flatnonzero(trigger & ((type_id == TYPE_ARCHER) | (type_id == TYPE_KING)))
+        shots = [(owners[i], int(x[i] + w[i] // 2), int(y[i] + h[i] // 2)) for i in shooting]
+
+        # Gravity and ground clamp
+        vel_y = self.vel_y[:n]
+        vel_y += GRAVITY
+        y[:] = _round_half_away(y + vel_y)
+        grounded = y + h > GROUND_Y
+        y[grounded] = GROUND_Y - h[grounded]
+        vel_y[grounded] = 0
+
+        moved = np.flatnonzero((x != old_x) | (y != old_y))
+        for i, left, top in zip(moved.tolist(), x[moved].astype(np.int64).tolist(), y[moved].astype(np.int64).tolist()):
+            owners[i].rect.topleft = (left, top)
+
+        # Melee swings that land, and bodies touching the player (AABB overlap)
+        cx, cy = x + w // 2, y + h // 2
+        in_range = np.hypot(cx - px, cy - py) < MELEE_RANGE
+        melee = np.flatnonzero(did_attack & (self.damage[:n] > 0) & in_range)
+        touching = np.flatnonzero((x < player_rect.right) & (x + w > player_rect.left) &
+                                  (y < player_rect.bottom) & (y + h > player_rect.top))
+        return shots, [owners[i] for i in melee], [owners[i] for i in touching]
+
+# Shared table for every regular enemy (Enemy sprites register themselves)
+enemy_table = EnemyTable()
@@ -1,9 +1,113 @@
 
 import pygame
-import random
 import math
+import itertools
 from src.config import *
 from src.assets import *
+from src.particles import particles, TRAIL_STYLES
+from src.rng import gameplay_rng, vfx_rng
+from src.enemy_table import enemy_table, ENEMY_TYPE_IDS
+from src.pool import Pool
+
+# --- RENDER INTERPOLATION ---
+# The simulation steps at a fixed rate; sprites remember where they were at
+# the start of the tick so a render between ticks can draw them part way.
+
+def snapshot_positions(*groups):
+    """Records each sprite's rect centre before a sim tick moves it."""
+    for group in groups:
+        for sprite in group:
+            sprite.prev_center = sprite.rect.center
+
+def render_offset(sprite, alpha):
+    """(dx, dy) from the sprite's rect to its position alpha of the way through the tick."""
+    prev = getattr(sprite, "prev_center", None)
+    if prev is None:
+        return 0, 0
+    cx, cy = sprite.rect.center
+    return round((prev[0] - cx) * (1.0 - alpha)), round((prev[1] - cy) * (1.0 - alpha))
+
+# --- LIGHTWEIGHT ENTITIES ---
+# Enemies and projectiles are drawn from shared frame caches, so they carry
+# only a pygame.Rect and fixed __slots__ attributes (no Surface, no
+# per-instance dict). EntityGroup stands in for pygame.sprite.Group.
+# Constructor arguments go to reset(), which a Pool also calls when it hands
+# out a recycled instance (see src.pool).
+
+class Entity:
+    """Rect-only game object; kill() flags it and groups drop it lazily."""
+    __slots__ = ("rect", "prev_center", "_alive")
+    pool = None # Pool that recycles this class, if any
+
+    def __init__(self, *args, **kwargs):
+        self.reset(*args, **kwargs)
+
+    def _reset_entity(self, w, h):
+        """Revives the entity with a w x h rect at (0, 0), reusing a recycled Rect."""
+        try:
+            self.rect.update(0, 0, w, h)
+        except AttributeError: # Fresh instance
+            self.rect = pygame.Rect(0, 0, w, h)
+        self.prev_center = None
+        self._alive = True
+
+    def alive(self):
+        return self._alive
+
+    def kill(self):
+        self._alive = False
+
+class EntityGroup:
+    """
+    List-backed container for Entity objects with the pygame Group calls the
+    game uses (add, update, empty, len, iteration). Iterating walks a
+    snapshot, so entities may be added or killed mid-loop. Entities leaving
+    the group go back to their pool.
+    """
+    __slots__ = ("entities",)
+
+    def __init__(self):
+        self.entities = []
+
+    def add(self, *entities):
+        for e in entities:
+            if isinstance(e, (list, tuple)):
+                self.entities.extend(e)
+            else:
+                self.entities.append(e)
+
+    def _live(self):
+        ents = self.entities
+        if not all(e._alive for e in ents):
+            live = []
+            for e in ents:
+                if e._alive:
+                    live.append(e)
+                elif e.pool is not None:
+                    e.pool.release(e)
+            ents = self.entities = live
+        return ents
+
+    def __iter__(self):
+        return iter(self._live().copy())
+
+    def __len__(self):
+        return len(self._live())
+
+    def __bool__(self):
+        return bool(self._live())
+
+    def update(self, *args):
+        for e in self:
+            e.update(*args)
+
+    def empty(self):
+        for e in self.entities:
+            if e._alive:
+                e.kill()
+            if e.pool is not None:
+                e.pool.release(e)
+        self.entities = []
 
 class Wizard(pygame.sprite.Sprite):
     def __init__(self, x, y):
@@ -100,9 +204,10 @@ class Wizard(pygame.sprite.Sprite):
             if self.cast_cooldown < 10: # Reset animation state quickly
                 self.is_casting = False
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         color = WAND_COLORS[min(self.wand_level, len(WAND_COLORS)-1)]
-        draw_wizard(surface, self.rect.centerx, self.rect.bottom, self.facing_right, self.is_casting, color)
+        dx, dy = render_offset(self, alpha)
+        draw_wizard(surface, self.rect.centerx + dx, self.rect.bottom + dy, self.facing_right, self.is_casting, color)
 
     def select_weapon(self, slot_index):
         # 1-based index (1, 2, 3...) passed from input
@@ -161,7 +266,7 @@ class Wizard(pygame.sprite.Sprite):
             
             # Common Projectile Velocity function
             def create_proj(speed, angle, p_type, col):
-                p = Projectile(start_x, start_y_base, 1 if math.cos(angle)>0 else -1, col, p_type)
+                p = projectile_pool.acquire(start_x, start_y_base, 1 if math.cos(angle)>0 else -1, col, p_type)
                 p.vel_x = math.cos(angle) * speed
                 p.vel_y = math.sin(angle) * speed
                 return p
@@ -175,12 +280,11 @@ class Wizard(pygame.sprite.Sprite):
                 p.scale = scale_factor
                 p.piercing = self.piercing
                 projectiles.append(p)
-                projectiles.append(p)
 
             elif self.current_weapon == "ARCANE_VOLLEY":
                 # Fires spread of orb-like projectiles (Purple/Cyan mix)
                 for i in range(5):
-                    angle_offset = random.uniform(-0.4, 0.4) 
+                    angle_offset = gameplay_rng.uniform(-0.4, 0.4) 
                     final_angle = aim_angle + angle_offset
                     
                     p = create_proj(PROJECTILE_SPEED, final_angle, "ARCANE_VOLLEY", (200, 100, 255))
@@ -209,43 +313,32 @@ class Wizard(pygame.sprite.Sprite):
             return projectiles
         return []
 
-class EnemyProjectile(pygame.sprite.Sprite):
-    def __init__(self, x, y, target_x, target_y, is_boss=False, p_type="DEFAULT"):
-        super().__init__()
+class EnemyProjectile(Entity):
+    __slots__ = ("p_type", "speed", "damage", "angle", "exact_x", "exact_y", "vel_x", "vel_y", "life")
+
+    def reset(self, x, y, target_x, target_y, is_boss=False, p_type="DEFAULT"):
         self.p_type = p_type
+        self.angle = 0.0
+        
+        dx = target_x - x
+        dy = target_y - y
+        dist = math.hypot(dx, dy)
+        if dist == 0: dist = 1
         
         if p_type == "ARROW":
-             size = 20 # Longer logic?
-             self.image = pygame.Surface((30, 5), pygame.SRCALPHA)
-             self.image.fill((200, 200, 200)) # Grey Arrow Shaft
-             # Add tip
-             pygame.draw.circle(self.image, (150, 150, 150), (30, 2), 4)
+             # Arrow art is horizontal pointing right; atan2 with -dy because
+             # positive y is down. The hitbox is the rotated shaft's bounds.
+             self.angle = math.degrees(math.atan2(-dy, dx))
+             size = rotated_size(*ARROW_SIZE, self.angle)
              self.speed = 15
              self.damage = 30 # User requested 30 damage
         else:
-             size = 20 if is_boss else 10
-             self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-             col = (255, 0, 0) if not is_boss else (100, 0, 100) # Red or Purple
-             pygame.draw.circle(self.image, col, (size//2, size//2), size//2)
+             size = (20, 20) if is_boss else (10, 10)
              self.speed = 12 if is_boss else 10 # Faster arrows (was 8)
              self.damage = 25 if is_boss else 15
         
-        self.rect = self.image.get_rect()
+        self._reset_entity(*size)
         self.rect.center = (x, y)
-        
-        dx = target_x - x
-        dy = target_y - y
-        dist = math.hypot(dx, dy)
-        if dist == 0: dist = 1
-        
-        # Rotation for Arrow
-        if p_type == "ARROW":
-             # Original image is horizontal pointing right? Yes 30x5.
-             # atan2(dy, dx) gives angle in radians. positive y is Down in Pygame.
-             # degrees(-angle)
-             angle = math.degrees(math.atan2(-dy, dx))
-             self.image = pygame.transform.rotate(self.image, angle)
-             self.rect = self.image.get_rect(center=(x, y))
              
         self.vel_x = (dx / dist) * self.speed
         self.vel_y = (dy / dist) * self.speed
@@ -277,159 +370,113 @@ class EnemyProjectile(pygame.sprite.Sprite):
         if self.rect.right < -50 or self.rect.left > SCREEN_WIDTH + 50 or self.rect.bottom < -50 or self.rect.top > SCREEN_HEIGHT + 50:
             self.kill()
 
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self, x, y, enemy_type="OGRE"):
-        super().__init__()
-        self.enemy_type = enemy_type
-        
-        # Stats based on type
-        if self.enemy_type == "GOBLIN":
-            size = 50
-            self.speed = OGRE_SPEED * 1.5
-            self.health = OGRE_HEALTH_BASE * 0.5
-        elif self.enemy_type == "TROLL":
-            size = 90
-            self.speed = OGRE_SPEED * 0.6
-            self.health = OGRE_HEALTH_BASE * 2.0
-        elif self.enemy_type == "SKELETON_ARCHER":
-            size = 45
-            self.speed = OGRE_SPEED * 0.9
-            self.health = OGRE_HEALTH_BASE * 0.4
-        elif self.enemy_type == "OGRE_KING": # BOSS
-            size = 180 # Massive
-            self.speed = OGRE_SPEED * 0.5
-            self.health = OGRE_HEALTH_BASE * 15.0 # Tanky
-        else: # OGRE
-            size = OGRE_SIZE
-            self.speed = OGRE_SPEED
-            self.health = OGRE_HEALTH_BASE
-
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        self.rect = self.image.get_rect()
-        self.rect.midbottom = (x, y)
-        self.vel_y = 0
-        self.direction = -1 
-        self.is_attacking = False
-        self.did_attack = False
-        self.attack_timer = 0
-        
-        # Attack Logic & Cooldowns
-        if self.enemy_type == "SKELETON_ARCHER":
-            self.stop_range = 500 # Ranged
-            self.damage = 20 # NO MELEE DAMAGE
-            self.attack_cooldown_max = 100 # Faster fire rate 
-        elif self.enemy_type == "OGRE_KING":
-            self.stop_range = 100
-            self.damage = 50
-            self.attack_cooldown_max = 200 
-        elif self.enemy_type == "GOBLIN":
-            self.stop_range = 80 
-            self.damage = 20
-            self.attack_cooldown_max = 120
-        elif self.enemy_type == "TROLL":
-            self.stop_range = 120
-            self.damage = 45
-            self.attack_cooldown_max = 240
-        else: # OGRE
-            self.stop_range = 100
-            self.damage = 30
-            self.attack_cooldown_max = 180
-        
-    def update(self, player_rect):
-        self.did_attack = False
-        new_projectile = None
-        
-        player_x = player_rect.centerx
-        player_y = player_rect.centery
-        
-        # Tracking AI
-        dist = self.rect.centerx - player_x
-        abs_dist = abs(dist)
-        
-        # Face player
-        if dist > 0:
-            self.direction = -1
-        else:
-            self.direction = 1
-            
-            
-        # Move only if outside stop range (with Hysteresis)
-        # If already attacking, allow player to be slightly further before moving again.
-        tolerance = 100 if self.is_attacking else 0
-        
-        if abs_dist > self.stop_range + tolerance:
-            self.rect.x += self.speed * self.direction
-            self.is_attacking = False
-            self.attack_timer = 0 
-        else:
-            # Stop and Attack
-            self.is_attacking = True
-            
-            # Attack Timer
-            self.attack_timer += 1
-            
-            # Trigger damage/shoot at HALF swing
-            # (Attack happens faster now, so /2 of 100 = 50 frames ~ 0.8s)
-            if self.attack_timer == self.attack_cooldown_max // 2:
-                if self.enemy_type == "SKELETON_ARCHER":
-                    # Fire Arrow
-                    new_projectile = EnemyProjectile(self.rect.centerx, self.rect.centery, player_x, player_y, is_boss=False, p_type="ARROW")
-                elif self.enemy_type == "OGRE_KING": 
-                    # Boss Smash & Projectile
-                    self.did_attack = True # Melee smash
-                    # Also spawn a ring or shockwave? Or just melee for now?
-                    # Let's say he throws a rock AND smashes
-                    new_projectile = EnemyProjectile(self.rect.centerx, self.rect.centery, player_x, player_y, is_boss=True)
-                else:
-                    # Melee
-                    self.did_attack = True
-                
-            if self.attack_timer >= self.attack_cooldown_max:
-                self.attack_timer = 0 # Reset
-                
-        # Gravity
-        self.vel_y += GRAVITY
-        self.rect.y += self.vel_y
-        
-        if self.rect.bottom > SCREEN_HEIGHT - 50:
-            self.rect.bottom = SCREEN_HEIGHT - 50
-            self.vel_y = 0
-            
-        return new_projectile
+# Per-type stats: (size, speed x OGRE_SPEED, health x OGRE_HEALTH_BASE,
+#                  stop range, damage, attack cooldown)
+ENEMY_STATS = {
+    "OGRE": (OGRE_SIZE, 1.0, 1.0, 100, 30, 180),
+    "GOBLIN": (50, 1.5, 0.5, 80, 20, 120),
+    "TROLL": (90, 0.6, 2.0, 120, 45, 240),
+    "SKELETON_ARCHER": (45, 0.9, 0.4, 500, 20, 100), # Ranged: damages via arrows only
+    "OGRE_KING": (180, 0.5, 15.0, 100, 50, 200), # BOSS: massive and tanky
+}
+
+def _row_property(name):
+    """Attribute backed by this enemy's row in enemy_table."""
+    def get(self):
+        return getattr(enemy_table, name)[self.slot].item()
+    def set(self, value):
+        getattr(enemy_table, name)[self.slot] = value
+    return property(get, set)
+
+_enemy_serials = itertools.count(1)
 
-    def draw(self, surface):
+class EnemySprite(Entity):
+    """
+    Shared drawing for every enemy; slot is the enemy_table row (None if not
+    in the table). serial is unique per spawn, so it still tells enemies
+    apart after the object has been recycled.
+    """
+    __slots__ = ("enemy_type", "slot", "serial")
+
+    def nudge(self, dx):
+        """Moves the enemy sideways from outside its AI (knockback)."""
+        self.rect.x += dx
+        if self.slot is not None:
+            enemy_table.x[self.slot] = self.rect.x
+
+    def draw(self, surface, alpha=1.0):
         t = pygame.time.get_ticks()
+        dx, dy = render_offset(self, alpha)
         # Calculate Phase (0.0 to 1.0)
         phase = 0.0
         if self.is_attacking and self.attack_cooldown_max > 0:
             phase = self.attack_timer / self.attack_cooldown_max
             
-        if self.enemy_type == "GOBLIN":
-            draw_goblin(surface, self.rect.centerx, self.rect.bottom, self.direction > 0, tick=t, is_attacking=self.is_attacking, attack_phase=phase)
-        elif self.enemy_type == "TROLL":
-             draw_troll(surface, self.rect.centerx, self.rect.bottom, self.direction > 0, tick=t, is_attacking=self.is_attacking, attack_phase=phase)
-        elif self.enemy_type == "SKELETON_ARCHER":
-             draw_skeleton(surface, self.rect.centerx, self.rect.bottom, self.direction > 0, scale=1.0, tick=t, is_attacking=self.is_attacking, attack_phase=phase)
-        elif self.enemy_type == "OGRE_KING":
-             draw_ogre(surface, self.rect.centerx, self.rect.bottom, self.direction > 0, scale=2.5, tick=t, is_attacking=self.is_attacking, attack_phase=phase)
-
-        elif self.enemy_type == "DRAGON_BOSS":
-             draw_dragon_boss(surface, self.rect.centerx, self.rect.centery, self.direction > 0, scale=1.0, tick=t, is_attacking=self.is_attacking, attack_phase=phase)
-        else:
-            draw_ogre(surface, self.rect.centerx, self.rect.bottom, self.direction > 0, tick=t, is_attacking=self.is_attacking, attack_phase=phase)
+        if self.enemy_type == "DRAGON_BOSS":
+             draw_dragon_boss(surface, self.rect.centerx + dx, self.rect.centery + dy, self.direction > 0, scale=1.0, tick=t, is_attacking=self.is_attacking, attack_phase=phase)
+             return
 
-class DragonBoss(Enemy):
-    def __init__(self, x, y):
-        super().__init__(x, y, "DRAGON_BOSS")
-        # Override stats
+        # Regular enemies: one blit from the pre-baked frame atlas
+        etype = self.enemy_type if self.enemy_type in ENEMY_DRAW_SCALES else "OGRE"
+        frame, (ox, oy) = get_enemy_frame(etype, self.direction > 0, self.is_attacking, t, phase)
+        surface.blit(frame, (self.rect.centerx + dx + ox, self.rect.bottom + dy + oy))
+
+class Enemy(EnemySprite):
+    """Regular enemy: a sprite whose AI state lives in enemy_table (stepped in bulk)."""
+    health = _row_property("health")
+    damage = _row_property("damage")
+    speed = _row_property("speed")
+    stop_range = _row_property("stop_range")
+    vel_y = _row_property("vel_y")
+    direction = _row_property("direction")
+    is_attacking = _row_property("is_attacking")
+    did_attack = _row_property("did_attack")
+    attack_timer = _row_property("attack_timer")
+    attack_cooldown_max = _row_property("attack_cooldown_max")
+
+    __slots__ = ()
+
+    def reset(self, x, y, enemy_type="OGRE"):
+        self.enemy_type = enemy_type
+        self.serial = next(_enemy_serials)
+        size, speed, health, stop_range, damage, cooldown = ENEMY_STATS.get(enemy_type, ENEMY_STATS["OGRE"])
+
+        self._reset_entity(size, size)
+        self.rect.midbottom = (x, y)
+        enemy_table.add(self, x=self.rect.x, y=self.rect.y, w=size, h=size,
+                        speed=OGRE_SPEED * speed, health=OGRE_HEALTH_BASE * health,
+                        stop_range=stop_range, damage=damage, attack_cooldown_max=cooldown,
+                        type_id=ENEMY_TYPE_IDS.get(enemy_type, 0), direction=-1)
+
+    def kill(self):
+        super().kill()
+        if self.slot is not None:
+            enemy_table.remove(self)
+
+class DragonBoss(EnemySprite):
+    __slots__ = ("vel_y", "direction", "is_attacking", "did_attack", "attack_timer", "damage",
+                 "health", "max_health", "speed", "size", "target_y", "hover_offset",
+                 "attack_cooldown_max", "stop_range", "state", "state_timer", "ground_y", "current_attack")
+
+    def reset(self, x, y):
+        self.enemy_type = "DRAGON_BOSS"
+        self.serial = next(_enemy_serials)
+        self.slot = None # Not in enemy_table: runs its own state machine
+        self.vel_y = 0
+        self.direction = -1
+        self.is_attacking = False
+        self.did_attack = False
+        self.attack_timer = 0
+        self.damage = 30 # Melee when a triple shot lands up close
+        
+        # Stats
         self.health = DRAGON_BOSS_HEALTH 
         self.max_health = DRAGON_BOSS_HEALTH
         self.speed = DRAGON_BOSS_SPEED
         self.size = DRAGON_BOSS_SIZE
         
         # Hitbox setup
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        self.rect = self.image.get_rect()
+        self._reset_entity(self.size, self.size)
         self.rect.center = (x, y)
         
         # Flight logic
@@ -442,6 +489,7 @@ class DragonBoss(Enemy):
         self.state = "FLYING"
         self.state_timer = 0
         self.ground_y = 750 # Lower to touch ground (Screen 900, size 300, half is 150 -> bottom 900)
+        self.current_attack = None # Picked at the start of each attack cycle
         
     def update(self, player_rect):
         self.did_attack = False
@@ -518,20 +566,19 @@ class DragonBoss(Enemy):
             # 2. Fire Breath (Stream down to ground) - NEW
             
             if self.attack_timer == 1: # Decide attack at start of cycle
-                 self.current_attack = "TRIPLE" if random.random() > 0.4 else "BREATH"
+                 self.current_attack = "TRIPLE" if gameplay_rng.random() > 0.4 else "BREATH"
             
             if self.current_attack == "TRIPLE":
                 if self.attack_timer == self.attack_cooldown_max // 2:
                     self.did_attack = True
                     # Center shot
-                    p1 = EnemyProjectile(self.rect.centerx, self.rect.centery + 50, player_x, player_y, is_boss=True)
-                    p1.image.fill((255, 100, 0)) 
+                    p1 = enemy_projectile_pool.acquire(self.rect.centerx, self.rect.centery + 50, player_x, player_y, is_boss=True)
                     new_projectile_list.append(p1)
                     # Angled Up
-                    p2 = EnemyProjectile(self.rect.centerx, self.rect.centery + 50, player_x, player_y - 150, is_boss=True)
+                    p2 = enemy_projectile_pool.acquire(self.rect.centerx, self.rect.centery + 50, player_x, player_y - 150, is_boss=True)
                     new_projectile_list.append(p2)
                     # Angled Down
-                    p3 = EnemyProjectile(self.rect.centerx, self.rect.centery + 50, player_x, player_y + 150, is_boss=True)
+                    p3 = enemy_projectile_pool.acquire(self.rect.centerx, self.rect.centery + 50, player_x, player_y + 150, is_boss=True)
                     new_projectile_list.append(p3)
             
             elif self.current_attack == "BREATH":
@@ -540,13 +587,11 @@ class DragonBoss(Enemy):
                     if self.attack_timer % 3 == 0:
                         # Target ground below player (or just player)
                         # Spread slightly
-                        tx = player_x + random.randint(-50, 50)
-                        ty = player_y + random.randint(-20, 20)
+                        tx = player_x + gameplay_rng.randint(-50, 50)
+                        ty = player_y + gameplay_rng.randint(-20, 20)
                         
-                        p = EnemyProjectile(self.rect.centerx, self.rect.centery + 40, tx, ty, is_boss=True)
-                        p.image.fill((255, 50, 0)) # Redder
+                        p = enemy_projectile_pool.acquire(self.rect.centerx, self.rect.centery + 40, tx, ty, is_boss=True)
                         p.speed = 15 # Fast breath
-                        p.size = 15
                         # Recalculate vel for new speed
                         dx = tx - p.rect.centerx
                         dy = ty - p.rect.centery
@@ -566,31 +611,34 @@ class DragonBoss(Enemy):
         
         return new_projectile_list
 
-class Projectile(pygame.sprite.Sprite):
-    def __init__(self, x, y, facing_right, color=WHITE, type="DEFAULT"):
-        super().__init__()
+class Projectile(Entity):
+    __slots__ = ("color", "type", "damage", "piercing", "hit_list", "scale", "is_seeker", "target",
+                 "vel_x", "vel_y", "life", "trail_style")
+
+    def reset(self, x, y, facing_right, color=WHITE, type="DEFAULT"):
         self.color = color
         self.type = type
         self.damage = BASE_WAND_DAMAGE
         self.piercing = 0
-        self.hit_list = [] 
+        try:
+            self.hit_list.clear() # Serials of enemies already hit (piercing)
+        except AttributeError: # Fresh instance
+            self.hit_list = set()
         self.scale = 1.0 # Default scale
         
         self.is_seeker = False
         self.target = None
         
         # Fireball sizing
-        self.image = pygame.Surface((PROJECTILE_RADIUS*3, PROJECTILE_RADIUS*3), pygame.SRCALPHA)
-        self.rect = self.image.get_rect()
+        self._reset_entity(PROJECTILE_RADIUS*3, PROJECTILE_RADIUS*3)
         self.rect.center = (x, y)
         self.vel_x = PROJECTILE_SPEED if facing_right else -PROJECTILE_SPEED
         self.vel_y = 0 
         
         self.life = 100
         
-        # Particle System for Trail
-        # Each particle: [x, y, vx, vy, life, max_life, size, color_type]
-        self.particles = []
+        # Trail particles live in the shared engine (src.particles)
+        self.trail_style = TRAIL_STYLES.get(type, 0)
         
     def update_rect(self):
         # Update rect size based on scale if not already done
@@ -600,34 +648,26 @@ class Projectile(pygame.sprite.Sprite):
         
         # Base Size * Scale
         size = int(PROJECTILE_RADIUS * 3 * self.scale)
-        if self.image.get_width() != size:
-            self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-            self.rect = self.image.get_rect()
+        if self.rect.width != size:
+            self.rect.size = (size, size)
             self.rect.center = c
             
-    def update(self, enemies_group=None):
+    def update(self, enemy_index=None):
         # Ensure rect matches scale (lazy update or just check)
         expected_size = int(PROJECTILE_RADIUS * 3 * self.scale)
         if self.rect.width != expected_size:
             c = self.rect.center
-            self.image = pygame.Surface((expected_size, expected_size), pygame.SRCALPHA)
-            self.rect = self.image.get_rect()
+            self.rect.size = (expected_size, expected_size)
             self.rect.center = c
             
         # Seeker Logic
         if self.is_seeker:
              # Find closest enemy if no target or target dead
-             if (not self.target or not self.target.alive()) and enemies_group:
+             if (not self.target or not self.target.alive()) and enemy_index:
                  # Find closest
-                 closest = None
-                 min_dist = 9999
-                 for e in enemies_group:
-                     d = math.hypot(e.rect.centerx - self.rect.centerx, e.rect.centery - self.rect.centery)
-                     if d < min_dist:
-                         min_dist = d
-                         closest = e
+                 closest = enemy_index.nearest(self.rect.center)
                  if closest:
-                     self.target = closest
+                     self.target = closest[0]
              
              if self.target and self.target.alive():
                  # Steer towards target
@@ -662,40 +702,36 @@ class Projectile(pygame.sprite.Sprite):
         # --- Spawn Trail Particles ---
         # Spawn more particles if bigger
         count = 3 + int(self.scale * 2)
+        rng = particles.rng
         
-        for _ in range(count):
-            # Random offset from center (scaled)
-            spread = 5 * self.scale
-            off_x = random.uniform(-spread, spread)
-            off_y = random.uniform(-spread, spread)
-            
-            px = self.rect.centerx + off_x
-            py = self.rect.centery + off_y
-            
+        # Random offset from center (scaled)
+        spread = 5 * self.scale
+        particles.emit(
+            self.rect.centerx + rng.uniform(-spread, spread, count),
+            self.rect.centery + rng.uniform(-spread, spread, count),
             # Velocity
-            vx = -self.vel_x * 0.3 + random.uniform(-1, 1)
-            vy = -self.vel_y * 0.3 + random.uniform(-1, 1)  # Added vy reaction
-            
-            life = random.randint(15, 30)
-            size = random.randint(4, 10) * self.scale # Scale particles too
-            
-            # Store particle
-            self.particles.append([px, py, vx, vy, life, life, size])
-
-        # --- Update Particles ---
-        for p in self.particles:
-            p[0] += p[2] # x move
-            p[1] += p[3] # y move
-            p[4] -= 1    # life drain
-            p[6] *= 0.95 # shrink
-            
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p[4] > 0 and p[6] > 1] 
+            vx=-self.vel_x * 0.3 + rng.uniform(-1, 1, count),
+            vy=-self.vel_y * 0.3 + rng.uniform(-1, 1, count),
+            life=rng.integers(15, 31, count),
+            size=rng.integers(4, 11, count) * self.scale, # Scale particles too
+            kind=KIND_TRAIL, style=self.trail_style)
 
-        return self.life > 0
+        # Age out, or cull once well off screen
+        if self.life <= 0 or self.rect.left > SCREEN_WIDTH + 200 or self.rect.right < -200 or self.rect.bottom < -200 or self.rect.top > SCREEN_HEIGHT + 200:
+            self.kill()
+        return self._alive
+
+    def draw(self, surface, alpha=1.0):
+        dx, dy = render_offset(self, alpha)
+        draw_projectile(surface, self.rect.centerx + dx, self.rect.centery + dy, self.color, self.scale, self.type)
 
-    def draw(self, surface):
-        draw_projectile(surface, self.rect.centerx, self.rect.centery, self.color, self.particles, self.scale, self.type)
+# --- POOLS ---
+projectile_pool = Projectile.pool = Pool("projectiles", Projectile)
+enemy_projectile_pool = EnemyProjectile.pool = Pool("enemy_projectiles", EnemyProjectile)
+enemy_pool = Enemy.pool = Pool("enemies", Enemy)
+projectile_pool.reserve(PROJECTILE_POOL_RESERVE)
+enemy_projectile_pool.reserve(ENEMY_PROJECTILE_POOL_RESERVE)
+enemy_pool.reserve(ENEMY_POOL_RESERVE)
 
 class Particle(pygame.sprite.Sprite):
     def __init__(self, x, y, color):
@@ -703,11 +739,11 @@ class Particle(pygame.sprite.Sprite):
         self.x = x
         self.y = y
         self.color = color
-        self.vel_x = random.uniform(-2, 2)
-        self.vel_y = random.uniform(-2, 2)
+        self.vel_x = vfx_rng.uniform(-2, 2)
+        self.vel_y = vfx_rng.uniform(-2, 2)
         self.life = 30
         self.max_life = 30
-        self.size = random.randint(2, 5)
+        self.size = vfx_rng.randint(2, 5)
 
     def update(self):
         self.x += self.vel_x
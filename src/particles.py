@@ -0,0 +1,190 @@
+import numpy as np
+from src.config import PARTICLE_GLOBAL_CAP, PARTICLE_QUOTAS, PARTICLE_PRIORITIES, PARTICLE_MAX_MERGE
+
+# --- PARTICLE ENGINE ---
+# All particles live in one struct-of-arrays store: fixed-capacity NumPy
+# columns, integrated and culled with vectorized ops. Emitters append rows;
+# dead rows are filled by swapping live rows in from the tail.
+
+# Particle kinds (how a row moves and how it is drawn)
+KIND_SPARK = 0 # Hit / kill feedback: jitters in place, fades with life
+KIND_TRAIL = 1 # Projectile trails: drifts with velocity, shrinks, palette by age
+
+# Budget categories (quotas and priorities live in config)
+CATEGORIES = ("TRAIL", "HIT", "DEATH", "AMBIENT")
+CAT_TRAIL, CAT_HIT, CAT_DEATH, CAT_AMBIENT = range(len(CATEGORIES))
+
+# Trail palette per projectile type (see TRAIL_PALETTES in assets)
+TRAIL_STYLES = {"DEFAULT": 0, "FIRE_RING": 1, "VOID_LANCE": 2, "ARCANE_VOLLEY": 3}
+
+PARTICLE_CAPACITY = 32768
+TRAIL_SHRINK = 0.95
+
+class ParticleBudget:
+    """
+    Per-category quotas plus a global cap on live particles.
+    An emission that does not fit is merged into fewer, larger particles,
+    or dropped if there is no room at all; when only the global cap binds,
+    live particles of lower-priority categories are shed to make room.
+    Counters cover the current sim tick; last_tick holds the previous one.
+    """
+    def __init__(self, global_cap=PARTICLE_GLOBAL_CAP, quotas=PARTICLE_QUOTAS, priorities=PARTICLE_PRIORITIES):
+        self.global_cap = global_cap
+        self.quotas = np.array([quotas[c] for c in CATEGORIES])
+        self.priorities = np.array([priorities[c] for c in CATEGORIES])
+        self.stats = self._empty_stats()
+        self.last_tick = self._empty_stats()
+
+    def _empty_stats(self):
+        return {c: {"emitted": 0, "merged": 0, "dropped": 0, "shed": 0} for c in CATEGORIES}
+
+    def begin_tick(self):
+        self.last_tick = self.stats
+        self.stats = self._empty_stats()
+
+    def drops_last_tick(self):
+        """Particles merged away, dropped or shed during the previous sim tick."""
+        return sum(s["merged"] + s["dropped"] + s["shed"] for s in self.last_tick.values())
+
+    def admit(self, system, category, n):
+        """Returns how many of n requested rows may be added to system."""
+        room = min(n, self.quotas[category] - system.category_counts[category])
+        over_cap = system.count + room - self.global_cap
+        if over_cap > 0:
+            room -= over_cap - system.shed(over_cap, self.priorities[category], self)
+        room = max(0, int(room))
+
+        stats = self.stats[CATEGORIES[category]]
+        stats["emitted"] += room
+        if room == 0:
+            stats["dropped"] += n
+        else:
+            stats["merged"] += n - room
+        return room
+
+class ParticleSystem:
+    def __init__(self, capacity=PARTICLE_CAPACITY, seed=None, budget=None):
+        self.capacity = capacity
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+        self.budget = budget
+        self.category_counts = np.zeros(len(CATEGORIES), dtype=np.int64)
+
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int16)
+        self.max_life = np.ones(capacity, dtype=np.int16)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.style = np.zeros(capacity, dtype=np.int8)
+        self.category = np.zeros(capacity, dtype=np.int8)
+        self._columns = (self.x, self.y, self.vx, self.vy, self.life, self.max_life,
+                         self.size, self.color, self.kind, self.style, self.category)
+
+    def __len__(self):
+        return self.count
+
+    def seed(self, seed):
+        """Restarts the engine's random stream (jitter and emitter spreads)."""
+        self.rng = np.random.default_rng(seed)
+
+    def clear(self):
+        self.count = 0
+        self.category_counts[:] = 0
+
+    def emit(self, x, y, vx=0.0, vy=0.0, life=15, size=4, color=(255, 255, 255), kind=KIND_SPARK, style=0, category=None):
+        """
+        Appends particles. Every argument may be a scalar or an array; the
+        number of rows is the broadcast length. The budget (if any) decides how
+        many rows are kept; merged rows grow to keep the emission's area.
+        Returns the number of rows added.
+        """
+        if category is None:
+            category = CAT_TRAIL if kind == KIND_TRAIL else CAT_HIT
+        x, y, vx, vy, life, size = np.broadcast_arrays(x, y, vx, vy, life, size)
+        requested = x.size
+        n = requested
+        if self.budget is not None:
+            n = self.budget.admit(self, category, n)
+        n = min(n, self.capacity - self.count)
+        if n <= 0:
+            return 0
+        if n < requested:
+            size = size * min(PARTICLE_MAX_MERGE, (requested / n) ** 0.5)
+
+        s = slice(self.count, self.count + n)
+        self.x[s] = x.ravel()[:n]
+        self.y[s] = y.ravel()[:n]
+        self.vx[s] = vx.ravel()[:n]
+        self.vy[s] = vy.ravel()[:n]
+        self.life[s] = life.ravel()[:n]
+        self.max_life[s] = np.maximum(life.ravel()[:n], 1)
+        self.size[s] = size.ravel()[:n]
+        self.color[s] = color[:3]
+        self.kind[s] = kind
+        self.style[s] = style
+        self.category[s] = category
+        self.category_counts[category] += n
+        self.count += n
+        return n
+
+    def shed(self, need, below_priority, budget):
+        """Kills up to `need` live rows with the least life left in categories below a priority."""
+        n = self.count
+        candidates = np.flatnonzero(budget.priorities[self.category[:n]] < below_priority)
+        if candidates.size == 0 or need <= 0:
+            return 0
+        need = min(need, candidates.size)
+        victims = candidates[np.argpartition(self.life[candidates], need - 1)[:need]]
+        for cat, shed in enumerate(np.bincount(self.category[victims], minlength=len(CATEGORIES))):
+            budget.stats[CATEGORIES[cat]]["shed"] += int(shed)
+        self.life[victims] = 0
+        self._compact(self.life[:n] > 0)
+        return need
+
+    def update(self):
+        """Integrates one sim tick, then culls dead rows."""
+        if self.budget is not None:
+            self.budget.begin_tick()
+        n = self.count
+        if n == 0:
+            return
+
+        kind = self.kind[:n]
+        spark = kind == KIND_SPARK
+        trail = ~spark
+
+        # Sparks jitter in place
+        jitter = self.rng.uniform(-1, 1, (2, n)).astype(np.float32)
+        self.x[:n] += np.where(spark, jitter[0], self.vx[:n])
+        self.y[:n] += np.where(spark, jitter[1], self.vy[:n])
+        self.life[:n] -= 1
+
+        # Trails drift and shrink
+        self.size[:n] *= np.where(trail, np.float32(TRAIL_SHRINK), np.float32(1.0))
+
+        alive = (self.life[:n] > 0) & (spark | (self.size[:n] > 1))
+        self._compact(alive)
+
+    def _compact(self, alive):
+        """Swap-compaction: dead rows in the kept prefix take live rows from the tail."""
+        n = self.count
+        new_n = int(np.count_nonzero(alive))
+        if new_n == n:
+            return
+        holes = np.flatnonzero(~alive[:new_n])
+        movers = np.flatnonzero(alive[new_n:]) + new_n
+        for col in self._columns:
+            col[holes] = col[movers]
+        self.count = new_n
+        self.category_counts = np.bincount(self.category[:new_n], minlength=len(CATEGORIES))
+
+    def view(self, kind):
+        """Returns the live row indices of one kind, in storage order."""
+        return np.flatnonzero(self.kind[:self.count] == kind)
+
+# Shared engine: projectile trails (entities) and hit feedback (main.py)
+particles = ParticleSystem(budget=ParticleBudget())
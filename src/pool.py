@@ -0,0 +1,62 @@
+# --- OBJECT POOLS ---
+# Player shots, enemy shots and regular enemies are recycled instead of being
+# built and thrown away, so dense volleys create no garbage for the GC to
+# chase. An entity is released when its EntityGroup drops it after kill();
+# released entities only become reusable at recycle() (once per sim tick),
+# so nothing still holding a reference from this tick sees it come back as a
+# different enemy or shot.
+
+POOLS = {} # name -> Pool, for stats
+
+class Pool:
+    """Free list for one entity class; acquire() runs the class's reset() hook."""
+    def __init__(self, name, cls):
+        self.name = name
+        self.cls = cls
+        self.free = []
+        self.pending = [] # Released this tick
+        self.created = 0
+        self.in_use = 0
+        self.high_water = 0
+        POOLS[name] = self
+
+    def acquire(self, *args, **kwargs):
+        """A recycled (or new) instance, reset with the constructor's arguments."""
+        if self.free:
+            obj = self.free.pop()
+        else:
+            obj = self.cls.__new__(self.cls)
+            self.created += 1
+        obj.reset(*args, **kwargs)
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        self.pending.append(obj)
+        self.in_use -= 1
+
+    def recycle(self):
+        """Makes everything released since the last call available to acquire()."""
+        if self.pending:
+            self.free.extend(self.pending)
+            self.pending.clear()
+
+    def reserve(self, count):
+        """Pre-builds instances so the first waves allocate nothing either."""
+        for _ in range(count - len(self.free) - self.in_use):
+            self.free.append(self.cls.__new__(self.cls))
+            self.created += 1
+
+    def stats(self):
+        return {"in_use": self.in_use, "free": len(self.free) + len(self.pending),
+                "created": self.created, "high_water": self.high_water}
+
+def recycle_pools():
+    for pool in POOLS.values():
+        pool.recycle()
+
+def pool_stats():
+    """{pool name: stats} for every pool."""
+    return {name: pool.stats() for name, pool in POOLS.items()}
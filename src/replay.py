@@ -0,0 +1,148 @@
+import json
+import struct
+import pygame
+from src.controls import HeldKeys
+
+# --- REPLAY FORMAT ---
+# A replay is everything a run needs besides the code: the run seed, the
+# player profile at the start, and per-tick controls. Little-endian:
+#
+#   header  b"WVOR" | u8 version | u8 mode | u64 seed | u16 n | n bytes profile JSON
+#   TICK    0x01 | u16 held-key mask | i16 aim x | i16 aim y | u8 fire
+#   REPEAT  0x02 | u16 n        (the previous TICK, n more times)
+#   WEAPON  0x03 | u8 slot      (hotkey pressed before the next TICK)
+#   CARD    0x04 | u8 index     (wave-clear card picked)
+#   ABILITY 0x05 | u16 mask     (unlocked abilities changed, e.g. shop purchase)
+#
+# Aim is stored as (0, 0) on ticks that do not shoot, so idle stretches
+# collapse into REPEAT records.
+
+REPLAY_MAGIC = b"WVOR"
+REPLAY_VERSION = 1
+REPLAY_MODES = ("STORY", "INFINITE")
+
+# Every key update_playing reads (bit i of the mask is REPLAY_KEYS[i])
+REPLAY_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_SPACE,
+               pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_t, pygame.K_r)
+
+REC_TICK, REC_REPEAT, REC_WEAPON, REC_CARD, REC_ABILITY = 1, 2, 3, 4, 5
+_HEADER = struct.Struct("<4sBBQH")
+_TICK = struct.Struct("<HhhB")
+
+def ability_mask(abilities):
+    """Bitmask of an UNLOCKED_ABILITIES dict, in its key order."""
+    return sum(1 << i for i, v in enumerate(abilities.values()) if v)
+
+class ReplayRecorder:
+    """Collects one run's input; save() writes the binary stream."""
+    def __init__(self, mode, seed, profile):
+        self.data = bytearray(_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, REPLAY_MODES.index(mode), seed, 0))
+        blob = json.dumps(profile, separators=(",", ":")).encode("utf-8")
+        struct.pack_into("<H", self.data, _HEADER.size - 2, len(blob))
+        self.data += blob
+        self.abilities = None
+        self.last_tick = None
+        self.repeats = 0
+        self.ticks = 0
+
+    def _flush_repeats(self):
+        if self.repeats:
+            self.data += struct.pack("<BH", REC_REPEAT, self.repeats)
+            self.repeats = 0
+
+    def tick(self, controls, abilities):
+        """Records the controls of one PLAYING tick (and ability changes before it)."""
+        mask = ability_mask(abilities)
+        if mask != self.abilities:
+            self._flush_repeats()
+            self.data += struct.pack("<BH", REC_ABILITY, mask)
+            self.abilities = mask
+            self.last_tick = None
+
+        keys = controls["keys"]
+        held = sum(1 << i for i, k in enumerate(REPLAY_KEYS) if keys[k])
+        fire = bool(controls["fire"])
+        aim = controls["aim"] if fire or keys[pygame.K_SPACE] else (0, 0)
+        packed = _TICK.pack(held, int(aim[0]), int(aim[1]), fire)
+
+        if controls["weapons"]:
+            self._flush_repeats()
+            for slot in controls["weapons"]:
+                self.data += struct.pack("<BB", REC_WEAPON, slot)
+            self.last_tick = None
+
+        if packed == self.last_tick and self.repeats < 0xFFFF:
+            self.repeats += 1
+        else:
+            self._flush_repeats()
+            self.data.append(REC_TICK)
+            self.data += packed
+            self.last_tick = packed
+        self.ticks += 1
+
+    def card(self, index):
+        self._flush_repeats()
+        self.data += struct.pack("<BB", REC_CARD, index)
+        self.last_tick = None
+
+    def save(self, path):
+        self._flush_repeats()
+        with open(path, "wb") as f:
+            f.write(self.data)
+
+class ReplayPlayer:
+    """Reads a replay back: next_controls() per PLAYING tick, next_card() per card pick."""
+    def __init__(self, data):
+        magic, version, mode, self.seed, n = _HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError("Not a replay file (or unsupported version)")
+        self.mode = REPLAY_MODES[mode]
+        pos = _HEADER.size
+        self.profile = json.loads(data[pos:pos + n].decode("utf-8"))
+        self.data = data
+        self.pos = pos + n
+        self.abilities = None # Latest ABILITY mask, applied by the caller
+        self.last = None
+        self.repeats = 0
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def next_controls(self):
+        """Controls for the next tick, or None at the end of the recording."""
+        if self.repeats:
+            self.repeats -= 1
+            return self._controls(*self.last, [])
+        weapons = []
+        while self.pos < len(self.data):
+            tag = self.data[self.pos]
+            if tag == REC_TICK:
+                self.last = _TICK.unpack_from(self.data, self.pos + 1)
+                self.pos += 1 + _TICK.size
+                return self._controls(*self.last, weapons)
+            elif tag == REC_REPEAT:
+                self.repeats = struct.unpack_from("<H", self.data, self.pos + 1)[0] - 1
+                self.pos += 3
+                return self._controls(*self.last, weapons)
+            elif tag == REC_WEAPON:
+                weapons.append(self.data[self.pos + 1])
+                self.pos += 2
+            elif tag == REC_ABILITY:
+                self.abilities = struct.unpack_from("<H", self.data, self.pos + 1)[0]
+                self.pos += 3
+            else:
+                return None # A card pick is due (or the stream is corrupt)
+        return None
+
+    def next_card(self):
+        """Index of the next recorded card pick, or None."""
+        if self.repeats or self.pos >= len(self.data) or self.data[self.pos] != REC_CARD:
+            return None
+        self.pos += 2
+        return self.data[self.pos - 1]
+
+    def _controls(self, held, aim_x, aim_y, fire, weapons):
+        codes = [k for i, k in enumerate(REPLAY_KEYS) if held >> i & 1]
+        return {"keys": HeldKeys(codes), "fire": bool(fire), "aim": (aim_x, aim_y), "weapons": weapons}
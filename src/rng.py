@@ -0,0 +1,23 @@
+import random
+
+# --- RANDOM STREAMS ---
+# Each subsystem draws from its own generator, so reseeding or drawing in one
+# can never shift the numbers another one sees:
+#   gameplay_rng - spawns, weapon spread, boss AI, card draws (seeded per run)
+#   vfx_rng      - transient visual jitter (lightning, shakes, flashes)
+#   scenery_rng  - "seed then draw" painters that want the same layout every
+#                  frame (mountains, grass, stars, bubbles); callers reseed it
+# The particle engine keeps its own NumPy generator (src.particles).
+
+gameplay_rng = random.Random()
+vfx_rng = random.Random()
+scenery_rng = random.Random()
+
+def new_run_seed():
+    """Fresh 32-bit seed from OS entropy (never from the streams above)."""
+    return random.SystemRandom().randrange(2 ** 32)
+
+def seed_streams(seed):
+    """Seeds the gameplay and VFX streams from one run seed."""
+    gameplay_rng.seed(seed)
+    vfx_rng.seed(seed ^ 0x5EED5EED)
@@ -0,0 +1,164 @@
+import math
+import pygame
+from src.config import SPATIAL_CELL_SIZE
+
+# --- SPATIAL HASH ---
+# Uniform grid broadphase: each sprite is bucketed into every cell its rect
+# touches, so a query only tests sprites in the cells around it. Grids are
+# rebuilt once per tick (after movement); queries do the exact rect test on
+# the sprite's current rect. Nearest/radius queries measure rect centres and
+# skip sprites that died since the rebuild. sweep() finds what a moving box
+# passes through during a tick (continuous collision for fast shots).
+
+class SpatialHash:
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self._bounds = None # (min cx, min cy, max cx, max cy) of occupied cells
+
+    def _cell_range(self, rect):
+        cs = self.cell_size
+        return (rect.left // cs, rect.top // cs,
+                (rect.right - 1) // cs, (rect.bottom - 1) // cs)
+
+    def clear(self):
+        self.cells.clear()
+        self._bounds = None
+
+    def insert(self, sprite):
+        x0, y0, x1, y1 = self._cell_range(sprite.rect)
+        if self._bounds is None:
+            self._bounds = (x0, y0, x1, y1)
+        else:
+            bx0, by0, bx1, by1 = self._bounds
+            self._bounds = (min(bx0, x0), min(by0, y0), max(bx1, x1), max(by1, y1))
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [sprite]
+                else:
+                    bucket.append(sprite)
+
+    def rebuild(self, sprites):
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def nearest(self, point, k=1, max_dist=None, exclude=()):
+        """
+        Up to k live sprites closest to point (by rect centre), nearest first.
+        Only sprites strictly closer than max_dist are returned.
+        Searches rings of cells outwards and stops once no unseen cell can
+        hold anything closer than the current k-th best.
+        """
+        if not self.cells:
+            return []
+        px, py = point
+        cs = self.cell_size
+        qx, qy = int(px // cs), int(py // cs)
+        bx0, by0, bx1, by1 = self._bounds
+        max_ring = max(qx - bx0, bx1 - qx, qy - by0, by1 - qy)
+        if max_dist is not None:
+            max_ring = min(max_ring, int(max_dist // cs) + 1)
+
+        seen = set(exclude)
+        best = [] # (distance, sprite), sorted
+        for ring in range(max_ring + 1):
+            for cx in range(qx - ring, qx + ring + 1):
+                step = 1 if abs(cx - qx) == ring else 2 * ring
+                for cy in range(qy - ring, qy + ring + 1, max(1, step)):
+                    for sprite in self.cells.get((cx, cy), ()):
+                        if sprite in seen:
+                            continue
+                        seen.add(sprite)
+                        if not sprite.alive():
+                            continue
+                        d = math.hypot(sprite.rect.centerx - px, sprite.rect.centery - py)
+                        if max_dist is not None and d >= max_dist:
+                            continue
+                        best.append((d, sprite))
+            if best:
+                best.sort(key=lambda item: item[0])
+                del best[k:]
+                # Anything not seen yet is at least `ring` cells away
+                if len(best) == k and best[-1][0] <= ring * cs:
+                    break
+        return [sprite for _, sprite in best]
+
+    def within_radius(self, point, radius):
+        """Live sprites whose rect centre is strictly within radius of point."""
+        px, py = point
+        rect = pygame.Rect(int(px - radius), int(py - radius), int(radius * 2) + 2, int(radius * 2) + 2)
+        return [s for s in self.query(rect)
+                if s.alive() and math.hypot(s.rect.centerx - px, s.rect.centery - py) < radius]
+
+    def sweep(self, start, end, half_w=0, half_h=0):
+        """
+        [(t, sprite)] for live sprites hit by a box of half-size (half_w,
+        half_h) whose centre moves from start to end, earliest entry first
+        (t in [0, 1] along the path).
+        """
+        (x0, y0), (x1, y1) = start, end
+        left, top = min(x0, x1) - half_w, min(y0, y1) - half_h
+        area = pygame.Rect(int(left) - 1, int(top) - 1,
+                           int(abs(x1 - x0) + 2 * half_w) + 3, int(abs(y1 - y0) + 2 * half_h) + 3)
+        hits = []
+        for sprite in self.query(area):
+            if sprite.alive():
+                t = swept_entry(start, end, sprite.rect, half_w, half_h)
+                if t is not None:
+                    hits.append((t, sprite))
+        hits.sort(key=lambda hit: hit[0])
+        return hits
+
+    def query(self, rect):
+        """Sprites whose rect overlaps `rect`, each once, in insertion order per cell."""
+        x0, y0, x1, y1 = self._cell_range(rect)
+        found = {}
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for sprite in cells.get((cx, cy), ()):
+                    if sprite not in found and sprite.rect.colliderect(rect):
+                        found[sprite] = None
+        return list(found)
+
+def grid_spritecollide(sprite, grid, dokill=False):
+    """spritecollide() against the live sprites of a grid."""
+    hits = [s for s in grid.query(sprite.rect) if s.alive()]
+    if dokill:
+        for s in hits:
+            s.kill()
+    return hits
+
+def grid_groupcollide(sprites, grid):
+    """groupcollide(sprites, grid_group, False, False): {sprite: [grid sprites hit]}."""
+    hits = {}
+    for sprite in sprites:
+        found = [s for s in grid.query(sprite.rect) if s.alive()]
+        if found:
+            hits[sprite] = found
+    return hits
+
+def swept_entry(start, end, rect, half_w=0, half_h=0):
+    """
+    Segment vs AABB (slab test): the fraction t of the way from start to end
+    at which a box of half-size (half_w, half_h) centred on the moving point
+    first overlaps rect, or None if it never does during the move.
+    """
+    t_in, t_out = 0.0, 1.0
+    for p, d, lo, hi in ((start[0], end[0] - start[0], rect.left - half_w, rect.right + half_w),
+                         (start[1], end[1] - start[1], rect.top - half_h, rect.bottom + half_h)):
+        if d == 0:
+            if p <= lo or p >= hi:
+                return None
+        else:
+            t0, t1 = (lo - p) / d, (hi - p) / d
+            if t0 > t1:
+                t0, t1 = t1, t0
+            t_in, t_out = max(t_in, t0), min(t_out, t1)
+            if t_in >= t_out:
+                return None
+    return t_in